@@ -1,12 +1,41 @@
 from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
-from .models import BlogPost, Category, SubCategory, Education, Experience, Certificate, Project, Tag, CodeExample, About, SiteSettings, ContactInfo, Skill, SkillCategory, ProjectCategory, CodeLanguage, CodeCategory, NavbarLink
+from .loaders import annotate_tag_usage
+from .search import matching_ids, query_terms
+from .models import BlogPost, Category, SubCategory, Education, Experience, Certificate, Project, Tag, CodeExample, About, SiteSettings, ContactInfo, Skill, SkillCategory, ProjectCategory, CodeLanguage, CodeCategory, NavbarLink, ImageJob, ContactMessage, SearchDocument
 
 class BaseAdmin(admin.ModelAdmin):
     list_per_page = 20
     save_on_top = True
     date_hierarchy = 'created_at'
+    # Filtreli listelerde ikinci bir COUNT(*) (tüm tablo) sorgusu atılmaz.
+    show_full_result_count = False
+
+class RelatedAdminListFilter(admin.RelatedFieldListFilter):
+    # Seçenekler ilişkili modelin admin queryset'inden okunur; __str__ başka
+    # bir ilişkiye erişiyorsa (ör. CodeCategory -> language) satır başına
+    # sorgu atılmaz.
+    def field_choices(self, field, request, model_admin):
+        related_admin = model_admin.admin_site._registry.get(field.remote_field.model)
+        if related_admin is None:
+            return super().field_choices(field, request, model_admin)
+        queryset = related_admin.get_queryset(request)
+        ordering = self.field_admin_ordering(field, request, model_admin)
+        if ordering:
+            queryset = queryset.order_by(*ordering)
+        return [(obj.pk, str(obj)) for obj in queryset]
+
+class IndexedSearchMixin:
+    # search_fields üzerinden LIKE taraması yerine arama indeksi kullanılır.
+    # Model için henüz indeks kaydı yoksa (rebuild_search_index çalışmamış)
+    # LIKE taramasına dönülür. İki yolun aynı sütunlarda araması için
+    # search_fields, SEARCH_SOURCES'taki başlık ve içerik alanlarıyla aynı
+    # tutulur (kategori ve etiket adları dahil).
+    def get_search_results(self, request, queryset, search_term):
+        if not query_terms(search_term) or not SearchDocument.objects.filter(kind=self.model._meta.model_name).exists():
+            return super().get_search_results(request, queryset, search_term)
+        return queryset.filter(pk__in=matching_ids(self.model, search_term)), False
 
 @admin.register(About)
 class AboutAdmin(admin.ModelAdmin):
@@ -68,10 +97,10 @@ class ExperienceAdmin(BaseAdmin):
     date_range.short_description = "Tarih Aralığı"
 
 @admin.register(Certificate)
-class CertificateAdmin(BaseAdmin):
+class CertificateAdmin(IndexedSearchMixin, BaseAdmin):
     list_display = ('title', 'issuer', 'date', 'credential_id', 'slug', 'certificate_link')
     list_filter = ('issuer', 'date')
-    search_fields = ('title', 'issuer', 'credential_id')
+    search_fields = ('title', 'issuer', 'description', 'credential_id')
     prepopulated_fields = {'slug': ('title', 'issuer')}
     fieldsets = (
         ('Temel Bilgiler', {
@@ -89,11 +118,13 @@ class CertificateAdmin(BaseAdmin):
     certificate_link.short_description = "Sertifika Linki"
 
 @admin.register(Project)
-class ProjectAdmin(BaseAdmin):
+class ProjectAdmin(IndexedSearchMixin, BaseAdmin):
     list_display = ('title', 'category', 'project_links', 'created_at', 'button_text', 'button_url')
+    list_select_related = ('category',)
     list_filter = ('category', 'created_at', 'tags')
-    search_fields = ('title', 'description')
+    search_fields = ('title', 'description', 'category__name', 'tags__name')
     prepopulated_fields = {'slug': ('title',)}
+    autocomplete_fields = ('category',)
     filter_horizontal = ('tags',)
     fieldsets = (
         ('Temel Bilgiler', {
@@ -113,26 +144,46 @@ class ProjectAdmin(BaseAdmin):
         return format_html(' '.join(links)) if links else "-"
     project_links.short_description = "Proje Linkleri"
 
+class TagUsageFilter(admin.SimpleListFilter):
+    title = "Kullanım"
+    parameter_name = 'kullanim'
+
+    def lookups(self, request, model_admin):
+        return (('0', "Kullanılmayan"), ('1-4', "1-4 kayıt"), ('5+', "5 ve üzeri"))
+
+    def queryset(self, request, queryset):
+        # queryset, TagAdmin.get_queryset ile 'usage' alanını zaten içerir.
+        if self.value() == '0':
+            return queryset.filter(usage=0)
+        if self.value() == '1-4':
+            return queryset.filter(usage__range=(1, 4))
+        if self.value() == '5+':
+            return queryset.filter(usage__gte=5)
+        return queryset
+
 @admin.register(Tag)
 class TagAdmin(BaseAdmin):
     list_display = ('name', 'slug', 'usage_count')
+    list_filter = (TagUsageFilter,)
     search_fields = ('name',)
     prepopulated_fields = {'slug': ('name',)}
 
+    def get_queryset(self, request):
+        return annotate_tag_usage(super().get_queryset(request))
+
     def usage_count(self, obj):
-        count = (
-            obj.education_tags.count() +
-            obj.experience_tags.count() +
-            obj.project_tags.count()
-        )
-        return count
+        return obj.usage
     usage_count.short_description = "Kullanım Sayısı"
+    usage_count.admin_order_field = 'usage'
 
 @admin.register(CodeExample)
-class CodeExampleAdmin(BaseAdmin):
+class CodeExampleAdmin(IndexedSearchMixin, BaseAdmin):
     list_display = ('title', 'language', 'category', 'created_at', 'preview_code')
-    list_filter = ('language', 'category', 'created_at')
-    search_fields = ('title', 'description', 'code')
+    # Kategori adı (__str__) kategorinin dilini de içerir.
+    list_select_related = ('language', 'category__language')
+    list_filter = ('language', ('category', RelatedAdminListFilter), 'created_at')
+    search_fields = ('title', 'description', 'code', 'language__name', 'category__name')
+    autocomplete_fields = ('language', 'category')
     fieldsets = (
         ('Temel Bilgiler', {
             'fields': ('title', 'language', 'category')
@@ -174,27 +225,43 @@ class ContactInfoAdmin(admin.ModelAdmin):
 @admin.register(SkillCategory)
 class SkillCategoryAdmin(admin.ModelAdmin):
     list_display = ("name", "icon")
+    search_fields = ("name",)
 
 @admin.register(Skill)
 class SkillAdmin(admin.ModelAdmin):
     list_display = ("name", "category", "order")
+    list_select_related = ("category",)
     list_filter = ("category",)
     ordering = ("category", "order")
+    autocomplete_fields = ("category",)
+    show_full_result_count = False
 
 @admin.register(ProjectCategory)
 class ProjectCategoryAdmin(admin.ModelAdmin):
     list_display = ("name", "slug")
+    search_fields = ("name",)
     prepopulated_fields = {'slug': ('name',)}
 
 @admin.register(CodeLanguage)
 class CodeLanguageAdmin(admin.ModelAdmin):
     list_display = ("name", "slug", "icon")
+    search_fields = ("name",)
     prepopulated_fields = {'slug': ('name',)}
 
 @admin.register(CodeCategory)
 class CodeCategoryAdmin(admin.ModelAdmin):
-    list_display = ("name", "slug")
+    list_display = ("name", "language", "slug")
+    list_select_related = ("language",)
+    search_fields = ("name", "language__name")
     prepopulated_fields = {'slug': ('name',)}
+    autocomplete_fields = ("language",)
+    # Otomatik tamamlama sonuçları sayfalandığı için sıralama sabit olmalı.
+    ordering = ('language__name', 'name')
+
+    def get_queryset(self, request):
+        # __str__ dili de yazdığı için otomatik tamamlama ve filtre seçenekleri
+        # de dili aynı sorguda alır.
+        return super().get_queryset(request).select_related('language')
 
 @admin.register(NavbarLink)
 class NavbarLinkAdmin(admin.ModelAdmin):
@@ -204,6 +271,29 @@ class NavbarLinkAdmin(admin.ModelAdmin):
     search_fields = ('title', 'section')
     ordering = ('order',)
 
+@admin.register(ImageJob)
+class ImageJobAdmin(admin.ModelAdmin):
+    list_display = ('name', 'model_name', 'status', 'attempts', 'updated_at')
+    list_filter = ('status', 'model_name')
+    search_fields = ('name', 'file_hash')
+    show_full_result_count = False
+    readonly_fields = ('name', 'model_name', 'file_hash', 'status', 'attempts', 'last_error', 'created_at', 'updated_at')
+
+    def has_add_permission(self, request):
+        return False
+
+@admin.register(ContactMessage)
+class ContactMessageAdmin(admin.ModelAdmin):
+    list_display = ('subject', 'name', 'email', 'status', 'attempts', 'created_at')
+    list_filter = ('status',)
+    search_fields = ('name', 'email', 'subject')
+    date_hierarchy = 'created_at'
+    show_full_result_count = False
+    readonly_fields = ('name', 'email', 'subject', 'message', 'ip_address', 'digest', 'status', 'attempts', 'last_error', 'sent_at', 'created_at', 'updated_at')
+
+    def has_add_permission(self, request):
+        return False
+
 # Admin Panel Özelleştirme
 admin.site.site_header = "Murat YURDUGÜL - Yönetim Paneli"
 admin.site.site_title = "Portfolio Yönetimi"
@@ -0,0 +1,264 @@
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F
+from django.http import Http404, HttpResponse, JsonResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control, quote_etag
+
+from .caching import PAGE_CACHE_TIMEOUT, get_model_stamps, mark_cache_status
+from .models import BlogPost, Project, CodeExample, Certificate, Skill, Education, Experience
+from .pagination import keyset_page
+
+API_VERSION = 'v1'
+API_CACHE_KEY = 'blog:api:{}'
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+# Her kaynak için: model, temel filtre, alan adı -> ORM yolu eşlemesi,
+# sorgu parametresi -> ORM filtresi, imleç alanı, detay sayfası ve ETag'in
+# bağlı olduğu modeller. 'tags' m2m olduğu için ayrı bir sorguyla eklenir,
+# 'url' slug'dan üretilir; diğer alanlar doğrudan .values() ile okunur.
+API_RESOURCES = {
+    'projects': {
+        'model': Project,
+        'fields': {'id': 'id', 'title': 'title', 'slug': 'slug', 'description': 'description', 'category': 'category__name', 'category_slug': 'category__slug', 'image': 'image', 'project_url': 'project_url', 'github_url': 'github_url', 'created_at': 'created_at'},
+        'filters': {'category': 'category__slug', 'tag': 'tags__slug'},
+        'cursor': 'created_at',
+        'url': 'blog:project_detail',
+        'depends': ('Project', 'ProjectCategory', 'Tag'),
+    },
+    'code-examples': {
+        'model': CodeExample,
+        'fields': {'id': 'id', 'title': 'title', 'slug': 'slug', 'description': 'description', 'code': 'code', 'language': 'language__name', 'language_slug': 'language__slug', 'category': 'category__name', 'category_slug': 'category__slug', 'created_at': 'created_at'},
+        'filters': {'language': 'language__slug', 'category': 'category__slug'},
+        'cursor': 'created_at',
+        'url': 'blog:codeexample_detail',
+        'depends': ('CodeExample', 'CodeLanguage', 'CodeCategory'),
+    },
+    'certificates': {
+        'model': Certificate,
+        'fields': {'id': 'id', 'title': 'title', 'slug': 'slug', 'issuer': 'issuer', 'date': 'date', 'description': 'description', 'credential_url': 'credential_url', 'credential_id': 'credential_id', 'image': 'image', 'created_at': 'created_at'},
+        'filters': {'issuer': 'issuer'},
+        'cursor': 'created_at',
+        'url': 'blog:certificate_detail',
+        'depends': ('Certificate',),
+    },
+    'skills': {
+        'model': Skill,
+        'fields': {'id': 'id', 'name': 'name', 'slug': 'slug', 'description': 'description', 'image': 'image', 'order': 'order', 'category': 'category__name'},
+        'filters': {'category': 'category__name'},
+        'cursor': 'id',
+        'url': 'blog:skill_detail',
+        'depends': ('Skill', 'SkillCategory'),
+    },
+    'educations': {
+        'model': Education,
+        'fields': {'id': 'id', 'title': 'title', 'school': 'school', 'slug': 'slug', 'start_date': 'start_date', 'end_date': 'end_date', 'is_current': 'is_current', 'gpa': 'gpa', 'description': 'description', 'created_at': 'created_at'},
+        'filters': {'tag': 'tags__slug'},
+        'cursor': 'created_at',
+        'depends': ('Education', 'Tag'),
+    },
+    'experiences': {
+        'model': Experience,
+        'fields': {'id': 'id', 'title': 'title', 'company': 'company', 'slug': 'slug', 'start_date': 'start_date', 'end_date': 'end_date', 'is_current': 'is_current', 'description': 'description', 'created_at': 'created_at'},
+        'filters': {'tag': 'tags__slug'},
+        'cursor': 'created_at',
+        'depends': ('Experience', 'Tag'),
+    },
+    'posts': {
+        'model': BlogPost,
+        'base_filter': {'is_published': True, 'published_at__isnull': False},
+        'fields': {'id': 'id', 'title': 'title', 'slug': 'slug', 'content': 'content', 'image': 'image', 'category': 'category__name', 'category_slug': 'category__slug', 'subcategory': 'subcategory__name', 'subcategory_slug': 'subcategory__slug', 'published_at': 'published_at'},
+        'filters': {'category': 'category__slug', 'subcategory': 'subcategory__slug', 'tag': 'tags__slug'},
+        'cursor': 'published_at',
+        'url': 'blog:blog_detail',
+        'depends': ('BlogPost', 'Category', 'SubCategory', 'Tag'),
+    },
+}
+IMAGE_FIELDS = ('image',)
+
+
+def _error(message, status=400):
+    return JsonResponse({'error': message}, status=status)
+
+
+def available_fields(resource):
+    fields = list(resource['fields'])
+    if any(field.name == 'tags' for field in resource['model']._meta.many_to_many):
+        fields.append('tags')
+    if resource.get('url'):
+        fields.append('url')
+    return fields
+
+
+def selected_fields(request, resource):
+    available = available_fields(resource)
+    requested = request.GET.get('fields')
+    if not requested:
+        return available
+    fields = [name.strip() for name in requested.split(',') if name.strip()]
+    unknown = [name for name in fields if name not in available]
+    if unknown:
+        raise ValueError(f"Bilinmeyen alan: {', '.join(unknown)}")
+    return fields
+
+
+def _attach_tags(model, rows):
+    through = model._meta.get_field('tags').remote_field.through
+    source = f'{model._meta.model_name}_id'
+    tags = {}
+    for object_id, name in through.objects.filter(**{f'{source}__in': [row['pk'] for row in rows]}).values_list(source, 'tag__name').order_by('tag__name'):
+        tags.setdefault(object_id, []).append(name)
+    for row in rows:
+        row['tags'] = tags.get(row['pk'], [])
+
+
+def _column(name, path):
+    # İlişki üzerinden okunan alanlar model alanlarıyla çakışmasın diye
+    # takma adla seçilir (ör. category -> category__name).
+    return name if name == path else f'api_{name}'
+
+
+def serialize_rows(resource, rows, fields):
+    if 'tags' in fields and rows:
+        _attach_tags(resource['model'], rows)
+    results = []
+    for row in rows:
+        item = {}
+        for name in fields:
+            if name == 'url':
+                item[name] = reverse(resource['url'], args=[row['slug']]) if row['slug'] else None
+            elif name == 'tags':
+                item[name] = row['tags']
+            elif name in IMAGE_FIELDS:
+                item[name] = default_storage.url(row[name]) if row[name] else None
+            else:
+                item[name] = row[_column(name, resource['fields'][name])]
+        results.append(item)
+    return results
+
+
+def _values(resource, fields, queryset):
+    plain = {'pk', resource['cursor']}
+    if 'url' in fields:
+        plain.add('slug')
+    aliased = {}
+    for name in fields:
+        path = resource['fields'].get(name)
+        if path is None:
+            continue
+        if name == path:
+            plain.add(name)
+        else:
+            aliased[_column(name, path)] = F(path)
+    return queryset.values(*plain, **aliased)
+
+
+def api_etag(request, resource):
+    # ETag yalnızca kaynağın bağlı olduğu modellerin damgalarından ve istek
+    # adresinden üretilir; ilgisiz bir içerik değişikliği istemci önbelleğini
+    # geçersiz kılmaz.
+    stamps = get_model_stamps(resource['depends'])
+    digest = hashlib.md5(f"{request.get_full_path()}:{':'.join(stamps)}".encode()).hexdigest()
+    return digest, quote_etag(digest)
+
+
+def cache_payload(digest, data):
+    content = json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False).encode()
+    cache.set(API_CACHE_KEY.format(digest), content, PAGE_CACHE_TIMEOUT)
+    return content
+
+
+def json_response(response, etag):
+    response['ETag'] = etag
+    patch_cache_control(response, public=True, max_age=0, must_revalidate=True)
+    return response
+
+
+def _conditional_json(request, resource, build):
+    digest, etag = api_etag(request, resource)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        content, status = cache.get(API_CACHE_KEY.format(digest)), 'hit'
+        if content is None:
+            data = build()
+            if isinstance(data, HttpResponse):
+                return data
+            content, status = cache_payload(digest, data), 'miss'
+        response = mark_cache_status(HttpResponse(content, content_type='application/json'), status)
+    else:
+        mark_cache_status(response, 'revalidated')
+    return json_response(response, etag)
+
+
+def get_resource(name):
+    resource = API_RESOURCES.get(name)
+    if resource is None:
+        raise Http404
+    return resource
+
+
+def _page_url(request, **params):
+    query = request.GET.copy()
+    for name in ('after', 'before'):
+        query.pop(name, None)
+    query.update(params)
+    return request.build_absolute_uri(f'{request.path}?{query.urlencode()}')
+
+
+def index_payload(request):
+    return {
+        'version': API_VERSION,
+        'resources': {
+            name: {'url': request.build_absolute_uri(reverse('blog:api_list', args=[name])), 'fields': available_fields(resource), 'filters': list(resource['filters'])}
+            for name, resource in API_RESOURCES.items()
+        },
+    }
+
+
+def list_payload(request, resource):
+    try:
+        fields = selected_fields(request, resource)
+        limit = min(max(int(request.GET.get('limit', DEFAULT_LIMIT)), 1), MAX_LIMIT)
+    except ValueError as exc:
+        return _error(str(exc))
+    queryset = resource['model'].objects.filter(**resource.get('base_filter', {}))
+    for param, lookup in resource['filters'].items():
+        if param in request.GET:
+            queryset = queryset.filter(**{lookup: request.GET[param]})
+    page = keyset_page(_values(resource, fields, queryset), resource['cursor'], after=request.GET.get('after'), before=request.GET.get('before'), per_page=limit)
+    return {
+        'results': serialize_rows(resource, page['items'], fields),
+        'next': _page_url(request, after=page['next_cursor']) if page['next_cursor'] else None,
+        'previous': _page_url(request, before=page['previous_cursor']) if page['previous_cursor'] else None,
+    }
+
+
+def detail_payload(request, resource, slug):
+    try:
+        fields = selected_fields(request, resource)
+    except ValueError as exc:
+        return _error(str(exc))
+    queryset = resource['model'].objects.filter(slug=slug, **resource.get('base_filter', {}))
+    rows = list(_values(resource, fields, queryset)[:1])
+    if not rows:
+        return _error("Kayıt bulunamadı.", status=404)
+    return serialize_rows(resource, rows, fields)[0]
+
+
+def api_index(request):
+    return JsonResponse(index_payload(request))
+
+
+def api_list(request, resource_name):
+    resource = get_resource(resource_name)
+    return _conditional_json(request, resource, lambda: list_payload(request, resource))
+
+
+def api_detail(request, resource_name, slug):
+    resource = get_resource(resource_name)
+    return _conditional_json(request, resource, lambda: detail_payload(request, resource, slug))
@@ -0,0 +1,94 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
+from django.shortcuts import aget_object_or_404, render
+from django.utils.cache import get_conditional_response
+
+from .api import API_CACHE_KEY, api_etag, cache_payload, detail_payload, get_resource, index_payload, json_response, list_payload
+from .caching import cache_content_page, mark_cache_status
+from .loaders import aload_homepage, load_homepage
+from .models import BlogPost, Project, CodeExample, Certificate, Skill, SubCategory
+from .streaming import astream_homepage
+
+# ASGI altında (settings.ASYNC_VIEWS) okuma ağırlıklı sayfaların async
+# sürümleri. Veri async ORM ile alınır; şablonlar (bağlam işlemcileri ve
+# tembel ilişkiler dahil) senkron çalıştığı için yalnızca işleme thread'e
+# verilir.
+arender = sync_to_async(render)
+
+
+async def get_subcategories(request):
+    category_name = request.GET.get('category')
+    if category_name:
+        subcategories = [row async for row in SubCategory.objects.filter(category__name=category_name).values('name')]
+        return JsonResponse(subcategories, safe=False)
+    return JsonResponse([], safe=False)
+
+
+@cache_content_page
+async def index(request):
+    if settings.HOMEPAGE_STREAMING:
+        return astream_homepage(request, load_homepage())
+    context = await aload_homepage()
+    return await arender(request, 'index.html', context)
+
+
+@cache_content_page
+async def blog_detail(request, slug):
+    post = await aget_object_or_404(BlogPost.objects.select_related('category', 'subcategory'), slug=slug, is_published=True)
+    return await arender(request, 'blog/detail.html', {'post': post})
+
+
+@cache_content_page
+async def project_detail(request, slug):
+    project = await aget_object_or_404(Project.objects.prefetch_related('tags'), slug=slug)
+    return await arender(request, 'project_detail.html', {'project': project})
+
+
+@cache_content_page
+async def codeexample_detail(request, slug):
+    codeexample = await aget_object_or_404(CodeExample, slug=slug)
+    return await arender(request, 'codeexample_detail.html', {'codeexample': codeexample})
+
+
+@cache_content_page
+async def skill_detail(request, slug):
+    skill = await aget_object_or_404(Skill.objects.select_related('category'), slug=slug)
+    return await arender(request, 'skills/skill_detail.html', {'skill': skill})
+
+
+@cache_content_page
+async def certificate_detail(request, slug):
+    certificate = await aget_object_or_404(Certificate, slug=slug)
+    return await arender(request, 'certificates/certificate_detail.html', {'certificate': certificate})
+
+
+async def _conditional_json(request, resource, build):
+    digest, etag = api_etag(request, resource)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        content, status = cache.get(API_CACHE_KEY.format(digest)), 'hit'
+        if content is None:
+            data = await sync_to_async(build)()
+            if isinstance(data, HttpResponse):
+                return data
+            content, status = cache_payload(digest, data), 'miss'
+        response = mark_cache_status(HttpResponse(content, content_type='application/json'), status)
+    else:
+        mark_cache_status(response, 'revalidated')
+    return json_response(response, etag)
+
+
+async def api_index(request):
+    return JsonResponse(index_payload(request))
+
+
+async def api_list(request, resource_name):
+    resource = get_resource(resource_name)
+    return await _conditional_json(request, resource, lambda: list_payload(request, resource))
+
+
+async def api_detail(request, resource_name, slug):
+    resource = get_resource(resource_name)
+    return await _conditional_json(request, resource, lambda: detail_payload(request, resource, slug))
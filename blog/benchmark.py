@@ -0,0 +1,445 @@
+import asyncio
+import http.client
+import importlib
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from io import BytesIO
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.servers.basehttp import ThreadedWSGIServer
+from django.test.testcases import QuietWSGIRequestHandler
+from django.test.utils import override_settings
+from django.urls import clear_url_caches, reverse
+
+from .loaders import certificate_page
+from .metrics import RequestMetrics, percentile
+from .models import BlogPost, Category, SubCategory, Education, Experience, Certificate, Project, Tag, CodeExample, SiteSettings, SkillCategory, Skill, ProjectCategory, CodeLanguage, CodeCategory, NavbarLink
+from .transfer import import_records
+
+BENCHMARK_HOST = 'localhost'
+
+
+def summarize(latencies, elapsed, statuses):
+    return {
+        'requests': len(latencies),
+        'rps': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'errors': sum(1 for status in statuses if status >= 400),
+    }
+
+
+def _split(path):
+    path, _, query = path.partition('?')
+    return path, query
+
+
+def wsgi_environ(path):
+    path, query = _split(path)
+    return {
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+        'SERVER_NAME': BENCHMARK_HOST,
+        'SERVER_PORT': '80',
+        'SERVER_PROTOCOL': 'HTTP/1.1',
+        'HTTP_HOST': BENCHMARK_HOST,
+        'REMOTE_ADDR': '127.0.0.1',
+        'wsgi.url_scheme': 'http',
+        'wsgi.input': BytesIO(),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+
+
+def run_wsgi(path, requests, concurrency):
+    # Çok thread'li bir WSGI sunucusunun (gunicorn --threads, mod_wsgi)
+    # süreç içi karşılığı: her worker thread kendi DB bağlantısını kullanır.
+    handler = WSGIHandler()
+
+    def one(_):
+        status = []
+        start = time.perf_counter()
+        body = handler(wsgi_environ(path), lambda value, headers, exc_info=None: status.append(int(value.split()[0])))
+        try:
+            b''.join(body)
+        finally:
+            body.close()
+        return time.perf_counter() - start, status[0]
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        started = time.perf_counter()
+        results = list(executor.map(one, range(requests)))
+        elapsed = time.perf_counter() - started
+    return summarize([latency for latency, _ in results], elapsed, [status for _, status in results])
+
+
+def asgi_scope(path):
+    path, query = _split(path)
+    return {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': query.encode(),
+        'root_path': '',
+        'headers': [(b'host', BENCHMARK_HOST.encode())],
+        'client': ('127.0.0.1', 0),
+        'server': (BENCHMARK_HOST, 80),
+    }
+
+
+async def _asgi_request(handler, path):
+    received = False
+    status = []
+
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        # Bağlantı istek boyunca açık kalır; Django yanıttan sonra bu
+        # bekleyişi iptal eder.
+        await asyncio.Future()
+
+    async def send(message):
+        if message['type'] == 'http.response.start':
+            status.append(message['status'])
+
+    start = time.perf_counter()
+    await handler(asgi_scope(path), receive, send)
+    return time.perf_counter() - start, status[0]
+
+
+def run_asgi(path, requests, concurrency):
+    # uvicorn/daphne gibi tek olay döngüsünde eşzamanlı istekler; en fazla
+    # `concurrency` istek aynı anda işlenir.
+    handler = ASGIHandler()
+
+    async def main():
+        limit = asyncio.Semaphore(concurrency)
+
+        async def one():
+            async with limit:
+                return await _asgi_request(handler, path)
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(one() for _ in range(requests)))
+        return results, time.perf_counter() - started
+
+    results, elapsed = asyncio.run(main())
+    return summarize([latency for latency, _ in results], elapsed, [status for _, status in results])
+
+
+def _reload_urls():
+    importlib.reload(importlib.import_module('blog.urls'))
+    importlib.reload(importlib.import_module(settings.ROOT_URLCONF))
+    clear_url_caches()
+
+
+@contextmanager
+def url_variant(async_views):
+    # URL'ler süreç başlarken ASYNC_VIEWS'e göre kurulur; aynı süreçte iki
+    # sürümü ölçmek için URL modülleri yeniden yüklenir.
+    try:
+        with override_settings(ASYNC_VIEWS=async_views):
+            _reload_urls()
+            yield
+    finally:
+        _reload_urls()
+
+
+def run_http(path, requests, concurrency):
+    # runserver'ın çok thread'li sunucusuna gerçek HTTP bağlantılarıyla
+    # yük bindirilir; her istemci worker'ı kendi bağlantısını açar.
+    server = ThreadedWSGIServer(('127.0.0.1', 0), QuietWSGIRequestHandler)
+    server.set_app(WSGIHandler())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+
+    def one(_):
+        connection = http.client.HTTPConnection(host, port)
+        start = time.perf_counter()
+        try:
+            connection.request('GET', path, headers={'Host': BENCHMARK_HOST})
+            response = connection.getresponse()
+            response.read()
+            return time.perf_counter() - start, response.status
+        finally:
+            connection.close()
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            started = time.perf_counter()
+            results = list(executor.map(one, range(requests)))
+            elapsed = time.perf_counter() - started
+    finally:
+        server.shutdown()
+        server.server_close()
+    return summarize([latency for latency, _ in results], elapsed, [status for _, status in results])
+
+
+# Sunucu adı -> (çalıştırıcı, async view'lar kullanılsın mı).
+SERVERS = {
+    'http': (run_http, False),
+    'wsgi': (run_wsgi, False),
+    'asgi': (run_asgi, True),
+    'asgi-sync': (run_asgi, False),
+}
+
+
+def run_server(name, path, requests, concurrency):
+    runner, async_views = SERVERS[name]
+    with url_variant(async_views):
+        return runner(path, requests, concurrency)
+
+
+# Sentetik veri: her içerik modelinden `rows` kayıt, kategori ve etiketler
+# sabit sayıda. Tarihler ve ilişkiler sıra numarasından üretildiği için aynı
+# ölçek her çalıştırmada aynı veriyi verir.
+SEED_GROUPS = 5
+SEED_TAGS = 20
+SEED_START = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+SEED_TEXT = "Ölçüm için üretilmiş içerik. " * 8
+
+
+def _seed_tags(i):
+    return [f'etiket-{i % SEED_TAGS}', f'etiket-{(i * 7 + 3) % SEED_TAGS}']
+
+
+def seed_records(rows):
+    yield SiteSettings, {'site_name': 'Benchmark'}
+    for i, section in enumerate(('about', 'projects', 'contact')):
+        yield NavbarLink, {'title': section.title(), 'section': section, 'order': i}
+    for i in range(SEED_TAGS):
+        yield Tag, {'name': f'etiket-{i}', 'slug': f'etiket-{i}'}
+    groups = range(SEED_GROUPS)
+    for i in groups:
+        yield Category, {'name': f'Kategori {i}', 'slug': f'kategori-{i}'}
+    for i in groups:
+        yield SubCategory, {'name': f'Alt Kategori {i}', 'slug': f'alt-kategori-{i}', 'category': f'kategori-{i}'}
+    for i in groups:
+        yield ProjectCategory, {'name': f'Proje Kategorisi {i}', 'slug': f'proje-kategorisi-{i}'}
+    for i in groups:
+        # SkillCategory adı benzersiz değil; kayıtlar id ile eşleştirilir.
+        yield SkillCategory, {'id': i + 1, 'name': f'Yetenek Kategorisi {i}'}
+    for i in groups:
+        yield CodeLanguage, {'name': f'Dil {i}', 'slug': f'dil-{i}'}
+    for i in groups:
+        yield CodeCategory, {'name': f'Konu {i}', 'slug': f'konu-{i}', 'language': f'dil-{i}'}
+    for i in groups:
+        yield Education, {'title': f'Bölüm {i}', 'school': 'Okul', 'start_date': date(2015 + i, 9, 1), 'description': SEED_TEXT, 'tags': _seed_tags(i)}
+    for i in groups:
+        yield Experience, {'title': f'Pozisyon {i}', 'company': 'Şirket', 'start_date': date(2019 + i, 1, 1), 'description': SEED_TEXT, 'tags': _seed_tags(i)}
+
+    for i in range(rows):
+        yield Project, {
+            'title': f'Proje {i}', 'description': SEED_TEXT, 'category': f'proje-kategorisi-{i % SEED_GROUPS}',
+            'image': f'projects/benchmark-{i % SEED_GROUPS}.jpg', 'tags': _seed_tags(i), 'created_at': SEED_START + timedelta(minutes=i),
+        }
+    for i in range(rows):
+        yield CodeExample, {
+            'title': f'Örnek {i}', 'language': f'dil-{i % SEED_GROUPS}', 'category': f'konu-{i % SEED_GROUPS}',
+            'code': f'print({i})', 'description': SEED_TEXT, 'created_at': SEED_START + timedelta(minutes=i),
+        }
+    for i in range(rows):
+        yield Certificate, {
+            'title': f'Sertifika {i}', 'issuer': f'Kurum {i % SEED_GROUPS}', 'date': SEED_START.date() + timedelta(days=i),
+            'description': SEED_TEXT, 'created_at': SEED_START + timedelta(minutes=i),
+        }
+    for i in range(rows):
+        yield Skill, {'name': f'Yetenek {i}', 'category': i % SEED_GROUPS + 1, 'order': i, 'description': SEED_TEXT}
+    for i in range(rows):
+        yield BlogPost, {
+            'title': f'Yazı {i}', 'content': SEED_TEXT * 4, 'category': f'kategori-{i % SEED_GROUPS}', 'subcategory': f'alt-kategori-{i % SEED_GROUPS}',
+            'tags': _seed_tags(i), 'is_published': i % 10 != 9, 'published_at': SEED_START + timedelta(hours=i), 'created_at': SEED_START + timedelta(minutes=i),
+        }
+
+
+def seed_dataset(rows):
+    # İçe aktarma yolu kullanılır: toplu yazma, slug üretimi, önbellek
+    # damgaları ve arama indeksi.
+    return import_records(seed_records(rows))
+
+
+def _slug(model, **filters):
+    return model.objects.filter(**filters).order_by('pk').values_list('slug', flat=True).first()
+
+
+def _code_group():
+    example = CodeExample.objects.select_related('language', 'category').order_by('pk').first()
+    return [example.language.slug, example.category.slug] if example else None
+
+
+def _archive_month():
+    published = BlogPost.objects.filter(is_published=True).order_by('-published_at').values_list('published_at', flat=True).first()
+    return [published.year, published.month] if published else None
+
+
+def _certificate_cursor():
+    cursor = certificate_page()['next_cursor']
+    return [cursor] if cursor else None
+
+
+def _one(value):
+    return [value] if value else None
+
+
+def _api_detail():
+    slug = _slug(Project)
+    return ['projects', slug] if slug else None
+
+
+# blog/urls.py'deki adres adı -> örnek isteğin (argümanlar, sorgu) üreticisi.
+# Argüman None ise veri o adres için yetersizdir ve adres atlanır.
+ROUTE_SAMPLES = {
+    'index': lambda: ([], {}),
+    'about': lambda: ([], {}),
+    'skills': lambda: ([], {}),
+    'projects': lambda: ([], {}),
+    'blog_list': lambda: ([], {}),
+    'subcategories': lambda: ([], {'category': Category.objects.order_by('pk').values_list('name', flat=True).first()}),
+    'blog_category': lambda: (_one(_slug(Category)), {}),
+    'blog_subcategory': lambda: (_one(_slug(SubCategory)), {}),
+    'blog_tag': lambda: (_one(_slug(Tag)), {}),
+    'blog_month': lambda: (_archive_month(), {}),
+    'blog_detail': lambda: (_one(_slug(BlogPost, is_published=True)), {}),
+    'project_detail': lambda: (_one(_slug(Project)), {}),
+    'codeexample_detail': lambda: (_one(_slug(CodeExample)), {}),
+    'skill_detail': lambda: (_one(_slug(Skill)), {}),
+    'certificate_detail': lambda: (_one(_slug(Certificate)), {}),
+    'search': lambda: ([], {'q': 'proje'}),
+    'code_fragment': lambda: (_code_group(), {}),
+    'certificates_fragment': lambda: (_certificate_cursor(), {}),
+    'api_index': lambda: ([], {}),
+    'api_list': lambda: (['projects'], {}),
+    'api_detail': lambda: (_api_detail(), {}),
+}
+
+# GET ile ölçülmeyen adresler.
+SKIPPED_ROUTES = {
+    'contact': 'yalnızca POST',
+    'metrics': 'yalnızca admin',
+}
+
+
+def route_paths():
+    # Yeni bir adres ROUTE_SAMPLES'a eklenmezse `missing` listesinde döner.
+    blog_urls = importlib.import_module('blog.urls')
+    paths, missing = {}, []
+    for pattern in blog_urls.urlpatterns:
+        if pattern.name in SKIPPED_ROUTES:
+            continue
+        sample = ROUTE_SAMPLES.get(pattern.name)
+        if sample is None:
+            missing.append(pattern.name)
+            continue
+        args, query = sample()
+        if args is None:
+            paths[pattern.name] = None
+            continue
+        path = reverse(f'{blog_urls.app_name}:{pattern.name}', args=args)
+        paths[pattern.name] = f'{path}?{urlencode(query)}' if query else path
+    return paths, missing
+
+
+def _read(response):
+    return b''.join(response.streaming_content) if response.streaming else response.content
+
+
+def _timed_get(client, path):
+    metrics = RequestMetrics()
+    with metrics.database_wrappers():
+        start = time.perf_counter()
+        response = client.get(path)
+        body = _read(response)
+        elapsed = time.perf_counter() - start
+    return response.status_code, len(body), elapsed, metrics.queries
+
+
+def measure_route(client, path, iterations):
+    # Soğuk: önbellek her istekten önce boşaltılır. Sıcak: sayfa ve bölüm
+    # önbellekleri doludur. Bellek, soğuk bir isteğin tracemalloc tepesidir.
+    cold, warm = [], []
+    for timings, clear in ((cold, True), (warm, False)):
+        for _ in range(iterations):
+            if clear:
+                cache.clear()
+            timings.append(_timed_get(client, path))
+    cache.clear()
+    tracemalloc.start()
+    try:
+        _read(client.get(path))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    status, size = cold[-1][0], cold[-1][1]
+    return {
+        'path': path,
+        'status': status,
+        'bytes': size,
+        'cold_queries': max(queries for *_, queries in cold),
+        'warm_queries': max(queries for *_, queries in warm),
+        'cold_min_ms': round(min(elapsed for _, _, elapsed, _ in cold) * 1000, 2),
+        'cold_p50_ms': round(percentile([elapsed for _, _, elapsed, _ in cold], 0.50) * 1000, 2),
+        'warm_min_ms': round(min(elapsed for _, _, elapsed, _ in warm) * 1000, 2),
+        'warm_p50_ms': round(percentile([elapsed for _, _, elapsed, _ in warm], 0.50) * 1000, 2),
+        'warm_p95_ms': round(percentile([elapsed for _, _, elapsed, _ in warm], 0.95) * 1000, 2),
+        'peak_kib': round(peak / 1024, 1),
+    }
+
+
+# Temel ölçümle karşılaştırmada yalnızca sorgu sayısındaki artış gerilemedir.
+# Süre ve bellek makineye ve ana göre değiştiğinden temel ölçümde
+# 'informational' altında tutulur ve yalnızca uyarı olarak raporlanır; en iyi
+# ölçüm (min) oransal pay ve mutlak bir alt sınırla karşılaştırılır.
+QUERY_KEYS = ('cold_queries', 'warm_queries')
+INFORMATIONAL_KEYS = {'cold_min_ms': 1.0, 'warm_min_ms': 1.0, 'peak_kib': 64.0}
+
+
+def baseline_entry(result):
+    return {
+        'rows': result['rows'],
+        'iterations': result['iterations'],
+        'python': result['python'],
+        'django': result['django'],
+        'routes': {
+            name: {
+                'path': route['path'],
+                'status': route['status'],
+                **{key: route[key] for key in QUERY_KEYS},
+                'informational': {key: route[key] for key in INFORMATIONAL_KEYS},
+            }
+            for name, route in result['routes'].items()
+        },
+    }
+
+
+def compare_results(result, baseline, tolerance):
+    regressions, warnings = [], []
+    for name, route in result['routes'].items():
+        base = baseline.get('routes', {}).get(name)
+        if not base:
+            continue
+        for key in QUERY_KEYS:
+            if route[key] > base[key]:
+                regressions.append(f"{name}: {key} {base[key]} -> {route[key]}")
+        informational = base.get('informational', {})
+        for key, floor in INFORMATIONAL_KEYS.items():
+            if key in informational and route[key] > informational[key] * (1 + tolerance) and route[key] - informational[key] > floor:
+                warnings.append(f"{name}: {key} {informational[key]} -> {route[key]}")
+    return regressions, warnings
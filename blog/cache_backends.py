@@ -0,0 +1,24 @@
+import os
+
+from django.core.cache.backends.filebased import FileBasedCache
+
+try:
+    import fcntl
+except ImportError:  # fcntl yalnızca POSIX'te vardır; yoksa Django'nun incr()'i kullanılır.
+    fcntl = None
+
+
+class StampFileCache(FileBasedCache):
+    # Django'nun incr()'i get + set yapar; iki worker aynı anda artırırsa
+    # aynı değeri yazabilir. İçerik sürümü sayacının artırılması bir dosya
+    # kilidiyle süreçler (ve thread'ler) arasında sıraya sokulur.
+    def incr(self, key, delta=1, version=None):
+        if fcntl is None:
+            return super().incr(key, delta, version)
+        self._createdir()
+        with open(os.path.join(self._dir, 'incr.lock'), 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                return super().incr(key, delta, version)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
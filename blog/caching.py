@@ -0,0 +1,310 @@
+import re
+import time
+import uuid
+from collections import defaultdict
+from datetime import timezone as dt_timezone
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.apps import apps
+from django.core.cache import cache, caches
+from django.db.models import Max
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date, urlencode
+
+from .models import SiteSettings, NavbarLink
+
+# İçerik sürümü, model damgaları ve site iskeleti sürümü ayrı, hiç
+# temizlenmeyen (anahtar sayısı sınırlı) bir önbellekte tutulur; sayfa ve
+# bölüm kayıtlarıyla dolan varsayılan önbelleğin rastgele silmesinden
+# etkilenmez.
+STAMP_CACHE = 'stamps'
+# Önbelleğe alınan sayfaların okuduğu sorgu parametreleri; diğerleri
+# (utm_* vb.) yanıtı değiştirmediği için anahtara girmez.
+PAGE_QUERY_PARAMS = ('after', 'before')
+
+CONTENT_GENERATION_KEY = 'blog:content-generation'
+CONTENT_MODIFIED_KEY = 'blog:content-modified'
+CHROME_VERSION_KEY = 'blog:chrome-version'
+MODEL_STAMP_KEY = 'blog:model-stamp:{}'
+PAGE_CACHE_TIMEOUT = 60 * 60 * 24
+FRAGMENT_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Ana sayfa bölümlerinin hangi modellerin verisini gösterdiği. Bir bölümün
+# önbellek anahtarı yalnızca bu modellerin değişiklik damgalarından üretilir.
+SECTION_DEPENDENCIES = {
+    'sections/hero.html': ('SiteSettings',),
+    'sections/about.html': ('About', 'Education', 'Experience'),
+    'sections/education.html': ('Education', 'Experience', 'Tag', 'CodeLanguage', 'CodeCategory', 'CodeExample'),
+    'sections/certificates.html': ('Certificate',),
+    'sections/skills.html': ('Skill', 'SkillCategory'),
+    'sections/projects.html': ('Project', 'ProjectCategory', 'Tag'),
+    'sections/contact.html': ('ContactInfo', 'SiteSettings'),
+}
+
+# Önbellekteki sayfada ziyaretçiye özel CSRF token'ı tutmuyoruz; sayfa her
+# sunulduğunda isteğin kendi token'ı yerleştirilir.
+CSRF_INPUT_RE = re.compile(rb'(name="csrfmiddlewaretoken" value=")[^"]*(")')
+CSRF_PLACEHOLDER = rb'__CSRF_TOKEN__'
+
+
+def _latest_update():
+    latest = None
+    for model in apps.get_app_config('blog').get_models():
+        if not any(field.name == 'updated_at' for field in model._meta.fields):
+            continue
+        value = model.objects.aggregate(latest=Max('updated_at'))['latest']
+        if value and (latest is None or value > latest):
+            latest = value
+    return latest or timezone.now()
+
+
+def _stamps():
+    return caches[STAMP_CACHE]
+
+
+def get_content_state():
+    stamps = _stamps()
+    state = stamps.get_many([CONTENT_GENERATION_KEY, CONTENT_MODIFIED_KEY])
+    if len(state) < 2:
+        # Sürüm sayacı yalnızca ilk kurulumda (ya da önbellek dizini
+        # silindiğinde) oluşturulur. Nanosaniye cinsinden zamanla başladığı
+        # için daha önce verilmiş her sürümden büyüktür; silme ve m2m
+        # değişiklikleri updated_at'i değiştirmese de eski sayfalar geri gelmez.
+        stamps.add(CONTENT_GENERATION_KEY, time.time_ns(), None)
+        stamps.add(CONTENT_MODIFIED_KEY, _latest_update(), None)
+        state = stamps.get_many([CONTENT_GENERATION_KEY, CONTENT_MODIFIED_KEY])
+    return state[CONTENT_GENERATION_KEY], state[CONTENT_MODIFIED_KEY]
+
+
+# Django 5.2'de önbellek arka uçlarının aget()/aset() metotları yalnızca
+# senkron çağrıyı thread'e taşır. Bellek ve dosya önbelleğine erişim kısa
+# sürdüğünden async yollarda önbellek doğrudan çağrılır; isabette thread
+# geçişi olmaz, yalnızca veritabanına inilen ıskalama thread'e verilir.
+async def aget_content_state():
+    state = _stamps().get_many([CONTENT_GENERATION_KEY, CONTENT_MODIFIED_KEY])
+    if len(state) < 2:
+        return await sync_to_async(get_content_state)()
+    return state[CONTENT_GENERATION_KEY], state[CONTENT_MODIFIED_KEY]
+
+
+def get_content_generation():
+    return get_content_state()[0]
+
+
+def bump_content_generation():
+    # Sayaç atomik olarak artırılır; aynı anda kaydedilen iki değişiklik
+    # aynı sürümü üretmez (bkz. blog.cache_backends.StampFileCache).
+    stamps = _stamps()
+    try:
+        generation = stamps.incr(CONTENT_GENERATION_KEY)
+    except ValueError:
+        get_content_state()
+        generation = stamps.incr(CONTENT_GENERATION_KEY)
+    modified = timezone.now()
+    stamps.set(CONTENT_MODIFIED_KEY, modified, None)
+    return generation, modified
+
+
+def page_cache_key(request, generation):
+    query = urlencode(sorted((name, request.GET[name]) for name in PAGE_QUERY_PARAMS if name in request.GET))
+    return f"blog:page:{generation}:{request.path}{'?' + query if query else ''}"
+
+
+def strip_csrf_token(content):
+    return CSRF_INPUT_RE.sub(rb'\1' + CSRF_PLACEHOLDER + rb'\2', content)
+
+
+def fill_csrf_token(content, request):
+    if CSRF_PLACEHOLDER not in content:
+        return content
+    return content.replace(CSRF_PLACEHOLDER, get_token(request).encode())
+
+
+def _conditional_page(request, generation, last_modified):
+    etag = quote_etag(str(generation))
+    timestamp = int(last_modified.astimezone(dt_timezone.utc).timestamp())
+    return etag, timestamp, get_conditional_response(request, etag=etag, last_modified=timestamp)
+
+
+def _page_entry(response):
+    if response.status_code == 200 and not response.streaming:
+        return strip_csrf_token(response.content), response['Content-Type']
+    return None
+
+
+def _cache_when_streamed(response, key):
+    # Parça parça gönderilen sayfa, akış sonuna kadar okunduğunda birleştirilip
+    # önbelleğe yazılır; yarıda kesilen yanıt saklanmaz.
+    if response.status_code != 200:
+        return
+    source, content_type, parts = response.streaming_content, response['Content-Type'], []
+
+    def store():
+        cache.set(key, (strip_csrf_token(b''.join(parts)), content_type), PAGE_CACHE_TIMEOUT)
+
+    if response.is_async:
+        async def chunks():
+            async for chunk in source:
+                parts.append(chunk)
+                yield chunk
+            store()
+    else:
+        def chunks():
+            for chunk in source:
+                parts.append(chunk)
+                yield chunk
+            store()
+    response.streaming_content = chunks()
+
+
+def _cached_page(request, cached):
+    content, content_type = cached
+    return HttpResponse(fill_csrf_token(content, request), content_type=content_type)
+
+
+def mark_cache_status(response, status):
+    # İstek ölçümü (blog.metrics) yanıtın önbellekten gelip gelmediğini
+    # buradan okur: hit, miss ya da revalidated (304).
+    response.cache_status = status
+    return response
+
+
+def _add_validators(response, etag, timestamp):
+    if response.status_code in (200, 304):
+        response.headers.setdefault('ETag', etag)
+        response.headers.setdefault('Last-Modified', http_date(timestamp))
+    return response
+
+
+def cache_content_page(view):
+    # Async view'larda önbellek isabeti ve 304 yanıtı olay döngüsünden
+    # çıkmadan döner; view yalnızca ıskalamada çalışır.
+    if iscoroutinefunction(view):
+        @wraps(view)
+        async def async_wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return await view(request, *args, **kwargs)
+
+            generation, last_modified = await aget_content_state()
+            etag, timestamp, response = _conditional_page(request, generation, last_modified)
+            if response is None:
+                key = page_cache_key(request, generation)
+                cached = cache.get(key)
+                if cached is None:
+                    response = mark_cache_status(await view(request, *args, **kwargs), 'miss')
+                    entry = _page_entry(response)
+                    if entry:
+                        cache.set(key, entry, PAGE_CACHE_TIMEOUT)
+                    elif response.streaming:
+                        _cache_when_streamed(response, key)
+                else:
+                    response = mark_cache_status(_cached_page(request, cached), 'hit')
+            else:
+                mark_cache_status(response, 'revalidated')
+            return _add_validators(response, etag, timestamp)
+        return async_wrapper
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return view(request, *args, **kwargs)
+
+        generation, last_modified = get_content_state()
+        etag, timestamp, response = _conditional_page(request, generation, last_modified)
+        if response is None:
+            key = page_cache_key(request, generation)
+            cached = cache.get(key)
+            if cached is None:
+                response = mark_cache_status(view(request, *args, **kwargs), 'miss')
+                entry = _page_entry(response)
+                if entry:
+                    cache.set(key, entry, PAGE_CACHE_TIMEOUT)
+                elif response.streaming:
+                    _cache_when_streamed(response, key)
+            else:
+                response = mark_cache_status(_cached_page(request, cached), 'hit')
+        else:
+            mark_cache_status(response, 'revalidated')
+        return _add_validators(response, etag, timestamp)
+    return wrapper
+
+
+# Site ayarları ve navbar linkleri her sayfada kullanılır. Süreç içinde
+# saklanır; başka bir worker'da yapılan değişiklik önbellekteki sürüm
+# damgası üzerinden fark edilir.
+_site_chrome = (None, None)
+
+
+def get_chrome_version():
+    stamps = _stamps()
+    version = stamps.get(CHROME_VERSION_KEY)
+    if version is None:
+        stamps.add(CHROME_VERSION_KEY, uuid.uuid4().hex, None)
+        version = stamps.get(CHROME_VERSION_KEY)
+    return version
+
+
+def bump_chrome_version():
+    _stamps().set(CHROME_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def get_site_chrome():
+    global _site_chrome
+    version = get_chrome_version()
+    cached_version, chrome = _site_chrome
+    if chrome is None or cached_version != version:
+        chrome = {
+            'site_settings': SiteSettings.objects.first(),
+            'navbar_links': list(NavbarLink.objects.filter(is_active=True).order_by('order')),
+        }
+        _site_chrome = (version, chrome)
+    return chrome
+
+
+def bump_model_stamp(*model_names):
+    _stamps().set_many({MODEL_STAMP_KEY.format(name): uuid.uuid4().hex for name in model_names}, None)
+
+
+def get_model_stamps(model_names):
+    keys = [MODEL_STAMP_KEY.format(name) for name in model_names]
+    stamps = _stamps().get_many(keys)
+    missing = {key: uuid.uuid4().hex for key in keys if key not in stamps}
+    if missing:
+        _stamps().set_many(missing, None)
+        stamps.update(missing)
+    return [stamps[key] for key in keys]
+
+
+# Süreç bazında bölüm önbelleği isabet/ıskalama sayaçları.
+fragment_stats = defaultdict(lambda: {'hits': 0, 'misses': 0})
+
+
+def fragment_cache_key(template_name):
+    stamps = get_model_stamps(SECTION_DEPENDENCIES.get(template_name, ()))
+    return f"blog:fragment:{template_name}:{':'.join(stamps)}"
+
+
+def stale_fragments(template_names):
+    # Önbellekte karşılığı olmayan bölümler; yalnızca bunların verisi
+    # önceden yüklenir (bkz. loaders.aload_homepage).
+    keys = {template_name: fragment_cache_key(template_name) for template_name in template_names}
+    cached = cache.get_many(keys.values())
+    return [template_name for template_name, key in keys.items() if key not in cached]
+
+
+def render_cached_fragment(template_name, render, request=None):
+    key = fragment_cache_key(template_name)
+    html = cache.get(key)
+    if html is None:
+        fragment_stats[template_name]['misses'] += 1
+        html = strip_csrf_token(render().encode())
+        cache.set(key, html, FRAGMENT_CACHE_TIMEOUT)
+    else:
+        fragment_stats[template_name]['hits'] += 1
+    if request is not None:
+        html = fill_csrf_token(html, request)
+    return html.decode()
@@ -0,0 +1,177 @@
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.mail import EmailMessage, get_connection
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .models import ContactInfo, ContactMessage
+from .routers import use_primary
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 3
+MAIL_BATCH_SIZE = 50
+RATE_BUCKET_KEY = 'blog:contact-bucket:{}'
+
+# IP başına token kovası: en fazla CONTACT_RATE_CAPACITY ardışık mesaj,
+# ardından her CONTACT_RATE_REFILL saniyede bir yeni hak.
+RATE_CAPACITY = 3
+RATE_REFILL_SECONDS = 120
+# Aynı gönderenden aynı içerik bu süre içinde tekrar kaydedilmez.
+DUPLICATE_WINDOW = 60 * 60 * 24
+
+
+def client_ip(request):
+    # Proxy arkasında CONTACT_IP_HEADER='HTTP_X_REAL_IP' gibi bir başlık verilir.
+    value = request.META.get(getattr(settings, 'CONTACT_IP_HEADER', 'REMOTE_ADDR')) or request.META.get('REMOTE_ADDR')
+    return value.split(',')[0].strip() if value else None
+
+
+def take_token(ip):
+    # Kova durumu (kalan hak, son güncelleme) paylaşılan önbellekte tutulur;
+    # worker'lar arasında yaklaşık ama kilitsiz bir sınır sağlar.
+    capacity = getattr(settings, 'CONTACT_RATE_CAPACITY', RATE_CAPACITY)
+    refill = getattr(settings, 'CONTACT_RATE_REFILL', RATE_REFILL_SECONDS)
+    key = RATE_BUCKET_KEY.format(ip or 'unknown')
+    now = time.time()
+    tokens, updated = cache.get(key, (capacity, now))
+    tokens = min(capacity, tokens + (now - updated) / refill)
+    allowed = tokens >= 1
+    if allowed:
+        tokens -= 1
+    cache.set(key, (tokens, now), int(capacity * refill))
+    return allowed
+
+
+def message_digest(email, subject, message):
+    normalized = '\n'.join((email.strip().lower(), ' '.join(subject.split()), ' '.join(message.split())))
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+def store_message(form, ip):
+    # Yinelenen gönderim (çift tıklama, yeniden deneyen bot) ikinci kez
+    # kaydedilmez; ziyaretçiye yine de başarılı yanıt verilir.
+    data = form.cleaned_data
+    digest = message_digest(data['email'], data['subject'], data['message'])
+    since = timezone.now() - timedelta(seconds=DUPLICATE_WINDOW)
+    if ContactMessage.objects.filter(digest=digest, created_at__gte=since).exists():
+        return None
+    message = form.save(commit=False)
+    message.digest = digest
+    message.ip_address = ip
+    message.save()
+    transaction.on_commit(schedule_delivery)
+    return message
+
+
+# Mesajlar önce veritabanına yazılır, e-posta ziyaretçiyi bekletmeden tek
+# thread'li bir gönderici tarafından toplu gönderilir. Süreç yeniden başlarsa
+# bekleyenler `send_contact_messages` komutuyla gönderilebilir.
+_executor = None
+_scheduled = threading.Event()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='contact-mail')
+    return _executor
+
+
+def schedule_delivery():
+    if getattr(settings, 'CONTACT_MAIL_EAGER', False):
+        return deliver_pending()
+    # Gönderici bir patlamadaki mesajları toplamak için CONTACT_MAIL_DELAY
+    # saniye bekler; süreç başına en fazla bir bekleyen tur olur.
+    if _scheduled.is_set():
+        return None
+    _scheduled.set()
+    _get_executor().submit(_deliver_in_thread)
+
+
+def _deliver_in_thread():
+    time.sleep(getattr(settings, 'CONTACT_MAIL_DELAY', 5))
+    _scheduled.clear()
+    close_old_connections()
+    try:
+        while deliver_pending():
+            pass
+    except Exception:
+        logger.exception("İletişim mesajları gönderilemedi.")
+    finally:
+        close_old_connections()
+
+
+def recipients():
+    configured = getattr(settings, 'CONTACT_RECIPIENTS', None)
+    if configured:
+        return list(configured)
+    return list(ContactInfo.objects.exclude(email__isnull=True).exclude(email='').values_list('email', flat=True))
+
+
+def claim_batch(batch_size):
+    # Kuyruk salt okunur kopyadan değil birincil veritabanından okunur.
+    with use_primary():
+        ids = list(
+            ContactMessage.objects.filter(status=ContactMessage.STATUS_PENDING)
+            .order_by('created_at').values_list('id', flat=True)[:batch_size]
+        )
+        ContactMessage.objects.filter(pk__in=ids, status=ContactMessage.STATUS_PENDING).update(
+            status=ContactMessage.STATUS_SENDING, updated_at=timezone.now()
+        )
+        # Aynı anda çalışan başka bir gönderici bazılarını almış olabilir.
+        return list(ContactMessage.objects.filter(pk__in=ids, status=ContactMessage.STATUS_SENDING).order_by('created_at'))
+
+
+def build_email(message, to):
+    body = f"{message.name} <{message.email}>\nIP: {message.ip_address or '-'}\n\n{message.message}"
+    return EmailMessage(
+        subject=f"[İletişim] {message.subject}", body=body, to=to, reply_to=[message.email],
+    )
+
+
+def _finish(message, error=None):
+    message.attempts += 1
+    if error is None:
+        message.status, message.last_error, message.sent_at = ContactMessage.STATUS_SENT, '', timezone.now()
+    else:
+        message.last_error = str(error)
+        message.status = ContactMessage.STATUS_PENDING if message.attempts < MAX_ATTEMPTS else ContactMessage.STATUS_FAILED
+    message.save(update_fields=['attempts', 'status', 'last_error', 'sent_at', 'updated_at'])
+
+
+def deliver_pending(batch_size=None):
+    # Bir parti mesaj tek bir SMTP bağlantısı üzerinden gönderilir. Bağlantı
+    # kurulamazsa parti bekleyene döner; tek bir mesajın hatası diğerlerini
+    # etkilemez. Gönderilen mesaj sayısını döndürür.
+    messages = claim_batch(batch_size or MAIL_BATCH_SIZE)
+    if not messages:
+        return 0
+    to = recipients()
+    if not to:
+        for message in messages:
+            _finish(message, "Alıcı adresi tanımlı değil (CONTACT_RECIPIENTS veya İletişim Bilgisi e-postası).")
+        return 0
+    sent = 0
+    try:
+        with get_connection() as connection:
+            for message in messages:
+                try:
+                    connection.send_messages([build_email(message, to)])
+                except Exception as exc:
+                    _finish(message, exc)
+                else:
+                    _finish(message)
+                    sent += 1
+    except OSError as exc:
+        for message in messages:
+            if message.status == ContactMessage.STATUS_SENDING:
+                _finish(message, exc)
+    return sent
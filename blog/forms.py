@@ -0,0 +1,16 @@
+from django import forms
+
+from .models import ContactMessage
+
+
+class ContactForm(forms.ModelForm):
+    class Meta:
+        model = ContactMessage
+        fields = ('name', 'email', 'subject', 'message')
+        widgets = {'message': forms.Textarea(attrs={'maxlength': 5000})}
+
+    def clean_message(self):
+        message = self.cleaned_data['message'].strip()
+        if len(message) > 5000:
+            raise forms.ValidationError("Mesaj en fazla 5000 karakter olabilir.")
+        return message
@@ -0,0 +1,93 @@
+import json
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import ImageField
+from PIL import Image, ImageOps, features
+
+VARIANT_ROOT = 'variants'
+VARIANT_WIDTHS = (320, 640, 960, 1280)
+IMAGE_CACHE_KEY = 'blog:image-variants:{}'
+
+# (uzantı, Pillow formatı, MIME tipi, kayıt parametreleri); tarayıcı ilk
+# desteklediği <source>'u seçtiği için en küçük format önce gelir.
+VARIANT_FORMATS = [
+    ('webp', 'WEBP', 'image/webp', {'quality': 80, 'method': 6}),
+    ('jpg', 'JPEG', 'image/jpeg', {'quality': 82, 'optimize': True, 'progressive': True}),
+]
+if features.check('avif'):
+    VARIANT_FORMATS.insert(0, ('avif', 'AVIF', 'image/avif', {'quality': 60}))
+
+
+def variant_base(name):
+    return f"{VARIANT_ROOT}/{PurePosixPath(name).with_suffix('')}"
+
+
+def manifest_name(name):
+    return f"{variant_base(name)}.json"
+
+
+def replace_file(storage, path, content):
+    if storage.exists(path):
+        storage.delete(path)
+    storage.save(path, ContentFile(content))
+
+
+def _prepare(image, pil_format):
+    if pil_format == 'JPEG':
+        if image.mode in ('RGBA', 'LA'):
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            return background
+        return image.convert('RGB') if image.mode != 'RGB' else image
+    if image.mode not in ('RGB', 'RGBA'):
+        return image.convert('RGBA' if 'A' in image.getbands() or 'transparency' in image.info else 'RGB')
+    return image
+
+
+def generate_variants(name, storage=default_storage):
+    with storage.open(name) as file:
+        image = ImageOps.exif_transpose(Image.open(file))
+        image.load()
+    width, height = image.size
+    widths = [w for w in VARIANT_WIDTHS if w < width] + [width]
+
+    variants = {}
+    for extension, pil_format, mime_type, params in VARIANT_FORMATS:
+        source = _prepare(image, pil_format)
+        entries = []
+        for variant_width in widths:
+            resized = source
+            if variant_width != width:
+                resized = source.resize((variant_width, round(height * variant_width / width)), Image.LANCZOS)
+            buffer = BytesIO()
+            resized.save(buffer, pil_format, **params)
+            path = f"{variant_base(name)}-{variant_width}w.{extension}"
+            replace_file(storage, path, buffer.getvalue())
+            entries.append([variant_width, path])
+        variants[extension] = {'type': mime_type, 'files': entries}
+
+    manifest = {'source': name, 'width': width, 'height': height, 'variants': variants}
+    replace_file(storage, manifest_name(name), json.dumps(manifest).encode())
+    cache.set(IMAGE_CACHE_KEY.format(name), manifest, None)
+    return manifest
+
+
+def get_variants(name, storage=default_storage):
+    manifest = cache.get(IMAGE_CACHE_KEY.format(name))
+    if manifest is None and storage.exists(manifest_name(name)):
+        with storage.open(manifest_name(name)) as file:
+            manifest = json.load(file)
+        cache.set(IMAGE_CACHE_KEY.format(name), manifest, None)
+    return manifest
+
+
+def ensure_variants(name, storage=default_storage):
+    return get_variants(name, storage) or generate_variants(name, storage)
+
+
+def image_field_names(model):
+    return [field.name for field in model._meta.fields if isinstance(field, ImageField)]
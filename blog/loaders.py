@@ -0,0 +1,179 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.db.models import Count, IntegerField, OuterRef, Prefetch, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.urls import reverse
+from django.utils.functional import SimpleLazyObject
+
+from .caching import stale_fragments
+from .pagination import keyset_page
+from .models import BlogPost, About, Education, Experience, Certificate, Project, Tag, CodeExample, ContactInfo, SkillCategory, Skill, ProjectCategory, CodeLanguage
+
+# Ana sayfanın satır sayısından bağımsız olarak çalıştırabileceği en fazla sorgu sayısı.
+# Yeni bir bölüm eklendiğinde bu sayı bilinçli olarak güncellenmelidir.
+HOMEPAGE_QUERY_BUDGET = 14
+
+# Ana sayfa bölümleri, sayfadaki sırasıyla.
+HOMEPAGE_SECTIONS = (
+    'sections/hero.html',
+    'sections/about.html',
+    'sections/education.html',
+    'sections/certificates.html',
+    'sections/skills.html',
+    'sections/projects.html',
+    'sections/contact.html',
+)
+
+# Ana sayfa bölümlerinin şablonda kullandığı bağlam değerleri.
+SECTION_CONTEXT = {
+    'sections/about.html': ('about', 'educations', 'experiences'),
+    'sections/education.html': ('educations', 'experiences', 'code_languages', 'code_groups'),
+    'sections/certificates.html': ('certificate_page',),
+    'sections/skills.html': ('skill_categories',),
+    'sections/projects.html': ('projects', 'project_categories'),
+    'sections/contact.html': ('contact_infos',),
+}
+
+CERTIFICATE_PREVIEW_COUNT = 6
+CERTIFICATE_FRAGMENT_SIZE = 12
+
+# Herkese açık sayımlarda yalnızca yayında olan içerik sayılır.
+PUBLIC_CONTENT_FILTERS = {BlogPost: {'is_published': True}}
+TAG_CLOUD_WEIGHTS = 5
+
+
+def annotate_tag_usage(queryset, models=None, public=False):
+    # Etiketi kullanan her m2m ara tablosu için ilişkili bir COUNT alt sorgusu
+    # eklenir ve toplanır: JOIN ile satırlar çoğalmaz, liste tek sorguda
+    # sayılır. Etiket alanı olan yeni bir model otomatik olarak dahil olur.
+    usage = Value(0)
+    for relation in Tag._meta.related_objects:
+        field = relation.field
+        if not relation.many_to_many or (models and field.model not in models):
+            continue
+        tag_column = field.m2m_reverse_field_name()
+        rows = field.remote_field.through.objects.filter(**{tag_column: OuterRef('pk')})
+        if public:
+            source = field.m2m_field_name()
+            rows = rows.filter(**{f'{source}__{name}': value for name, value in PUBLIC_CONTENT_FILTERS.get(field.model, {}).items()})
+        counts = rows.order_by().values(tag_column).annotate(count=Count('pk')).values('count')
+        usage = usage + Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+    return queryset.annotate(usage=usage)
+
+
+def tag_cloud(models=(BlogPost,)):
+    tags = list(annotate_tag_usage(Tag.objects.only('id', 'name', 'slug'), models, public=True).filter(usage__gt=0).order_by('name'))
+    if tags:
+        low = min(tag.usage for tag in tags)
+        spread = max(tag.usage for tag in tags) - low
+        for tag in tags:
+            tag.weight = 1 + (tag.usage - low) * (TAG_CLOUD_WEIGHTS - 1) // spread if spread else 1
+    return tags
+
+
+def group_code_examples(examples):
+    # (dil, kategori) çiftlerini ve örnek sayılarını tek sorguda döndürür;
+    # örneği olmayan çiftler listede hiç yer almaz. Örneklerin kendisi sekme
+    # görünür olduğunda /_fragments/code/ üzerinden yüklenir.
+    rows = (
+        examples.values('language_id', 'language__slug', 'category_id', 'category__slug', 'category__name')
+        .annotate(count=Count('id')).order_by('language_id', 'category_id')
+    )
+    return [
+        {
+            'language': {'id': row['language_id'], 'slug': row['language__slug']},
+            'category': {'id': row['category_id'], 'slug': row['category__slug'], 'name': row['category__name']},
+            'count': row['count'],
+        }
+        for row in rows
+    ]
+
+
+def certificate_page(after=None):
+    # Ana sayfada ilk sertifikalar gömülü gelir, kalanı bölüm görünür oldukça
+    # parça parça yüklenir.
+    per_page = CERTIFICATE_FRAGMENT_SIZE if after else CERTIFICATE_PREVIEW_COUNT
+    return keyset_page(Certificate.objects.all(), 'date', after=after, per_page=per_page)
+
+
+def fragment_paths():
+    paths = [
+        reverse('blog:code_fragment', args=[group['language']['slug'], group['category']['slug']])
+        for group in group_code_examples(CodeExample.objects.all())
+    ]
+    page = certificate_page()
+    while page['next_cursor']:
+        paths.append(reverse('blog:certificates_fragment', args=[page['next_cursor']]))
+        page = certificate_page(after=page['next_cursor'])
+    return paths
+
+
+def evaluated_once(queryset):
+    # Birden fazla bölümde kullanılan queryset'ler (ör. about.html'deki
+    # `educations.first`) ilk erişimde bir kez çalışır, sonra sonuç önbelleği
+    # kullanılır.
+    def load():
+        len(queryset)
+        return queryset
+    return SimpleLazyObject(load)
+
+
+def homepage_querysets():
+    tag_prefetch = Prefetch('tags', queryset=Tag.objects.only('id', 'name', 'slug'))
+    return {
+        'educations': Education.objects.prefetch_related(tag_prefetch),
+        'experiences': Experience.objects.prefetch_related(tag_prefetch),
+        'projects': Project.objects.select_related('category').prefetch_related(tag_prefetch),
+        'project_categories': ProjectCategory.objects.all(),
+        'code_languages': CodeLanguage.objects.annotate(example_count=Count('code_examples')).filter(example_count__gt=0).order_by('id'),
+        'tags': Tag.objects.all(),
+        'contact_infos': ContactInfo.objects.all(),
+        'skill_categories': SkillCategory.objects.prefetch_related(
+            Prefetch('skills', queryset=Skill.objects.order_by('order'))
+        ),
+    }
+
+
+def load_homepage():
+    querysets = homepage_querysets()
+    # Değerler tembeldir: bölüm önbellekten geldiğinde (bkz. cached_section)
+    # o bölümün sorguları hiç çalışmaz.
+    return dict(
+        querysets,
+        homepage_sections=HOMEPAGE_SECTIONS,
+        about=SimpleLazyObject(About.objects.first),
+        educations=evaluated_once(querysets['educations']),
+        experiences=evaluated_once(querysets['experiences']),
+        certificate_page=SimpleLazyObject(certificate_page),
+        code_groups=SimpleLazyObject(lambda: group_code_examples(CodeExample.objects.all())),
+    )
+
+
+async def _fetched(queryset):
+    # async for sonuç önbelleğini (prefetch dahil) doldurur; şablon aynı
+    # queryset'i yeniden sorgu atmadan dolaşır.
+    async for _ in queryset:
+        pass
+    return queryset
+
+
+async def aload_homepage(context=None):
+    # Önbellekte olmayan bölümlerin verisi şablon işlenmeden önce async ORM
+    # ile birlikte istenir; önbellekteki bölümler için sorgu atılmaz.
+    if context is None:
+        context = load_homepage()
+    stale = stale_fragments(list(SECTION_CONTEXT))
+    names = {name for template_name in stale for name in SECTION_CONTEXT[template_name]}
+    querysets = homepage_querysets()
+    loaders = {
+        'about': About.objects.afirst,
+        'certificate_page': sync_to_async(certificate_page),
+        'code_groups': sync_to_async(lambda: group_code_examples(CodeExample.objects.all())),
+    }
+    names = sorted(names)
+    values = await asyncio.gather(*(
+        loaders[name]() if name in loaders else _fetched(querysets[name]) for name in names
+    ))
+    context.update(zip(names, values))
+    return context
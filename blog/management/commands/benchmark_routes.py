@@ -0,0 +1,126 @@
+import json
+import platform
+import time
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import override_settings, setup_databases, teardown_databases
+
+from blog.benchmark import BENCHMARK_HOST, SERVERS, baseline_entry, compare_results, measure_route, route_paths, run_server, seed_dataset
+
+DEFAULT_BASELINE = Path(settings.BASE_DIR) / 'benchmarks' / 'baseline.json'
+
+# Ölçüm geçici bir test veritabanında ve süreç içi önbellekle yapılır;
+# geliştirme veritabanına ve dosya önbelleğine dokunulmaz. Static adresleri
+# collectstatic manifest'i gerektirmeden üretilir.
+BENCHMARK_SETTINGS = {
+    'DEBUG': False,
+    'ALLOWED_HOSTS': [BENCHMARK_HOST, 'testserver'],
+    'CACHES': {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'stamps': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'stamps'},
+    },
+    'STORAGES': {
+        'default': settings.STORAGES['default'],
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    },
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Sentetik veriyle blog/urls.py'deki her adresin gecikmesini, istek başına sorgu sayısını ve bellek "
+        "kullanımını ölçer; sonucu JSON olarak yazar ve sorgu sayılarını kayıtlı temel ölçümle karşılaştırır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('routes', nargs='*', help="Ölçülecek adres adları (varsayılan: hepsi)")
+        parser.add_argument('--rows', type=int, default=100, help="Her içerik modeli için üretilecek kayıt sayısı (ör. 10, 1000, 50000)")
+        parser.add_argument('--iterations', type=int, default=5, help="Adres başına soğuk ve sıcak istek sayısı")
+        parser.add_argument('--requests', type=int, default=200, help="Yük testinde adres başına istek sayısı (0: yük testi yok)")
+        parser.add_argument('--concurrency', type=int, default=8, help="Yük testinde aynı anda çalışan istemci sayısı")
+        parser.add_argument('--servers', default='http', help=f"Yük testi sunucuları, virgülle ayrılmış: {', '.join(SERVERS)}")
+        parser.add_argument('--output', help="Sonucun yazılacağı JSON dosyası")
+        parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help="Temel ölçüm dosyası (ölçek başına bir kayıt)")
+        parser.add_argument('--tolerance', type=float, default=0.5, help="Süre ve bellek uyarıları için kabul edilen oransal artış")
+        parser.add_argument('--update-baseline', action='store_true', help="Bu ölçeğin temel ölçümünü sonuçla değiştir")
+
+    def handle(self, *args, **options):
+        servers = [name.strip() for name in options['servers'].split(',') if name.strip()] if options['requests'] else []
+        unknown = [name for name in servers if name not in SERVERS]
+        if unknown:
+            raise CommandError(f"Bilinmeyen sunucu: {', '.join(unknown)}")
+
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            with override_settings(**BENCHMARK_SETTINGS):
+                result = self.run_suite(options, servers)
+        finally:
+            teardown_databases(old_config, verbosity=0)
+
+        if options['output']:
+            Path(options['output']).write_text(json.dumps(result, indent=2, ensure_ascii=False, sort_keys=True) + '\n')
+        self.check_baseline(result, options)
+
+    def run_suite(self, options, servers):
+        started = time.perf_counter()
+        seed_dataset(options['rows'])
+        self.stdout.write(f"{options['rows']} satırlık veri {time.perf_counter() - started:.1f} sn'de üretildi.")
+
+        paths, missing = route_paths()
+        if missing:
+            raise CommandError(f"blog.benchmark.ROUTE_SAMPLES'ta örnek istek yok: {', '.join(missing)}")
+        if options['routes']:
+            unknown = [name for name in options['routes'] if name not in paths]
+            if unknown:
+                raise CommandError(f"Bilinmeyen adres: {', '.join(unknown)}")
+            paths = {name: paths[name] for name in options['routes']}
+
+        client = Client()
+        routes = {}
+        self.stdout.write(
+            f"{'adres':<22} {'kod':>4} {'soğuk ms':>9} {'sıcak ms':>9} {'sorgu':>7} {'KiB':>8}"
+            + ''.join(f" {name + ' istek/sn':>16}" for name in servers)
+        )
+        for name, path in paths.items():
+            if path is None:
+                self.stdout.write(f"{name:<22} veri yetersiz, atlandı")
+                continue
+            route = measure_route(client, path, options['iterations'])
+            route['load'] = {server: run_server(server, path, options['requests'], options['concurrency']) for server in servers}
+            routes[name] = route
+            self.stdout.write(
+                f"{name:<22} {route['status']:>4} {route['cold_min_ms']:>9.1f} {route['warm_min_ms']:>9.1f} "
+                f"{route['cold_queries']:>3}/{route['warm_queries']:<3} {route['peak_kib']:>8.0f}"
+                + ''.join(f" {route['load'][server]['rps']:>16.1f}" for server in servers)
+            )
+        return {
+            'rows': options['rows'],
+            'iterations': options['iterations'],
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'routes': routes,
+        }
+
+    def check_baseline(self, result, options):
+        path = Path(options['baseline'])
+        baselines = json.loads(path.read_text()) if path.exists() else {}
+        scale = str(result['rows'])
+        if options['update_baseline']:
+            baselines[scale] = baseline_entry(result)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(baselines, indent=2, ensure_ascii=False, sort_keys=True) + '\n')
+            self.stdout.write(f"Temel ölçüm güncellendi: {path} ({scale} satır)")
+            return
+        if scale not in baselines:
+            self.stdout.write(f"{scale} satır için temel ölçüm yok; --update-baseline ile kaydedilebilir.")
+            return
+        regressions, warnings = compare_results(result, baselines[scale], options['tolerance'])
+        for warning in warnings:
+            self.stdout.write(self.style.WARNING(f"Uyarı (yalnızca bilgi): {warning}"))
+        if regressions:
+            raise CommandError("Temel ölçüme göre sorgu sayısında gerileme:\n" + '\n'.join(regressions))
+        self.stdout.write(self.style.SUCCESS(f"Temel ölçüme göre gerileme yok ({scale} satır)."))
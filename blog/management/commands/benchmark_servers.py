@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from blog.benchmark import SERVERS, run_server
+from blog.models import BlogPost, Project
+
+
+def default_paths():
+    paths = [reverse('blog:index'), reverse('blog:api_list', args=['projects'])]
+    project = Project.objects.exclude(slug='').only('slug').first()
+    if project:
+        paths.append(reverse('blog:project_detail', args=[project.slug]))
+    post = BlogPost.objects.filter(is_published=True).exclude(slug='').only('slug').first()
+    if post:
+        paths.append(reverse('blog:blog_detail', args=[post.slug]))
+    return paths
+
+
+class Command(BaseCommand):
+    help = "Aynı adresleri süreç içi WSGI ve ASGI handler'ları üzerinden eşzamanlı isteklerle ölçer (istek/sn, p50, p99)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='*', help="Ölçülecek adresler (varsayılan: ana sayfa, proje API'si ve birer detay sayfası)")
+        parser.add_argument('--requests', type=int, default=200, help="Adres ve sunucu başına istek sayısı")
+        parser.add_argument('--concurrency', type=int, default=8, help="Aynı anda işlenen istek sayısı")
+        parser.add_argument('--servers', default='wsgi,asgi', help="Virgülle ayrılmış: http (runserver sunucusuna gerçek HTTP istekleri), wsgi, asgi (async view'lar), asgi-sync (ASGI altında senkron view'lar)")
+        parser.add_argument('--cold', action='store_true', help="Önbelleği devre dışı bırakıp her isteği baştan üret")
+
+    def handle(self, *args, **options):
+        paths = options['paths'] or default_paths()
+        servers = [name.strip() for name in options['servers'].split(',') if name.strip()]
+        unknown = [name for name in servers if name not in SERVERS]
+        if unknown:
+            raise CommandError(f"Bilinmeyen sunucu: {', '.join(unknown)}")
+        caches = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}, 'stamps': settings.CACHES['stamps']} if options['cold'] else None
+
+        self.stdout.write(f"{'sunucu':<9} {'adres':<40} {'istek/sn':>9} {'p50 ms':>8} {'p99 ms':>8} {'hata':>5}")
+        for path in paths:
+            for name in servers:
+                # Isınma: şablon derleme, bağlantı açma ve sayfa önbelleği.
+                with override_settings(CACHES=caches) if caches else override_settings():
+                    run_server(name, path, options['concurrency'], options['concurrency'])
+                    result = run_server(name, path, options['requests'], options['concurrency'])
+                self.stdout.write(
+                    f"{name:<9} {path[:40]:<40} {result['rps']:>9.1f} {result['p50_ms']:>8.1f} {result['p99_ms']:>8.1f} {result['errors']:>5}"
+                )
@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.transfer import DEFAULT_BATCH_SIZE, TransferError, content_models, export_csv, export_jsonl, get_model
+
+
+class Command(BaseCommand):
+    help = "İçeriği JSONL (tek dosya) ya da CSV (model başına bir dosya) olarak dışa aktarır."
+
+    def add_arguments(self, parser):
+        parser.add_argument('output', nargs='?', default='-', help="JSONL dosyası ('-' standart çıktı) ya da CSV dizini")
+        parser.add_argument('--format', choices=('jsonl', 'csv'), default='jsonl')
+        parser.add_argument('--models', nargs='+', help="Yalnızca bu modeller (ör. project tag)")
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            selected = {get_model(name) for name in options['models']} if options['models'] else None
+        except TransferError as exc:
+            raise CommandError(exc)
+        models = [model for model in content_models() if selected is None or model in selected]
+        output, batch_size = options['output'], options['batch_size']
+
+        if options['format'] == 'csv':
+            if output == '-':
+                raise CommandError("CSV çıktısı için bir dizin belirtin.")
+            directory = Path(output)
+            directory.mkdir(parents=True, exist_ok=True)
+            count = 0
+            for model in models:
+                with open(directory / f'{model._meta.model_name}.csv', 'w', newline='', encoding='utf-8') as stream:
+                    count += export_csv(stream, model, batch_size)
+        elif output == '-':
+            count = export_jsonl(sys.stdout, models, batch_size)
+        else:
+            with open(output, 'w', encoding='utf-8') as stream:
+                count = export_jsonl(stream, models, batch_size)
+        self.stderr.write(self.style.SUCCESS(f"{count} kayıt dışa aktarıldı."))
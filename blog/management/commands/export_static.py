@@ -0,0 +1,143 @@
+import json
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+from django.utils import timezone
+
+from blog.caching import get_content_generation, get_chrome_version
+from blog.loaders import fragment_paths
+from blog.models import BlogPost, Project, CodeExample, Skill, Certificate, Category, SubCategory, Tag
+from blog.views import published_posts
+
+STATE_FILE = '.export-state.json'
+
+# Sayfası olan modeller ve detay URL adları.
+DETAIL_PAGES = (
+    (Project.objects.all(), 'blog:project_detail'),
+    (CodeExample.objects.all(), 'blog:codeexample_detail'),
+    (Skill.objects.all(), 'blog:skill_detail'),
+    (Certificate.objects.all(), 'blog:certificate_detail'),
+    (BlogPost.objects.filter(is_published=True), 'blog:blog_detail'),
+)
+LIST_PAGES = ('blog:index', 'blog:about', 'blog:skills', 'blog:projects', 'blog:blog_list')
+
+
+def archive_paths():
+    # Yazılardan bağlantı verilen kategori, alt kategori, etiket ve ay
+    # sayfaları; yalnızca yayınlanmış yazısı olanlar. Sayfalama (?after=)
+    # sorgu dizgisiyle çalıştığı için statik çıktıda yalnızca ilk sayfa var.
+    posts = published_posts()
+    paths = [reverse('blog:blog_category', args=[slug]) for slug in Category.objects.filter(posts__in=posts).values_list('slug', flat=True).distinct()]
+    paths += [reverse('blog:blog_subcategory', args=[slug]) for slug in SubCategory.objects.filter(posts__in=posts).values_list('slug', flat=True).distinct()]
+    paths += [reverse('blog:blog_tag', args=[slug]) for slug in Tag.objects.filter(blog_tags__in=posts).values_list('slug', flat=True).distinct()]
+    paths += [reverse('blog:blog_month', args=[month.year, month.month]) for month in posts.datetimes('published_at', 'month')]
+    return paths
+
+
+class Command(BaseCommand):
+    help = "Siteyi nginx tarafından doğrudan sunulabilecek statik HTML dosyalarına dışa aktarır."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default=str(settings.BASE_DIR / 'static_export'), help="Çıktı dizini")
+        parser.add_argument('--full', action='store_true', help="Değişmemiş sayfalar dahil her şeyi yeniden üret")
+        parser.add_argument('--no-assets', action='store_true', help="Static ve media dosyalarını kopyalama")
+
+    def handle(self, *args, **options):
+        output = Path(options['output'])
+        output.mkdir(parents=True, exist_ok=True)
+        state_path = output / STATE_FILE
+        previous = {} if options['full'] or not state_path.exists() else json.loads(state_path.read_text())
+
+        generation = get_content_generation()
+        chrome_version = get_chrome_version()
+        exported_at = previous.get('exported_at')
+        since = datetime.fromisoformat(exported_at) if exported_at else None
+        # Navbar/site ayarları her sayfada olduğu için değişirlerse tüm site yeniden üretilir.
+        full = since is None or previous.get('chrome_version') != chrome_version
+        content_changed = full or previous.get('generation') != generation
+        previous_pages = set(previous.get('pages', []))
+        started_at = timezone.now()
+
+        pages = {reverse(name): content_changed for name in LIST_PAGES}
+        # Ana sayfanın sonradan yüklediği bölüm parçaları da dışa aktarılır.
+        pages.update({path: content_changed for path in fragment_paths()})
+        pages.update({path: content_changed for path in archive_paths()})
+        for queryset, url_name in DETAIL_PAGES:
+            has_updated_at = any(field.name == 'updated_at' for field in queryset.model._meta.fields)
+            fields = ('slug', 'updated_at') if has_updated_at else ('slug',)
+            for row in queryset.values(*fields):
+                path = reverse(url_name, args=[row['slug']])
+                if full or path not in previous_pages:
+                    changed = True
+                elif has_updated_at:
+                    changed = row['updated_at'] > since
+                else:
+                    changed = content_changed
+                pages[path] = changed
+
+        factory = RequestFactory()
+        written = failed = 0
+        for path, changed in pages.items():
+            if not changed:
+                continue
+            try:
+                content = self.render(factory, path)
+            except Exception as exc:
+                failed += 1
+                self.stderr.write(f"{path}: {exc}")
+                continue
+            target = self.target_for(output, path)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(content)
+            written += 1
+
+        for path in previous_pages - set(pages):
+            target = self.target_for(output, path)
+            if target.exists():
+                target.unlink()
+
+        if not options['no_assets']:
+            call_command('collectstatic', interactive=False, verbosity=0)
+            self.sync_tree(Path(settings.STATIC_ROOT), output / settings.STATIC_URL.strip('/'))
+            self.sync_tree(Path(settings.MEDIA_ROOT), output / settings.MEDIA_URL.strip('/'))
+
+        state_path.write_text(json.dumps({
+            'exported_at': started_at.isoformat(),
+            'generation': generation,
+            'chrome_version': chrome_version,
+            'pages': sorted(pages),
+        }, indent=2))
+        self.stdout.write(self.style.SUCCESS(
+            f"{written} sayfa yazıldı, {len(pages) - written - failed} sayfa değişmedi, {failed} hata."
+        ))
+
+    def render(self, factory, path):
+        request = factory.get(path)
+        match = resolve(path)
+        view = async_to_sync(match.func) if iscoroutinefunction(match.func) else match.func
+        response = view(request, *match.args, **match.kwargs)
+        if response.status_code != 200:
+            raise ValueError(f"HTTP {response.status_code}")
+        return b''.join(response) if response.streaming else response.content
+
+    def target_for(self, output, path):
+        return output / path.strip('/') / 'index.html'
+
+    def sync_tree(self, source, destination):
+        if not source.exists():
+            return
+        for file in source.rglob('*'):
+            if not file.is_file():
+                continue
+            target = destination / file.relative_to(source)
+            if target.exists() and target.stat().st_mtime >= file.stat().st_mtime and target.stat().st_size == file.stat().st_size:
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(file, target)
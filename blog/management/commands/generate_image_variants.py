@@ -0,0 +1,29 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from blog.images import ensure_variants, generate_variants, image_field_names
+
+
+class Command(BaseCommand):
+    help = "Mevcut görseller için boyut ve format türevlerini (srcset) üretir."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help="Türevi olan görselleri de yeniden üret")
+
+    def handle(self, *args, **options):
+        generate = generate_variants if options['force'] else ensure_variants
+        count = 0
+        for model in apps.get_app_config('blog').get_models():
+            fields = image_field_names(model)
+            if not fields:
+                continue
+            for row in model.objects.values_list(*fields):
+                for name in row:
+                    if not name:
+                        continue
+                    try:
+                        generate(name)
+                        count += 1
+                    except OSError as exc:
+                        self.stderr.write(f"{name}: {exc}")
+        self.stdout.write(self.style.SUCCESS(f"{count} görsel işlendi."))
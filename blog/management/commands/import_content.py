@@ -0,0 +1,50 @@
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.transfer import DEFAULT_BATCH_SIZE, TransferError, content_models, get_model, import_records, read_csv, read_jsonl
+
+
+class Command(BaseCommand):
+    help = "export_content çıktısını (JSONL dosyası, CSV dosyası ya da CSV dizini) toplu yazarak içe aktarır."
+
+    def add_arguments(self, parser):
+        parser.add_argument('source', help="JSONL dosyası ('-' standart girdi), <model>.csv dosyası ya da CSV dizini")
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument('--no-reindex', action='store_true', help="Arama indeksini yeniden oluşturma")
+
+    def handle(self, *args, **options):
+        source = options['source']
+        with ExitStack() as stack:
+            if source == '-':
+                records = read_jsonl(sys.stdin)
+            elif Path(source).is_dir():
+                # Dosyalar ilişki sırasına göre (önce etiket ve kategoriler) okunur.
+                records = self.read_directory(stack, Path(source))
+            elif source.endswith('.csv'):
+                stream = stack.enter_context(open(source, newline='', encoding='utf-8'))
+                records = read_csv(stream, self.model_for(Path(source)))
+            else:
+                records = read_jsonl(stack.enter_context(open(source, encoding='utf-8')))
+            try:
+                counts = import_records(records, options['batch_size'], reindex=not options['no_reindex'])
+            except TransferError as exc:
+                raise CommandError(exc)
+
+        for model, count in counts.items():
+            self.stdout.write(f"{model._meta.verbose_name_plural}: {count}")
+        self.stdout.write(self.style.SUCCESS(f"{sum(counts.values())} kayıt içe aktarıldı."))
+
+    def model_for(self, path):
+        try:
+            return get_model(path.stem)
+        except TransferError as exc:
+            raise CommandError(exc)
+
+    def read_directory(self, stack, directory):
+        for model in content_models():
+            path = directory / f'{model._meta.model_name}.csv'
+            if path.exists():
+                yield from read_csv(stack.enter_context(open(path, newline='', encoding='utf-8')), model)
@@ -0,0 +1,35 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from blog.models import ImageJob
+from blog.tasks import run_job
+
+
+class Command(BaseCommand):
+    help = "Bekleyen görsel türevi işlerini çalıştırır; hatalı veya tamamlanmış işleri yeniden çalıştırabilir."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--retry-failed', action='store_true', help="Hatalı işleri yeniden dene")
+        parser.add_argument('--rerun', action='store_true', help="Tamamlanmış işler dahil tüm türevleri yeniden üret")
+        parser.add_argument('--stale-minutes', type=int, default=15, help="Bu süreden uzun 'işleniyor' kalan işleri beklemeye al")
+
+    def handle(self, *args, **options):
+        stale_before = timezone.now() - timedelta(minutes=options['stale_minutes'])
+        ImageJob.objects.filter(status=ImageJob.STATUS_RUNNING, updated_at__lt=stale_before).update(status=ImageJob.STATUS_PENDING)
+
+        statuses = [ImageJob.STATUS_PENDING]
+        if options['retry_failed'] or options['rerun']:
+            statuses.append(ImageJob.STATUS_FAILED)
+        if options['rerun']:
+            statuses.append(ImageJob.STATUS_DONE)
+        job_ids = list(ImageJob.objects.filter(status__in=statuses).order_by('created_at').values_list('id', flat=True))
+
+        done = failed = 0
+        for job_id in job_ids:
+            if run_job(job_id, force=options['rerun'] or options['retry_failed']):
+                done += 1
+            else:
+                failed += 1
+        self.stdout.write(self.style.SUCCESS(f"{done} iş tamamlandı, {failed} iş başarısız."))
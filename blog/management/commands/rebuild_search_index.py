@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from blog.search import rebuild_index, use_fts
+
+
+class Command(BaseCommand):
+    help = "Arama indeksini tüm içerikten yeniden oluşturur."
+
+    def handle(self, *args, **options):
+        count = rebuild_index()
+        backend = "FTS5" if use_fts() else "terim tablosu"
+        self.stdout.write(self.style.SUCCESS(f"{count} kayıt indekslendi ({backend})."))
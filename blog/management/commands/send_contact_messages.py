@@ -0,0 +1,31 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from blog.contact import MAIL_BATCH_SIZE, deliver_pending
+from blog.models import ContactMessage
+
+
+class Command(BaseCommand):
+    help = "Bekleyen iletişim mesajlarını toplu olarak e-posta ile gönderir."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--retry-failed', action='store_true', help="Hatalı mesajları yeniden dene")
+        parser.add_argument('--batch-size', type=int, default=MAIL_BATCH_SIZE, help="Tek SMTP bağlantısında gönderilecek mesaj sayısı")
+        parser.add_argument('--stale-minutes', type=int, default=15, help="Bu süreden uzun 'gönderiliyor' kalan mesajları beklemeye al")
+
+    def handle(self, *args, **options):
+        stale_before = timezone.now() - timedelta(minutes=options['stale_minutes'])
+        ContactMessage.objects.filter(status=ContactMessage.STATUS_SENDING, updated_at__lt=stale_before).update(status=ContactMessage.STATUS_PENDING)
+        if options['retry_failed']:
+            ContactMessage.objects.filter(status=ContactMessage.STATUS_FAILED).update(status=ContactMessage.STATUS_PENDING, attempts=0)
+
+        sent = 0
+        while True:
+            count = deliver_pending(options['batch_size'])
+            if not count:
+                break
+            sent += count
+        failed = ContactMessage.objects.filter(status=ContactMessage.STATUS_FAILED).count()
+        self.stdout.write(self.style.SUCCESS(f"{sent} mesaj gönderildi, {failed} mesaj başarısız."))
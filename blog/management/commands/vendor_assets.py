@@ -0,0 +1,59 @@
+import hashlib
+from pathlib import Path
+from urllib.request import urlopen
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.storage import VENDOR_ASSETS, VENDOR_FILES, VENDOR_SHA256
+
+
+class Command(BaseCommand):
+    help = "CDN'den yüklenen kütüphaneleri (AOS, Font Awesome, Typed.js) static/vendor altına indirir ve sha256 özetlerini doğrular."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help="Var olan dosyaları yeniden indir")
+        parser.add_argument(
+            '--print-hashes', action='store_true',
+            help="Özeti sabitlenmemiş dosyaları indirip VENDOR_SHA256 için sha256 satırlarını yazdır (dosya yazılmaz)",
+        )
+
+    def handle(self, *args, **options):
+        static_dir = Path(settings.STATICFILES_DIRS[0])
+        files = list(VENDOR_ASSETS.values()) + VENDOR_FILES
+        if options['print_hashes']:
+            # Çıktı, dosyalar sürüm notlarıyla karşılaştırıldıktan sonra
+            # blog/storage.py içindeki VENDOR_SHA256'ya eklenir.
+            for local_path, url in files:
+                if local_path not in VENDOR_SHA256:
+                    with urlopen(url, timeout=30) as response:
+                        digest = hashlib.sha256(response.read()).hexdigest()
+                    self.stdout.write(f"    '{local_path}': '{digest}',  # {url}")
+            return
+        ready = failed = 0
+        for local_path, url in files:
+            expected = VENDOR_SHA256.get(local_path)
+            if expected is None:
+                self.stdout.write(f"{local_path}: sabitlenmiş sha256 yok, CDN kullanılmaya devam edilecek.")
+                continue
+            target = static_dir / local_path
+            if target.exists() and not options['force']:
+                if hashlib.sha256(target.read_bytes()).hexdigest() != expected:
+                    failed += 1
+                    self.stderr.write(f"{local_path}: yerel dosyanın özeti uyuşmuyor; --force ile yeniden indirin.")
+                else:
+                    ready += 1
+                continue
+            with urlopen(url, timeout=30) as response:
+                content = response.read()
+            if hashlib.sha256(content).hexdigest() != expected:
+                failed += 1
+                self.stderr.write(f"{url}: indirilen dosyanın özeti uyuşmuyor, yazılmadı.")
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(content)
+            ready += 1
+            self.stdout.write(f"{url} -> {local_path}")
+        if failed:
+            raise CommandError(f"{failed} dosya doğrulanamadı.")
+        self.stdout.write(self.style.SUCCESS(f"{ready} dosya hazır. Ardından `collectstatic` çalıştırın."))
@@ -0,0 +1,218 @@
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.template.backends.django import DjangoTemplates
+from django.template.engine import Engine
+
+from .caching import fragment_stats
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Metrik adı -> açıklama. Hepsi view adına göre ayrılan summary'lerdir;
+# yüzdelikler son REQUEST_METRICS_WINDOW örnekten, _sum ve _count süreç
+# başından beri hesaplanır.
+SUMMARIES = {
+    'blog_request_duration_seconds': 'İsteğin middleware içinde geçen toplam süresi',
+    'blog_request_db_queries': 'İstek başına veritabanı sorgusu sayısı',
+    'blog_request_db_seconds': 'İstek başına veritabanı sorgularının toplam süresi',
+    'blog_response_size_bytes': 'Yanıt gövdesinin boyutu',
+    'blog_template_render_seconds': 'İstek başına şablonun (içindeki parçalar dahil) işlenme süresi',
+}
+
+current_request = ContextVar('blog_request_metrics', default=None)
+
+SERVER_TIMING_TOKEN_RE = re.compile(r"[^A-Za-z0-9!#$%&'*+.^_`|~-]")
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class Summary:
+    def __init__(self):
+        self.window = deque(maxlen=settings.REQUEST_METRICS_WINDOW)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value):
+        self.window.append(value)
+        self.count += 1
+        self.total += value
+
+
+_lock = threading.Lock()
+_summaries = defaultdict(Summary)
+_requests = defaultdict(int)
+
+
+def reset_metrics():
+    with _lock:
+        _summaries.clear()
+        _requests.clear()
+
+
+class RequestMetrics:
+    # Tek bir isteğin ölçümleri. Sorgular connection.execute_wrapper ile,
+    # şablonlar InstrumentedEngine üzerinden current_request'e yazılır.
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.templates = defaultdict(float)
+        self.cache_status = None
+
+    def record_query(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += time.perf_counter() - start
+
+    def database_wrappers(self):
+        # Bağlantılar thread'e özeldir; sarmalayıcılar sorguların çalışacağı
+        # thread'de eklenmelidir.
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(self.record_query))
+        return stack
+
+    def server_timing(self):
+        elapsed = time.perf_counter() - self.started
+        entries = [f'total;dur={elapsed * 1000:.1f}', f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} sorgu"']
+        for template_name, seconds in self.templates.items():
+            entries.append(f'tpl-{SERVER_TIMING_TOKEN_RE.sub("-", template_name)};dur={seconds * 1000:.1f};desc="{template_name}"')
+        if self.cache_status:
+            entries.append(f'cache;desc={self.cache_status}')
+        return ', '.join(entries)
+
+    def finish(self, view_name, status_code, size):
+        labels = (('view', view_name),)
+        with _lock:
+            _summaries['blog_request_duration_seconds', labels].observe(time.perf_counter() - self.started)
+            _summaries['blog_request_db_queries', labels].observe(self.queries)
+            _summaries['blog_request_db_seconds', labels].observe(self.db_time)
+            _summaries['blog_response_size_bytes', labels].observe(size)
+            for template_name, seconds in self.templates.items():
+                _summaries['blog_template_render_seconds', labels + (('template', template_name),)].observe(seconds)
+            _requests[view_name, self.cache_status or 'none', str(status_code)] += 1
+
+    # Akışın her parçası ölçüm bağlamı içinde üretilir; bağlam değişkeni
+    # parçalar arasında (yield sırasında) açık bırakılmaz.
+    def _next(self, iterator):
+        token = current_request.set(self)
+        try:
+            return next(iterator, None)
+        finally:
+            current_request.reset(token)
+
+    async def _anext(self, iterator):
+        token = current_request.set(self)
+        try:
+            return await anext(iterator, None)
+        finally:
+            current_request.reset(token)
+
+    def measure_stream(self, response, view_name):
+        # Parça parça gönderilen yanıt akış bitince kaydedilir; ana sayfa
+        # bölümlerinin sorguları ve şablonları da böylece ölçüme girer.
+        source, status_code = response.streaming_content, response.status_code
+
+        if response.is_async:
+            async def chunks():
+                iterator, size = aiter(source), 0
+                # Async view'ın sorguları isteğin senkron thread'inde çalışır.
+                stack = await sync_to_async(self.database_wrappers)()
+                with stack:
+                    while (chunk := await self._anext(iterator)) is not None:
+                        size += len(chunk)
+                        yield chunk
+                self.finish(view_name, status_code, size)
+        else:
+            def chunks():
+                iterator, size = iter(source), 0
+                with self.database_wrappers():
+                    while (chunk := self._next(iterator)) is not None:
+                        size += len(chunk)
+                        yield chunk
+                self.finish(view_name, status_code, size)
+        response.streaming_content = chunks()
+
+
+class TimedTemplate:
+    def __init__(self, template):
+        self.wrapped = template
+
+    def __getattr__(self, name):
+        return getattr(self.wrapped, name)
+
+    def render(self, context):
+        metrics = current_request.get()
+        if metrics is None:
+            return self.wrapped.render(context)
+        start = time.perf_counter()
+        try:
+            return self.wrapped.render(context)
+        finally:
+            metrics.templates[self.wrapped.name] += time.perf_counter() - start
+
+
+class InstrumentedEngine(Engine):
+    # {% include %}, {% cached_section %} ve render() şablonlarını
+    # context.template.engine.get_template() üzerinden alır; her parçanın
+    # süresi ayrı ölçülür.
+    def get_template(self, template_name):
+        return TimedTemplate(super().get_template(template_name))
+
+
+class InstrumentedTemplates(DjangoTemplates):
+    def __init__(self, params):
+        super().__init__(params)
+        # Engine'in kurulumu (kütüphaneler, yükleyiciler) aynen kalır;
+        # yalnızca get_template() davranışı değişir.
+        self.engine.__class__ = InstrumentedEngine
+
+
+def _label_value(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels):
+    return '{' + ','.join(f'{name}="{_label_value(value)}"' for name, value in labels) + '}'
+
+
+def render_metrics():
+    # Prometheus metin biçimi (0.0.4).
+    with _lock:
+        summaries = {key: (list(summary.window), summary.total, summary.count) for key, summary in _summaries.items()}
+        requests = dict(_requests)
+    fragments = {template_name: dict(counts) for template_name, counts in list(fragment_stats.items())}
+
+    lines = ['# HELP blog_requests_total View, önbellek durumu ve yanıt koduna göre istek sayısı', '# TYPE blog_requests_total counter']
+    for (view_name, cache_status, status_code), count in sorted(requests.items()):
+        lines.append(f"blog_requests_total{_labels((('view', view_name), ('cache', cache_status), ('status', status_code)))} {count}")
+    for name, description in SUMMARIES.items():
+        lines += [f'# HELP {name} {description}', f'# TYPE {name} summary']
+        for (metric, labels), (window, total, count) in sorted(summaries.items()):
+            if metric != name:
+                continue
+            for quantile in QUANTILES:
+                lines.append(f'{name}{_labels(labels + (("quantile", quantile),))} {percentile(window, quantile)}')
+            lines.append(f'{name}_sum{_labels(labels)} {total}')
+            lines.append(f'{name}_count{_labels(labels)} {count}')
+    lines += ['# HELP blog_fragment_cache_total Ana sayfa bölüm önbelleği isabet ve ıskalamaları', '# TYPE blog_fragment_cache_total counter']
+    for template_name, counts in sorted(fragments.items()):
+        for result in ('hits', 'misses'):
+            lines.append(f"blog_fragment_cache_total{_labels((('template', template_name), ('result', result)))} {counts[result]}")
+    return '\n'.join(lines) + '\n'
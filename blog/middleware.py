@@ -0,0 +1,108 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.urls import reverse
+
+from .metrics import RequestMetrics, current_request
+from .routers import use_primary
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class RequestMetricsMiddleware:
+    # Listenin başında durur: süre diğer middleware'leri de kapsar. Server-Timing
+    # başlığı DEBUG'da, personele ya da REQUEST_METRICS_SERVER_TIMING açıksa
+    # eklenir; view başına dağılımlar admin'deki metrik adresinden okunur
+    # (bkz. blog.metrics). ASGI'de async çalışır; async view'lar ve önbellek
+    # isabetleri olay döngüsünden çıkmaz.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_METRICS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = current_request.set(metrics)
+        try:
+            with metrics.database_wrappers():
+                response = self.get_response(request)
+        finally:
+            current_request.reset(token)
+        show_timing = self.timing_for_everyone() or getattr(getattr(request, 'user', None), 'is_staff', False)
+        return self.record(request, response, metrics, show_timing)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = current_request.set(metrics)
+        # Sorgular isteğin senkron thread'inde çalışır; sarmalayıcılar o
+        # thread'in bağlantılarına eklenir.
+        stack = await sync_to_async(metrics.database_wrappers)()
+        try:
+            with stack:
+                response = await self.get_response(request)
+        finally:
+            current_request.reset(token)
+        # request.user oturumu veritabanından okuyabilir; olay döngüsünde auser() kullanılır.
+        show_timing = self.timing_for_everyone() or (hasattr(request, 'auser') and (await request.auser()).is_staff)
+        return self.record(request, response, metrics, show_timing)
+
+    def timing_for_everyone(self):
+        return settings.REQUEST_METRICS_SERVER_TIMING or settings.DEBUG
+
+    def record(self, request, response, metrics, show_timing):
+        view_name = request.resolver_match.view_name if request.resolver_match else 'unresolved'
+        metrics.cache_status = getattr(response, 'cache_status', None)
+        if show_timing:
+            # Akan yanıtlarda başlık ilk parçaya kadar geçen süreyi gösterir.
+            response['Server-Timing'] = metrics.server_timing()
+        if getattr(response, 'file_to_stream', None) is not None:
+            # FileResponse sarılmaz; sunucu dosyayı sendfile ile gönderebilir.
+            metrics.finish(view_name, response.status_code, int(response.get('Content-Length', 0)))
+        elif response.streaming:
+            metrics.measure_stream(response, view_name)
+        else:
+            metrics.finish(view_name, response.status_code, len(response.content))
+        return response
+
+
+class PrimaryDatabaseMiddleware:
+    # Admin ve veri değiştiren (POST vb.) istekler baştan sona primary
+    # bağlantıyı kullanır; ziyaretçi sayfaları replica'dan okunur. use_primary
+    # bir bağlam değişkeni olduğu için sync_to_async ile çalışan sorgulara da
+    # taşınır.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.admin_prefix = None
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def needs_primary(self, request):
+        if self.admin_prefix is None:
+            self.admin_prefix = reverse('admin:index')
+        return request.method not in SAFE_METHODS or request.path.startswith(self.admin_prefix)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if self.needs_primary(request):
+            with use_primary():
+                return self.get_response(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        if self.needs_primary(request):
+            with use_primary():
+                return await self.get_response(request)
+        return await self.get_response(request)
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:07
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_navbarlink'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImageJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('name', models.CharField(max_length=255, verbose_name='Dosya')),
+                ('model_name', models.CharField(blank=True, max_length=100, verbose_name='Model')),
+                ('file_hash', models.CharField(blank=True, db_index=True, max_length=64, verbose_name='Dosya Özeti')),
+                ('status', models.CharField(choices=[('pending', 'Bekliyor'), ('running', 'İşleniyor'), ('done', 'Tamamlandı'), ('failed', 'Hatalı')], default='pending', max_length=10, verbose_name='Durum')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Deneme Sayısı')),
+                ('last_error', models.TextField(blank=True, verbose_name='Son Hata')),
+            ],
+            options={
+                'verbose_name': 'Görsel İşi',
+                'verbose_name_plural': 'Görsel İşleri',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='blog_imagej_status_2aa11c_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.utils import OperationalError
+
+
+def create_fts_table(apps, schema_editor):
+    # FTS5 yalnızca SQLite'ta ve modül derlenmişse kullanılır; aksi halde
+    # arama SearchTerm tablosuna düşer.
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    try:
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS blog_search_fts USING fts5("
+            "title, body, tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+        )
+    except OperationalError:
+        pass
+
+
+def drop_fts_table(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute("DROP TABLE IF EXISTS blog_search_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0007_imagejob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=30, verbose_name='Tür')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='Kayıt ID')),
+                ('title', models.CharField(max_length=255, verbose_name='Başlık')),
+                ('body', models.TextField(blank=True, verbose_name='İçerik')),
+                ('url', models.CharField(max_length=255, verbose_name='Adres')),
+            ],
+            options={
+                'verbose_name': 'Arama Kaydı',
+                'verbose_name_plural': 'Arama Kayıtları',
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='blog_searchdocument_unique_object')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(db_index=True, max_length=64)),
+                ('weight', models.PositiveIntegerField(default=1)),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='terms', to='blog.searchdocument')),
+            ],
+            options={
+                'verbose_name': 'Arama Terimi',
+                'verbose_name_plural': 'Arama Terimleri',
+                'constraints': [models.UniqueConstraint(fields=('document', 'term'), name='blog_searchterm_unique_term')],
+            },
+        ),
+        migrations.RunPython(create_fts_table, drop_fts_table),
+    ]
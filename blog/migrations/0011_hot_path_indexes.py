@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0010_created_at_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['name'], name='blog_category_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='certificate',
+            index=models.Index(fields=['-date', 'order'], name='blog_certificate_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='certificate',
+            index=models.Index(fields=['-date', '-id'], name='blog_certificate_page_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='codeexample',
+            index=models.Index(fields=['language', 'category', '-created_at'], name='blog_codeexample_group_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactinfo',
+            index=models.Index(fields=['order'], name='blog_contactinfo_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='education',
+            index=models.Index(fields=['-start_date'], name='blog_education_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(fields=['-start_date'], name='blog_experience_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='navbarlink',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order'], name='blog_navbarlink_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['category', 'order'], name='blog_skill_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skillcategory',
+            index=models.Index(fields=['name'], name='blog_skillcategory_name_idx'),
+        ),
+    ]
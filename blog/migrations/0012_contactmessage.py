@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:44
+
+import blog.models
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0011_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContactMessage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('name', models.CharField(max_length=100, verbose_name='Ad')),
+                ('email', models.EmailField(max_length=254, verbose_name='E-posta')),
+                ('subject', models.CharField(max_length=200, verbose_name='Konu')),
+                ('message', models.TextField(verbose_name='Mesaj')),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True, verbose_name='IP Adresi')),
+                ('digest', models.CharField(db_index=True, max_length=64, verbose_name='İçerik Özeti')),
+                ('status', models.CharField(choices=[('pending', 'Bekliyor'), ('sending', 'Gönderiliyor'), ('sent', 'Gönderildi'), ('failed', 'Hatalı')], default='pending', max_length=10, verbose_name='Durum')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Deneme Sayısı')),
+                ('last_error', models.TextField(blank=True, verbose_name='Son Hata')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='Gönderilme Tarihi')),
+            ],
+            options={
+                'verbose_name': 'İletişim Mesajı',
+                'verbose_name_plural': 'İletişim Mesajları',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='blog_contact_status_idx')],
+            },
+            bases=(blog.models.SlugMixin, models.Model),
+        ),
+    ]
@@ -1,12 +1,57 @@
 from django.db import models
-from django.utils.text import slugify
+from django.db.models import prefetch_related_objects
 from django.urls import reverse
 from django.utils import timezone
 
+from .slugs import existing_slugs, pick_slugs, slugify_tr
+
 # Create your models here.
 
-class BaseModel(models.Model):
-    created_at = models.DateTimeField(default=timezone.now)
+class SlugMixin:
+    # slug alanı boşsa slug_source'taki alanlardan (noktalı yol olabilir)
+    # üretilir; çakışmalar nesne sayısından bağımsız, birkaç toplu sorguyla
+    # çözülür.
+    slug_source = ()
+
+    def slug_base(self):
+        parts = []
+        for path in self.slug_source:
+            value = self
+            for attribute in path.split('.'):
+                value = getattr(value, attribute)
+            parts.append(str(value))
+        max_length = self._meta.get_field('slug').max_length
+        return slugify_tr('-'.join(parts))[:max_length].strip('-') or self._meta.model_name
+
+    @classmethod
+    def assign_slugs(cls, objects):
+        # Toplu oluşturma (bulk_create) öncesi: tüm nesnelere sorgu sayısı
+        # satır sayısından bağımsız kalacak şekilde benzersiz slug verir.
+        pending = [obj for obj in objects if not obj.slug]
+        if not pending:
+            return objects
+        max_length = cls._meta.get_field('slug').max_length
+        # slug_source'taki ilişkiler (ör. language.name) nesne başına değil,
+        # tek sorguyla yüklenir.
+        related = {path.rsplit('.', 1)[0].replace('.', '__') for path in cls.slug_source if '.' in path}
+        prefetch_related_objects(pending, *related)
+        bases = [obj.slug_base() for obj in pending]
+        queryset = cls._default_manager.exclude(pk__in=[obj.pk for obj in pending if obj.pk])
+        taken = existing_slugs(queryset, bases, max_length)
+        taken.update(obj.slug for obj in objects if obj.slug)
+        for obj, slug in zip(pending, pick_slugs(bases, taken, max_length)):
+            obj.slug = slug
+        return objects
+
+    def save(self, *args, **kwargs):
+        if self.slug_source and not self.slug:
+            self.assign_slugs([self])
+        super().save(*args, **kwargs)
+
+
+class BaseModel(SlugMixin, models.Model):
+    # Admin listelerinin varsayılan sıralaması ve tarih hiyerarşisi bu alanı kullanır.
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
@@ -17,15 +62,14 @@ class Category(BaseModel):
     slug = models.SlugField(max_length=100, unique=True, blank=True)
     description = models.TextField(blank=True, verbose_name="Açıklama")
 
+    slug_source = ('name',)
+
     class Meta:
         verbose_name = "Kategori"
         verbose_name_plural = "Kategoriler"
         ordering = ['name']
-
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)
-        super().save(*args, **kwargs)
+        # get_subcategories kategoriyi adıyla arar.
+        indexes = [models.Index(fields=['name'], name='blog_category_name_idx')]
 
     def __str__(self):
         return self.name
@@ -36,16 +80,13 @@ class SubCategory(BaseModel):
     category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='subcategories', verbose_name="Ana Kategori")
     description = models.TextField(blank=True, verbose_name="Açıklama")
 
+    slug_source = ('category.name', 'name')
+
     class Meta:
         verbose_name = "Alt Kategori"
         verbose_name_plural = "Alt Kategoriler"
         ordering = ['category', 'name']
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(f"{self.category.name}-{self.name}")
-        super().save(*args, **kwargs)
-
     def __str__(self):
         return f"{self.category.name} - {self.name}"
 
@@ -60,14 +101,21 @@ class BlogPost(BaseModel):
     published_at = models.DateTimeField(null=True, blank=True)
     is_published = models.BooleanField(default=False)
 
+    slug_source = ('title',)
+
     class Meta:
         verbose_name = "Blog Yazısı"
         verbose_name_plural = "Blog Yazıları"
         ordering = ['-created_at']
+        # Yayındaki yazılar (published_at, id) üzerinden sayfalanır; taslaklar
+        # indekse girmez.
+        indexes = [
+            models.Index(fields=['-published_at', '-id'], condition=models.Q(is_published=True), name='blog_post_published_idx'),
+            models.Index(fields=['category', '-published_at', '-id'], condition=models.Q(is_published=True), name='blog_post_category_idx'),
+            models.Index(fields=['subcategory', '-published_at', '-id'], condition=models.Q(is_published=True), name='blog_post_subcategory_idx'),
+        ]
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.title)
         if self.is_published and not self.published_at:
             self.published_at = timezone.now()
         super().save(*args, **kwargs)
@@ -86,15 +134,13 @@ class Education(BaseModel):
     tags = models.ManyToManyField('Tag', related_name='education_tags', blank=True)
     slug = models.SlugField(max_length=200, unique=True, blank=True)
 
+    slug_source = ('title', 'school')
+
     class Meta:
         verbose_name = "Eğitim"
         verbose_name_plural = "Eğitimler"
         ordering = ['-start_date']
-
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(f"{self.title}-{self.school}")
-        super().save(*args, **kwargs)
+        indexes = [models.Index(fields=['-start_date'], name='blog_education_start_idx')]
 
     def __str__(self):
         return f"{self.title} - {self.school}"
@@ -109,15 +155,13 @@ class Experience(BaseModel):
     tags = models.ManyToManyField('Tag', related_name='experience_tags', blank=True)
     slug = models.SlugField(max_length=200, unique=True, blank=True)
 
+    slug_source = ('title', 'company')
+
     class Meta:
         verbose_name = "Deneyim"
         verbose_name_plural = "Deneyimler"
         ordering = ['-start_date']
-
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(f"{self.title}-{self.company}")
-        super().save(*args, **kwargs)
+        indexes = [models.Index(fields=['-start_date'], name='blog_experience_start_idx')]
 
     def __str__(self):
         return f"{self.title} - {self.company}"
@@ -133,32 +177,32 @@ class Certificate(BaseModel):
     order = models.PositiveIntegerField(default=0, verbose_name="Sıra")
     slug = models.SlugField(max_length=200, unique=True, blank=True)
 
+    slug_source = ('title', 'issuer')
+
     class Meta:
         verbose_name = "Sertifika"
         verbose_name_plural = "Sertifikalar"
         ordering = ['-date', 'order']
-
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(f"{self.title}-{self.issuer}")
-        super().save(*args, **kwargs)
+        # Varsayılan sıralama (admin, detay listeleri) ve ana sayfadaki
+        # (date, id) imleçli sayfalama.
+        indexes = [
+            models.Index(fields=['-date', 'order'], name='blog_certificate_order_idx'),
+            models.Index(fields=['-date', '-id'], name='blog_certificate_page_idx'),
+        ]
 
     def __str__(self):
         return self.title
 
-class ProjectCategory(models.Model):
+class ProjectCategory(SlugMixin, models.Model):
     name = models.CharField(max_length=100, verbose_name="Kategori Adı")
     slug = models.SlugField(max_length=100, unique=True, blank=True)
 
+    slug_source = ('name',)
+
     class Meta:
         verbose_name = "Proje Kategorisi"
         verbose_name_plural = "Proje Kategorileri"
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)
-        super().save(*args, **kwargs)
-
     def __str__(self):
         return self.name
 
@@ -174,16 +218,13 @@ class Project(BaseModel):
     button_text = models.CharField(max_length=50, verbose_name="Buton Metni", default="Detayları Gör")
     button_url = models.URLField(verbose_name="Buton Linki (opsiyonel)", blank=True)
 
+    slug_source = ('title',)
+
     class Meta:
         verbose_name = "Proje"
         verbose_name_plural = "Projeler"
         ordering = ['-created_at']
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.title)
-        super().save(*args, **kwargs)
-
     def __str__(self):
         return self.title
 
@@ -191,10 +232,7 @@ class Tag(BaseModel):
     name = models.CharField(max_length=50, unique=True)
     slug = models.SlugField(max_length=100, unique=True, blank=True)
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)
-        super().save(*args, **kwargs)
+    slug_source = ('name',)
 
     def __str__(self):
         return self.name
@@ -204,37 +242,31 @@ class Tag(BaseModel):
         verbose_name_plural = "Etiketler"
         ordering = ['name']
 
-class CodeLanguage(models.Model):
+class CodeLanguage(SlugMixin, models.Model):
     name = models.CharField(max_length=50, verbose_name="Dil Adı")
     icon = models.CharField(max_length=50, verbose_name="İkon Sınıfı (opsiyonel)", blank=True)
     slug = models.SlugField(max_length=50, unique=True, blank=True)
 
+    slug_source = ('name',)
+
     class Meta:
         verbose_name = "Kod Dili"
         verbose_name_plural = "Kod Dilleri"
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)
-        super().save(*args, **kwargs)
-
     def __str__(self):
         return self.name
 
-class CodeCategory(models.Model):
+class CodeCategory(SlugMixin, models.Model):
     language = models.ForeignKey('CodeLanguage', on_delete=models.CASCADE, related_name='categories', verbose_name="Programlama Dili", null=True, blank=True)
     name = models.CharField(max_length=50, verbose_name="Kategori Adı")
     slug = models.SlugField(max_length=50, unique=True, blank=True)
 
+    slug_source = ('name',)
+
     class Meta:
         verbose_name = "Kod Kategorisi"
         verbose_name_plural = "Kod Kategorileri"
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)
-        super().save(*args, **kwargs)
-
     def __str__(self):
         return f"{self.language.name} - {self.name}" if self.language else self.name
 
@@ -246,15 +278,15 @@ class CodeExample(BaseModel):
     description = models.TextField(verbose_name="Açıklama")
     slug = models.SlugField(max_length=200, unique=True, blank=True)
 
+    slug_source = ('title', 'language.name')
+
     class Meta:
         verbose_name = "Kod Örneği"
         verbose_name_plural = "Kod Örnekleri"
         ordering = ['-created_at']
-
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(f"{self.title}-{self.language.name}")
-        super().save(*args, **kwargs)
+        # Sekme parçaları ve API dil filtresi (dil, kategori) ile süzüp
+        # tarihe göre sıralar.
+        indexes = [models.Index(fields=['language', 'category', '-created_at'], name='blog_codeexample_group_idx')]
 
     def __str__(self):
         return f"{self.title} - {self.language.name}"
@@ -279,6 +311,7 @@ class ContactInfo(models.Model):
 
     class Meta:
         ordering = ['order']
+        indexes = [models.Index(fields=['order'], name='blog_contactinfo_order_idx')]
         verbose_name = "İletişim Bilgisi"
         verbose_name_plural = "İletişim Bilgileri"
 
@@ -314,11 +347,13 @@ class SkillCategory(models.Model):
     class Meta:
         verbose_name = "Yetenek Kategorisi"
         verbose_name_plural = "Yetenek Kategorileri"
+        # API'deki ?category= filtresi kategoriyi adıyla arar.
+        indexes = [models.Index(fields=['name'], name='blog_skillcategory_name_idx')]
 
     def __str__(self):
         return self.name
 
-class Skill(models.Model):
+class Skill(SlugMixin, models.Model):
     category = models.ForeignKey(SkillCategory, on_delete=models.CASCADE, related_name="skills", verbose_name="Kategori")
     name = models.CharField(max_length=100, verbose_name="Yetenek Adı")
     image = models.ImageField(upload_to="skills/", verbose_name="Yetenek Görseli", blank=True, null=True)
@@ -326,19 +361,12 @@ class Skill(models.Model):
     slug = models.SlugField(max_length=120, unique=True, blank=True)
     description = models.TextField(verbose_name="Açıklama", blank=True, null=True)
 
-    def save(self, *args, **kwargs):
-        if not self.slug or self.slug == '':
-            base_slug = slugify(self.name)
-            slug = base_slug
-            counter = 1
-            while Skill.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
-        super().save(*args, **kwargs)
+    slug_source = ('name',)
 
     class Meta:
         ordering = ['order']
+        # Yetenekler kategoriye göre gruplanıp sıralanır (prefetch, admin).
+        indexes = [models.Index(fields=['category', 'order'], name='blog_skill_category_idx')]
         verbose_name = "Yetenek"
         verbose_name_plural = "Yetenekler"
 
@@ -357,6 +385,102 @@ class NavbarLink(models.Model):
         verbose_name = "Navbar Link"
         verbose_name_plural = "Navbar Linkleri"
         ordering = ['order']
+        # SQLite boolean filtreyi çıplak sütun olarak yazdığı için bileşik
+        # (is_active, order) yerine kısmi indeks kullanılır.
+        indexes = [models.Index(fields=['order'], condition=models.Q(is_active=True), name='blog_navbarlink_active_idx')]
 
     def __str__(self):
         return self.title
+
+
+class ImageJob(BaseModel):
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Bekliyor"),
+        (STATUS_RUNNING, "İşleniyor"),
+        (STATUS_DONE, "Tamamlandı"),
+        (STATUS_FAILED, "Hatalı"),
+    ]
+
+    name = models.CharField(max_length=255, verbose_name="Dosya")
+    model_name = models.CharField(max_length=100, verbose_name="Model", blank=True)
+    file_hash = models.CharField(max_length=64, verbose_name="Dosya Özeti", blank=True, db_index=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING, verbose_name="Durum")
+    attempts = models.PositiveIntegerField(default=0, verbose_name="Deneme Sayısı")
+    last_error = models.TextField(blank=True, verbose_name="Son Hata")
+
+    class Meta:
+        verbose_name = "Görsel İşi"
+        verbose_name_plural = "Görsel İşleri"
+        ordering = ['-created_at']
+        indexes = [models.Index(fields=['status', 'created_at'])]
+
+    def __str__(self):
+        return f"{self.name} ({self.get_status_display()})"
+
+
+class SearchDocument(models.Model):
+    kind = models.CharField(max_length=30, verbose_name="Tür")
+    object_id = models.PositiveBigIntegerField(verbose_name="Kayıt ID")
+    title = models.CharField(max_length=255, verbose_name="Başlık")
+    body = models.TextField(blank=True, verbose_name="İçerik")
+    url = models.CharField(max_length=255, verbose_name="Adres")
+
+    class Meta:
+        verbose_name = "Arama Kaydı"
+        verbose_name_plural = "Arama Kayıtları"
+        constraints = [models.UniqueConstraint(fields=['kind', 'object_id'], name='blog_searchdocument_unique_object')]
+
+    def __str__(self):
+        return f"{self.kind}: {self.title}"
+
+
+class SearchTerm(models.Model):
+    # FTS5 olmayan veritabanlarında kullanılan ters indeks.
+    document = models.ForeignKey(SearchDocument, on_delete=models.CASCADE, related_name='terms')
+    term = models.CharField(max_length=64, db_index=True)
+    weight = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        verbose_name = "Arama Terimi"
+        verbose_name_plural = "Arama Terimleri"
+        constraints = [models.UniqueConstraint(fields=['document', 'term'], name='blog_searchterm_unique_term')]
+
+    def __str__(self):
+        return self.term
+
+
+class ContactMessage(BaseModel):
+    STATUS_PENDING = 'pending'
+    STATUS_SENDING = 'sending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Bekliyor"),
+        (STATUS_SENDING, "Gönderiliyor"),
+        (STATUS_SENT, "Gönderildi"),
+        (STATUS_FAILED, "Hatalı"),
+    ]
+
+    name = models.CharField(max_length=100, verbose_name="Ad")
+    email = models.EmailField(verbose_name="E-posta")
+    subject = models.CharField(max_length=200, verbose_name="Konu")
+    message = models.TextField(verbose_name="Mesaj")
+    ip_address = models.GenericIPAddressField(null=True, blank=True, verbose_name="IP Adresi")
+    digest = models.CharField(max_length=64, db_index=True, verbose_name="İçerik Özeti")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING, verbose_name="Durum")
+    attempts = models.PositiveIntegerField(default=0, verbose_name="Deneme Sayısı")
+    last_error = models.TextField(blank=True, verbose_name="Son Hata")
+    sent_at = models.DateTimeField(null=True, blank=True, verbose_name="Gönderilme Tarihi")
+
+    class Meta:
+        verbose_name = "İletişim Mesajı"
+        verbose_name_plural = "İletişim Mesajları"
+        ordering = ['-created_at']
+        indexes = [models.Index(fields=['status', 'created_at'], name='blog_contact_status_idx')]
+
+    def __str__(self):
+        return f"{self.name} <{self.email}>: {self.subject}"
@@ -0,0 +1,61 @@
+import base64
+import binascii
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.http import Http404
+
+PAGE_SIZE = 10
+
+
+# Sayfalama OFFSET yerine son görülen (alan, id) çifti üzerinden yapılır;
+# sorgu doğrudan bileşik indekste o noktaya atlar ve N. sayfa da ilk sayfa
+# kadar ucuzdur. İmleç, URL'de taşınan base64 kodlu "değer|id" metnidir.
+# Satırlar model nesnesi ya da .values() sözlüğü olabilir.
+def _get(item, name):
+    return item[name] if isinstance(item, dict) else getattr(item, name)
+
+
+def encode_cursor(value, pk):
+    value = value.isoformat() if hasattr(value, 'isoformat') else value
+    raw = f'{value}|{pk}'
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, model_field):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        value, pk = raw.rsplit('|', 1)
+        value = model_field.to_python(value)
+        if value is None:
+            raise ValueError
+        return value, int(pk)
+    except (ValueError, ValidationError, UnicodeDecodeError, binascii.Error):
+        raise Http404("Geçersiz sayfa imleci.")
+
+
+def _cursor_for(item, field):
+    return encode_cursor(_get(item, field), _get(item, 'pk'))
+
+
+def keyset_page(queryset, field, after=None, before=None, per_page=PAGE_SIZE):
+    model_field = queryset.model._meta.get_field(field)
+    if before:
+        value, pk = decode_cursor(before, model_field)
+        newer = Q(**{f'{field}__gt': value}) | Q(**{field: value, 'pk__gt': pk})
+        rows = list(queryset.filter(newer).order_by(field, 'pk')[:per_page + 1])
+        items = rows[:per_page][::-1]
+        has_previous, has_next = len(rows) > per_page, True
+    else:
+        if after:
+            value, pk = decode_cursor(after, model_field)
+            queryset = queryset.filter(Q(**{f'{field}__lt': value}) | Q(**{field: value, 'pk__lt': pk}))
+        rows = list(queryset.order_by(f'-{field}', '-pk')[:per_page + 1])
+        items = rows[:per_page]
+        has_previous, has_next = bool(after), len(rows) > per_page
+
+    return {
+        'items': items,
+        'next_cursor': _cursor_for(items[-1], field) if items and has_next else None,
+        'previous_cursor': _cursor_for(items[0], field) if items and has_previous else None,
+    }
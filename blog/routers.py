@@ -0,0 +1,46 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_DB_ALIAS = 'replica'
+
+_use_primary = ContextVar('blog_use_primary', default=False)
+
+
+@contextmanager
+def use_primary():
+    # Blok içindeki okumalar da yazmaların gittiği bağlantıdan yapılır
+    # (kaydettikten hemen sonra okuma, admin formlarındaki benzersizlik kontrolü).
+    token = _use_primary.set(True)
+    try:
+        yield
+    finally:
+        _use_primary.reset(token)
+
+
+class PrimaryReplicaRouter:
+    # Okumalar salt-okunur 'replica' bağlantısına, yazmalar ve migration'lar
+    # 'default'a gider. Açık bir transaction varken ya da use_primary()
+    # içinde okumalar da 'default'tan yapılır; henüz commit edilmemiş veri
+    # diğer bağlantıdan görünmez.
+    def db_for_read(self, model, **hints):
+        if REPLICA_DB_ALIAS not in settings.DATABASES or _use_primary.get():
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db == DEFAULT_DB_ALIAS:
+            return DEFAULT_DB_ALIAS
+        return REPLICA_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # İki bağlantı da aynı veritabanını gösterir.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,303 @@
+import re
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count, Q, Sum
+from django.urls import reverse
+from django.utils.html import escape
+from django.utils.http import urlencode
+from django.utils.safestring import mark_safe
+
+from .models import BlogPost, Project, CodeExample, Certificate, Skill, Tag, SearchDocument, SearchTerm
+
+FTS_TABLE = 'blog_search_fts'
+TITLE_WEIGHT = 10
+MAX_TERM_LENGTH = 64
+MIN_STEM_LENGTH = 3
+SNIPPET_LENGTH = 180
+
+# Aranan modeller: başlık alanı, içerik alanları (noktalı yol veya m2m adı),
+# detay sayfası ve indekse girme koşulu.
+SEARCH_SOURCES = {
+    BlogPost: {'title': 'title', 'body': ('content', 'category.name', 'subcategory.name', 'tags'), 'url': 'blog:blog_detail', 'filter': {'is_published': True}},
+    Project: {'title': 'title', 'body': ('description', 'category.name', 'tags'), 'url': 'blog:project_detail'},
+    CodeExample: {'title': 'title', 'body': ('description', 'code', 'language.name', 'category.name'), 'url': 'blog:codeexample_detail'},
+    Certificate: {'title': 'title', 'body': ('issuer', 'description', 'credential_id'), 'url': 'blog:certificate_detail'},
+    Skill: {'title': 'name', 'body': ('category.name', 'description'), 'url': 'blog:skill_detail'},
+    Tag: {'title': 'name', 'body': (), 'url': None},
+}
+
+# Türkçe büyük/küçük harf dönüşümü (İ -> i, I -> ı) yapıldıktan sonra
+# aksanlı harfler ASCII karşılıklarına indirgenir; "Işık", "ışık" ve "isik"
+# aynı terime düşer. Dönüşüm karakter sayısını korur, vurgulama buna dayanır.
+TURKISH_LOWER = str.maketrans({'İ': 'i', 'I': 'ı'})
+ASCII_FOLD = str.maketrans('ıişğüöçâîû', 'iisguocaiu')
+WORD_RE = re.compile(r'\w+')
+
+# Hafif Türkçe kök bulucu: çoğul, iyelik ve hal eklerinden en uzun eşleşeni
+# en fazla iki tur atar. Aynı işlem hem indekse hem sorguya uygulanır.
+SUFFIXES = sorted((
+    'larindan', 'lerinden', 'larinda', 'lerinde', 'larini', 'lerini', 'lardan', 'lerden',
+    'larda', 'lerde', 'lari', 'leri', 'lar', 'ler', 'ndan', 'nden', 'dan', 'den', 'tan', 'ten',
+    'nda', 'nde', 'da', 'de', 'ta', 'te', 'nin', 'nun', 'in', 'un', 'yla', 'yle', 'la', 'le',
+    'si', 'su', 'yi', 'yu', 'i', 'u', 'a', 'e',
+), key=len, reverse=True)
+
+
+def fold(text):
+    return text.translate(TURKISH_LOWER).lower().translate(ASCII_FOLD)
+
+
+def stem(token):
+    if not token.isalpha():
+        return token
+    for _ in range(2):
+        for suffix in SUFFIXES:
+            if token.endswith(suffix) and len(token) - len(suffix) >= MIN_STEM_LENGTH:
+                token = token[:-len(suffix)]
+                break
+        else:
+            break
+    return token
+
+
+def terms(text):
+    return [stem(word[:MAX_TERM_LENGTH]) for word in WORD_RE.findall(fold(text))]
+
+
+def query_terms(query):
+    return list(dict.fromkeys(term for term in terms(query) if len(term) >= 2))
+
+
+_fts_available = {}
+
+
+def use_fts():
+    if getattr(settings, 'SEARCH_BACKEND', 'auto') == 'table' or connection.vendor != 'sqlite':
+        return False
+    key = connection.settings_dict['NAME']
+    if key not in _fts_available:
+        _fts_available[key] = FTS_TABLE in connection.introspection.table_names()
+    return _fts_available[key]
+
+
+def _resolve(obj, path):
+    value = obj
+    for attribute in path.split('.'):
+        value = getattr(value, attribute, None)
+        if value is None:
+            return ''
+    if hasattr(value, 'all'):
+        return ' '.join(str(item) for item in value.all())
+    return str(value)
+
+
+def _related_paths(model, spec):
+    select, prefetch = set(), set()
+    for path in spec['body']:
+        field = model._meta.get_field(path.split('.')[0])
+        if field.many_to_many:
+            prefetch.add(field.name)
+        elif field.is_relation:
+            select.add(field.name)
+    return sorted(select), sorted(prefetch)
+
+
+def source_queryset(model):
+    spec = SEARCH_SOURCES[model]
+    select, prefetch = _related_paths(model, spec)
+    return model.objects.filter(**spec.get('filter', {})).select_related(*select).prefetch_related(*prefetch).order_by()
+
+
+def _document_for(obj):
+    spec = SEARCH_SOURCES[type(obj)]
+    title = _resolve(obj, spec['title'])[:255]
+    body = '\n'.join(part for part in (_resolve(obj, path) for path in spec['body']) if part)
+    if spec['url']:
+        url = reverse(spec['url'], args=[obj.slug])
+    else:
+        url = f"{reverse('blog:search')}?{urlencode({'q': title})}"
+    return SearchDocument(kind=type(obj)._meta.model_name, object_id=obj.pk, title=title, body=body, url=url)
+
+
+def _write_terms(documents):
+    if use_fts():
+        with connection.cursor() as cursor:
+            cursor.executemany(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [(document.pk,) for document in documents])
+            cursor.executemany(
+                f'INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (%s, %s, %s)',
+                [(document.pk, ' '.join(terms(document.title)), ' '.join(terms(document.body))) for document in documents],
+            )
+        return
+    SearchTerm.objects.filter(document__in=documents).delete()
+    rows = []
+    for document in documents:
+        weights = Counter(terms(document.body))
+        for term in terms(document.title):
+            weights[term] += TITLE_WEIGHT
+        rows.extend(SearchTerm(document=document, term=term, weight=weight) for term, weight in weights.items())
+    SearchTerm.objects.bulk_create(rows, batch_size=500)
+
+
+def _delete_documents(documents):
+    ids = [document.pk for document in documents]
+    if not ids:
+        return
+    if use_fts():
+        with connection.cursor() as cursor:
+            cursor.executemany(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [(pk,) for pk in ids])
+    SearchDocument.objects.filter(pk__in=ids).delete()
+
+
+def reindex(model, ids):
+    # Kayıtlar indeks koşuluyla birlikte yeniden okunur; silinmiş ya da
+    # koşulu artık sağlamayan (ör. yayından kaldırılmış) kayıtlar çıkarılır.
+    if model not in SEARCH_SOURCES or not ids:
+        return
+    ids = set(ids)
+    documents = []
+    for obj in source_queryset(model).filter(pk__in=ids):
+        ids.discard(obj.pk)
+        document = _document_for(obj)
+        document, _ = SearchDocument.objects.update_or_create(
+            kind=document.kind, object_id=document.object_id,
+            defaults={'title': document.title, 'body': document.body, 'url': document.url},
+        )
+        documents.append(document)
+    if documents:
+        _write_terms(documents)
+    if ids:
+        _delete_documents(list(SearchDocument.objects.filter(kind=model._meta.model_name, object_id__in=ids)))
+
+
+def reindex_objects(objects):
+    groups = {}
+    for obj in objects:
+        groups.setdefault(type(obj), set()).add(obj.pk)
+    for model, ids in groups.items():
+        reindex(model, ids)
+
+
+def dependents_of(instance):
+    # Örn. bir etiketin adı değişince o etiketi içeren projeler de yeniden
+    # indekslenir.
+    for model, spec in SEARCH_SOURCES.items():
+        for path in spec['body']:
+            field = model._meta.get_field(path.split('.')[0])
+            if field.is_relation and field.related_model is type(instance):
+                yield from model.objects.filter(**{field.name: instance}).only('pk')
+
+
+def rebuild_index():
+    _delete_documents(list(SearchDocument.objects.only('pk')))
+    count = 0
+    for model in SEARCH_SOURCES:
+        documents = SearchDocument.objects.bulk_create(
+            [_document_for(obj) for obj in source_queryset(model).iterator(chunk_size=500)], batch_size=500
+        )
+        if documents and documents[0].pk is None:
+            documents = list(SearchDocument.objects.filter(kind=model._meta.model_name))
+        _write_terms(documents)
+        count += len(documents)
+    return count
+
+
+def _fts_match(query_term_list):
+    return ' '.join(f'"{term}"*' for term in query_term_list)
+
+
+def _search_fts(query_term_list, kinds, limit):
+    match = _fts_match(query_term_list)
+    sql = (
+        f'SELECT d.id, d.kind, d.object_id, d.title, d.body, d.url, bm25({FTS_TABLE}, %s, 1.0) AS score '
+        f'FROM {FTS_TABLE} JOIN {SearchDocument._meta.db_table} d ON d.id = {FTS_TABLE}.rowid '
+        f'WHERE {FTS_TABLE} MATCH %s'
+    )
+    params = [float(TITLE_WEIGHT), match]
+    if kinds:
+        sql += f" AND d.kind IN ({', '.join(['%s'] * len(kinds))})"
+        params.extend(kinds)
+    sql += ' ORDER BY score LIMIT %s'
+    params.append(limit)
+    return list(SearchDocument.objects.raw(sql, params))
+
+
+def _table_matches(query_term_list, documents):
+    # Her sorgu terimi en az bir indeks terimiyle eşleşmeli (AND).
+    matches = {f'match_{index}': Count('terms', filter=Q(terms__term__startswith=term)) for index, term in enumerate(query_term_list)}
+    return documents.annotate(**matches).filter(**{f'{name}__gt': 0 for name in matches})
+
+
+def _search_table(query_term_list, kinds, limit):
+    documents = SearchDocument.objects.all()
+    if kinds:
+        documents = documents.filter(kind__in=kinds)
+    any_term = Q()
+    for term in query_term_list:
+        any_term |= Q(terms__term__startswith=term)
+    documents = _table_matches(query_term_list, documents.annotate(score=Sum('terms__weight', filter=any_term)))
+    return list(documents.order_by('-score', 'id')[:limit])
+
+
+def highlight(text, query_term_list, length=None):
+    folded = fold(text)
+    spans = []
+    if len(folded) == len(text):
+        spans = [
+            match.span() for match in WORD_RE.finditer(folded)
+            if any(stem(match.group()[:MAX_TERM_LENGTH]).startswith(term) for term in query_term_list)
+        ]
+    start, end, prefix, suffix = 0, len(text), '', ''
+    if length and len(text) > length:
+        start = max(0, spans[0][0] - length // 4) if spans else 0
+        end = min(len(text), start + length)
+        prefix = '…' if start else ''
+        suffix = '…' if end < len(text) else ''
+    parts, position = [], start
+    for span_start, span_end in spans:
+        if span_end <= start or span_start >= end:
+            continue
+        parts.append(escape(text[position:span_start]))
+        parts.append(f'<mark>{escape(text[span_start:span_end])}</mark>')
+        position = span_end
+    parts.append(escape(text[position:end]))
+    return mark_safe(prefix + ''.join(parts).strip() + suffix)
+
+
+def search_documents(query, kinds=None, limit=20):
+    query_term_list = query_terms(query)
+    if not query_term_list:
+        return []
+    search = _search_fts if use_fts() else _search_table
+    labels = {model._meta.model_name: model._meta.verbose_name for model in SEARCH_SOURCES}
+    results = []
+    for document in search(query_term_list, kinds, limit):
+        results.append({
+            'document': document,
+            'kind': document.kind,
+            'kind_label': labels.get(document.kind, document.kind),
+            'url': document.url,
+            'title': highlight(document.title, query_term_list),
+            'snippet': highlight(' '.join(document.body.split()), query_term_list, SNIPPET_LENGTH),
+        })
+    return results
+
+
+def matching_ids(model, query):
+    # Yönetim paneli araması için: sıralama, sınır ve vurgulama yapılmadan
+    # eşleşen kayıtların tümünün id'leri döner.
+    query_term_list = query_terms(query)
+    kind = model._meta.model_name
+    if not query_term_list:
+        return []
+    if use_fts():
+        sql = (
+            f'SELECT d.object_id FROM {FTS_TABLE} JOIN {SearchDocument._meta.db_table} d ON d.id = {FTS_TABLE}.rowid '
+            f'WHERE {FTS_TABLE} MATCH %s AND d.kind = %s'
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [_fts_match(query_term_list), kind])
+            return [row[0] for row in cursor.fetchall()]
+    documents = _table_matches(query_term_list, SearchDocument.objects.filter(kind=kind))
+    return list(documents.values_list('object_id', flat=True))
@@ -0,0 +1,192 @@
+import mimetypes
+import os
+import re
+import threading
+from collections import OrderedDict
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_vary_headers, quote_etag
+from django.utils.http import http_date
+
+HASHED_NAME_RE = re.compile(r'\.[0-9a-f]{12}\.[A-Za-z0-9]+$')
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+CHUNK_SIZE = 64 * 1024
+
+# Küçük ve sık istenen dosyalar (css, js, ikonlar) bellekte tutulur.
+MEMORY_CACHE_MAX_FILE = 64 * 1024
+MEMORY_CACHE_MAX_TOTAL = 8 * 1024 * 1024
+
+
+class FileMemoryCache:
+    def __init__(self, max_total=MEMORY_CACHE_MAX_TOTAL):
+        self.max_total = max_total
+        self.total = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            content = self.entries.get(key)
+            if content is not None:
+                self.entries.move_to_end(key)
+            return content
+
+    def set(self, key, content):
+        with self.lock:
+            if key in self.entries:
+                return
+            self.entries[key] = content
+            self.total += len(content)
+            while self.total > self.max_total:
+                _, evicted = self.entries.popitem(last=False)
+                self.total -= len(evicted)
+
+
+memory_cache = FileMemoryCache()
+
+
+def _accepted_encodings(header):
+    # "gzip;q=0.5, br;q=0" -> {'gzip': 0.5, 'br': 0.0}
+    accepted = {}
+    for item in header.split(','):
+        name, _, params = item.partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name] = quality
+    return accepted
+
+
+def _pick_encoding(request, full_path):
+    # Aralık (Range) istekleri sıkıştırılmamış dosya üzerinden yanıtlanır.
+    if request.META.get('HTTP_RANGE'):
+        return None, full_path
+    accepted = _accepted_encodings(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+    candidates = []
+    for preference, (encoding, suffix) in enumerate((('br', '.br'), ('gzip', '.gz'))):
+        quality = accepted.get(encoding, accepted.get('*', 0.0))
+        if quality > 0 and os.path.isfile(full_path + suffix):
+            candidates.append((-quality, preference, encoding, full_path + suffix))
+    if not candidates:
+        return None, full_path
+    _, _, encoding, served_path = min(candidates)
+    return encoding, served_path
+
+
+def _parse_range(header, size):
+    match = RANGE_RE.match(header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    start, end = match.groups()
+    if start == '':
+        start, end = max(size - int(end), 0), size - 1
+    else:
+        start, end = int(start), min(int(end), size - 1) if end else size - 1
+    if start > end or start >= size:
+        return False
+    return start, end
+
+
+def _read_range(path, start, length):
+    with open(path, 'rb') as file:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def cache_control_for(path, immutable_hashed):
+    if immutable_hashed and HASHED_NAME_RE.search(path):
+        return 'public, max-age=31536000, immutable'
+    return f"public, max-age={getattr(settings, 'FILE_SERVING_MAX_AGE', 3600)}"
+
+
+def serve_file(request, path, document_root, accel_prefix=None, immutable_hashed=False):
+    try:
+        full_path = safe_join(str(document_root), path)
+    except (SuspiciousFileOperation, ValueError):
+        raise Http404
+    if not os.path.isfile(full_path):
+        raise Http404
+
+    # Önde X-Accel-Redirect destekli bir proxy (nginx) varsa dosyayı o sunar.
+    if accel_prefix:
+        response = HttpResponse()
+        response['X-Accel-Redirect'] = accel_prefix.rstrip('/') + '/' + quote(path.lstrip('/'))
+        response['Content-Type'] = ''
+        return response
+
+    # Sıkıştırılmış kopyalar ayrı temsil olduğu için ETag sunulan dosyadan
+    # üretilir ve kodlamayı da içerir.
+    encoding, served_path = _pick_encoding(request, full_path)
+    stat = os.stat(served_path)
+    etag = quote_etag(f"{stat.st_mtime_ns:x}-{stat.st_size:x}{f'-{encoding}' if encoding else ''}")
+    response = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+    if response is None:
+        response = _file_response(request, path, served_path, encoding, stat, etag)
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(stat.st_mtime)
+    response['Cache-Control'] = cache_control_for(path, immutable_hashed)
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
+
+
+def _file_response(request, path, served_path, encoding, stat, etag):
+    content_type, _ = mimetypes.guess_type(path)
+    content_type = content_type or 'application/octet-stream'
+    size = stat.st_size
+    range_header = request.META.get('HTTP_RANGE')
+
+    if range_header and request.META.get('HTTP_IF_RANGE', etag) == etag:
+        byte_range = _parse_range(range_header, size)
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+        if byte_range:
+            start, end = byte_range
+            response = StreamingHttpResponse(_read_range(served_path, start, end - start + 1), status=206, content_type=content_type)
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+            response['Content-Length'] = str(end - start + 1)
+            response['Accept-Ranges'] = 'bytes'
+            return response
+
+    if size <= MEMORY_CACHE_MAX_FILE:
+        key = (served_path, stat.st_mtime_ns, size)
+        content = memory_cache.get(key)
+        if content is None:
+            with open(served_path, 'rb') as file:
+                content = file.read()
+            memory_cache.set(key, content)
+        response = HttpResponse(content, content_type=content_type)
+    else:
+        # FileResponse, sunucu destekliyorsa wsgi.file_wrapper (sendfile) kullanır.
+        response = FileResponse(open(served_path, 'rb'), content_type=content_type, filename=os.path.basename(path))
+    response['Content-Length'] = str(size)
+    response['Accept-Ranges'] = 'bytes'
+    if encoding:
+        response['Content-Encoding'] = encoding
+    return response
+
+
+def serve_media(request, path):
+    return serve_file(request, path, settings.MEDIA_ROOT, accel_prefix=getattr(settings, 'MEDIA_ACCEL_REDIRECT', None))
+
+
+def serve_static(request, path):
+    return serve_file(request, path, settings.STATIC_ROOT, accel_prefix=getattr(settings, 'STATIC_ACCEL_REDIRECT', None), immutable_hashed=True)
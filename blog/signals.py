@@ -0,0 +1,115 @@
+from django.apps import apps
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models.signals import post_save, pre_delete, post_delete, m2m_changed, post_migrate
+
+from .caching import bump_content_generation, bump_chrome_version, bump_model_stamp
+from .images import get_variants, image_field_names
+from .routers import use_primary
+from .models import SiteSettings, NavbarLink, ImageJob, SearchDocument, SearchTerm, ContactMessage
+from .search import SEARCH_SOURCES, dependents_of, rebuild_index, reindex, reindex_objects
+from .tasks import enqueue_image
+
+# Sayfa içeriğini etkilemeyen, uygulamanın kendi iç tabloları.
+INTERNAL_MODELS = (ImageJob, SearchDocument, SearchTerm, ContactMessage)
+
+
+def content_changed(sender, **kwargs):
+    if kwargs.get('action', '').startswith('pre_'):
+        return
+    if 'model' in kwargs:
+        # m2m_changed: ilişkinin iki ucu da etkilenir.
+        model_names = (kwargs['instance'].__class__.__name__, kwargs['model'].__name__)
+    else:
+        model_names = (sender.__name__,)
+
+    # Damgalar commit'ten sonra değişir; aksi halde araya giren bir istek
+    # replica'dan eski veriyi okuyup yeni sürümün anahtarıyla önbelleğe yazabilir.
+    def bump():
+        bump_content_generation()
+        bump_model_stamp(*model_names)
+    transaction.on_commit(bump)
+
+
+def chrome_changed(sender, **kwargs):
+    transaction.on_commit(bump_chrome_version)
+
+
+def image_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    for field_name in image_field_names(sender):
+        file = getattr(instance, field_name)
+        if not file or not file.storage.exists(file.name):
+            continue
+        # Türev üretimi arka planda yapılır; hazır olana kadar şablonlar
+        # orijinal dosyayı gösterir.
+        if get_variants(file.name) is None:
+            enqueue_image(file.name, sender.__name__)
+
+
+def search_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    reindex_objects([instance, *dependents_of(instance)])
+
+
+def search_pre_delete(sender, instance, **kwargs):
+    # İlişkiler silme sırasında kopacağı için etkilenen kayıtlar önceden alınır.
+    instance._search_dependents = list(dependents_of(instance))
+
+
+def search_deleted(sender, instance, **kwargs):
+    reindex_objects([instance, *getattr(instance, '_search_dependents', [])])
+
+
+def search_m2m_changed(sender, instance, action, model, pk_set, **kwargs):
+    if action.startswith('pre_'):
+        return
+    reindex_objects([instance])
+    if pk_set:
+        reindex(model, pk_set)
+
+
+def build_empty_search_index(sender, using=DEFAULT_DB_ALIAS, **kwargs):
+    # 0008_search_index tabloları boş oluşturur; migrate sonrası indeks hiç
+    # kurulmamışsa mevcut içerik bir kez indekslenir. Okumalar da migrate
+    # edilen bağlantıdan yapılır.
+    if using != DEFAULT_DB_ALIAS or SearchDocument._meta.db_table not in connections[using].introspection.table_names():
+        return
+    with use_primary():
+        if not SearchDocument.objects.exists():
+            rebuild_index()
+
+
+def _search_related_models():
+    models = set(SEARCH_SOURCES)
+    for model, spec in SEARCH_SOURCES.items():
+        for path in spec['body']:
+            field = model._meta.get_field(path.split('.')[0])
+            if field.is_relation:
+                models.add(field.related_model)
+    return models
+
+
+def connect_content_signals():
+    post_migrate.connect(build_empty_search_index, sender=apps.get_app_config('blog'), dispatch_uid='blog-search-build')
+    for model in apps.get_app_config('blog').get_models():
+        if model in INTERNAL_MODELS:
+            continue
+        post_save.connect(content_changed, sender=model, dispatch_uid=f'blog-content-save-{model._meta.label}')
+        post_delete.connect(content_changed, sender=model, dispatch_uid=f'blog-content-delete-{model._meta.label}')
+        if image_field_names(model):
+            post_save.connect(image_saved, sender=model, dispatch_uid=f'blog-image-save-{model._meta.label}')
+        for field in model._meta.many_to_many:
+            through = field.remote_field.through
+            m2m_changed.connect(content_changed, sender=through, dispatch_uid=f'blog-content-m2m-{through._meta.label}')
+    for model in (SiteSettings, NavbarLink):
+        post_save.connect(chrome_changed, sender=model, dispatch_uid=f'blog-chrome-save-{model._meta.label}')
+        post_delete.connect(chrome_changed, sender=model, dispatch_uid=f'blog-chrome-delete-{model._meta.label}')
+    for model in _search_related_models():
+        post_save.connect(search_saved, sender=model, dispatch_uid=f'blog-search-save-{model._meta.label}')
+        pre_delete.connect(search_pre_delete, sender=model, dispatch_uid=f'blog-search-pre-delete-{model._meta.label}')
+        post_delete.connect(search_deleted, sender=model, dispatch_uid=f'blog-search-delete-{model._meta.label}')
+        for field in model._meta.many_to_many:
+            through = field.remote_field.through
+            m2m_changed.connect(search_m2m_changed, sender=through, dispatch_uid=f'blog-search-m2m-{through._meta.label}')
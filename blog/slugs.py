@@ -0,0 +1,94 @@
+import re
+from collections import Counter
+
+from django.db.models import Q
+from django.utils.text import slugify
+
+# slugify() NFKD ile aksanları ayırır; ancak "ı" ayrışmadığı için düşer
+# ("Işık" -> "isk"). Türkçe harfler önce ASCII karşılıklarına çevrilir.
+TURKISH_TRANSLITERATION = str.maketrans('ıİşŞğĞüÜöÖçÇ', 'iIsSgGuUoOcC')
+SUFFIX_RE = re.compile(r'^(?P<base>.*)-(?P<number>\d+)$')
+# Sonek için ayrılan yer ("-9999999").
+SUFFIX_ROOM = 8
+SLUG_QUERY_BATCH = 500
+PREFIX_QUERY_BATCH = 200
+# Önek aralığının üst sınırı; LIKE yerine aralık koşulu slug'ın benzersiz
+# indeksini kullanır.
+PREFIX_RANGE_END = '\U0010ffff'
+
+
+def slugify_tr(value):
+    return slugify(str(value).translate(TURKISH_TRANSLITERATION))
+
+
+def _stem(base, suffix, max_length):
+    return base[:max_length - len(suffix)].rstrip('-')
+
+
+def _in_batches(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def existing_slugs(queryset, bases, max_length):
+    # Önce tabanların kendisi tek bir IN sorgusuyla aranır. Yalnızca çakışan
+    # (veritabanında olan ya da listede tekrarlanan) tabanlar için "taban-N"
+    # biçimli slug'lar ikinci bir aralık sorgusuyla okunur. Sonek eklenince
+    # kısalacak uzun tabanlarda kısaltılmış önekle başlayan tüm slug'lar alınır.
+    counts = Counter(bases)
+    taken = set()
+    for chunk in _in_batches(sorted(counts), SLUG_QUERY_BATCH):
+        taken.update(queryset.filter(slug__in=chunk).values_list('slug', flat=True))
+    crowded = sorted(base for base, count in counts.items() if count > 1 or base in taken)
+    for chunk in _in_batches(crowded, PREFIX_QUERY_BATCH):
+        condition = Q()
+        for base in chunk:
+            prefix = _stem(base, '-' * SUFFIX_ROOM, max_length) if len(base) > max_length - SUFFIX_ROOM else f'{base}-'
+            condition |= Q(slug__gte=prefix, slug__lt=prefix + PREFIX_RANGE_END)
+        taken.update(queryset.filter(condition).values_list('slug', flat=True))
+    return taken
+
+
+def suffix_index(slugs):
+    # "taban-N" biçimli slug'lar tek geçişte (sonek öncesi kısım, basamak
+    # sayısı) -> en büyük N olarak toplanır.
+    index = {}
+    for slug in slugs:
+        match = SUFFIX_RE.match(slug)
+        if match:
+            key = (match['base'], len(match['number']))
+            index[key] = max(index.get(key, 0), int(match['number']))
+    return index
+
+
+def pick_slugs(bases, taken, max_length):
+    # Çakışma varsa sorgu yerine bellekte, mevcut en büyük sonekin bir
+    # fazlası seçilir. En büyük sonek taban başına bir kez bulunur, sonra
+    # sayaçtan devam edilir; aynı tabanlı binlerce satır doğrusal sürede
+    # işlenir. `taken` seçilen slug'larla güncellenir.
+    index = suffix_index(taken)
+    next_numbers = {}
+    slugs = []
+    for base in bases:
+        if base not in taken:
+            slug = base
+        else:
+            number = next_numbers.get(base)
+            if number is None:
+                # Kısaltma sonekin uzunluğuna bağlı olduğundan her basamak
+                # sayısı için ayrı bakılır.
+                number = 1
+                for digits in range(1, SUFFIX_ROOM):
+                    highest = index.get((_stem(base, '-' + '0' * digits, max_length), digits))
+                    if highest:
+                        number = max(number, highest + 1)
+            while True:
+                suffix = f'-{number}'
+                slug = _stem(base, suffix, max_length) + suffix
+                number += 1
+                if slug not in taken:
+                    break
+            next_numbers[base] = number
+        taken.add(slug)
+        slugs.append(slug)
+    return slugs
@@ -0,0 +1,127 @@
+import gzip
+import re
+from functools import lru_cache
+
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.templatetags.static import static
+
+try:
+    import brotli
+except ImportError:  # brotli opsiyoneldir; yoksa yalnızca .gz üretilir.
+    brotli = None
+
+try:
+    import rjsmin
+except ImportError:  # rjsmin opsiyoneldir; yoksa JS dosyaları küçültülmeden kopyalanır.
+    rjsmin = None
+
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.svg', '.json', '.txt', '.html', '.map', '.ttf', '.eot', '.ico')
+
+# CDN'den yüklenen kütüphaneler: anahtar -> (yerel static yolu, CDN adresi).
+# Yerel kopya static/vendor altında bulunana kadar şablonlar CDN adresini
+# kullanmaya devam eder.
+VENDOR_ASSETS = {
+    'aos.css': ('vendor/aos/aos.css', 'https://unpkg.com/aos@2.3.1/dist/aos.css'),
+    'aos.js': ('vendor/aos/aos.js', 'https://unpkg.com/aos@2.3.1/dist/aos.js'),
+    'typed.js': ('vendor/typed/typed.min.js', 'https://cdn.jsdelivr.net/npm/typed.js@2.0.12/lib/typed.min.js'),
+    'fontawesome.css': ('vendor/fontawesome/css/all.min.css', 'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css'),
+}
+# all.min.css içindeki ../webfonts/ referansları için indirilecek dosyalar.
+VENDOR_FILES = [
+    (f'vendor/fontawesome/webfonts/{font}.{extension}', f'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/webfonts/{font}.{extension}')
+    for font in ('fa-brands-400', 'fa-regular-400', 'fa-solid-900', 'fa-v4compatibility')
+    for extension in ('woff2', 'ttf')
+]
+# Yerel yol -> sha256. `manage.py vendor_assets` yalnızca özeti burada
+# sabitlenmiş dosyaları indirir ve özeti tutmayan içeriği diske yazmaz.
+# Font Awesome dosyaları depoda static/vendor altındadır; AOS ve Typed.js
+# için özet eklenene kadar CDN kullanılır (özetler
+# `manage.py vendor_assets --print-hashes` ile alınıp buraya eklenir).
+VENDOR_SHA256 = {
+    'vendor/fontawesome/css/all.min.css': '1edb1725a9ea8ca4dcf2f5508cee183218aa1685e47c1b23056717f754f58ebf',
+    'vendor/fontawesome/webfonts/fa-brands-400.woff2': '748332090c4b8e20f95d0ff59f0be20fa9c889359d3b36d4b886d73376054207',
+    'vendor/fontawesome/webfonts/fa-brands-400.ttf': '20c4a58bc9d1d69e935d06f1528923646a715be5e218665655cade8f5f1b8c00',
+    'vendor/fontawesome/webfonts/fa-regular-400.woff2': '8e7e5ea1b15f62ab14dbd41768e8fbcd21cc859a4ea5da812457ee714299fb35',
+    'vendor/fontawesome/webfonts/fa-regular-400.ttf': '528d022dce6725f8a0811fd91d8e6513445c81ef33353a5c3234eab932551abf',
+    'vendor/fontawesome/webfonts/fa-solid-900.woff2': '7152a6933ee3d690ec2af3d09da9d701723d16aa3410a6d80f28ff8866f3b880',
+    'vendor/fontawesome/webfonts/fa-solid-900.ttf': '67a65763c7f80903d81603bbeb9049fc2bf28508479b83ed011fe24c71fa950a',
+    'vendor/fontawesome/webfonts/fa-v4compatibility.woff2': '694a17c3d9d6c05f8aac63c544615552a4b220e9a4de863d87341a6bcfc1bc8d',
+    'vendor/fontawesome/webfonts/fa-v4compatibility.ttf': '0515a423f828ce4e6accf92a2ea0b03d19d31cc86d9af0373291e1fd4db5f348',
+}
+
+# Yorumlar, tırnaklı dizgiler ve url() değerleri; dizgiler ve url() olduğu
+# gibi bırakılır, yalnızca aradaki CSS küçültülür.
+CSS_STRING = r'"(?:\\.|[^"\\])*"|' + r"'(?:\\.|[^'\\])*'"
+CSS_COMMENT_RE = re.compile(rf'({CSS_STRING})|/\*.*?\*/', re.S)
+CSS_LITERAL_RE = re.compile(rf'({CSS_STRING}|url\(\s*(?:{CSS_STRING}|[^)]*)\s*\))', re.S | re.I)
+
+
+@lru_cache(maxsize=None)
+def vendor_asset_url(key):
+    local_path, cdn_url = VENDOR_ASSETS[key]
+    return static(local_path) if finders.find(local_path) else cdn_url
+
+
+def _minify_css_code(css):
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,])\s*', r'\1', css)
+    return css.replace(';}', '}')
+
+
+def minify_css(css):
+    css = CSS_COMMENT_RE.sub(lambda match: match.group(1) or '', css)
+    parts = CSS_LITERAL_RE.split(css)
+    # split() yakalanan grupları tek indekslere koyar: çiftler CSS, tekler dizgi/url().
+    return ''.join(part if index % 2 else _minify_css_code(part) for index, part in enumerate(parts)).strip()
+
+
+def minify_js(js):
+    # /*! ... */ lisans yorumları korunur.
+    return rjsmin.jsmin(js, keep_bang_comments=True)
+
+
+def minifier_for(name):
+    # .min.css/.min.js dosyaları zaten küçültülmüş kabul edilir.
+    if name.endswith('.css') and not name.endswith('.min.css'):
+        return minify_css
+    if name.endswith('.js') and not name.endswith('.min.js') and rjsmin is not None:
+        return minify_js
+    return None
+
+
+def compress_file(storage, name):
+    with storage.open(name) as file:
+        content = file.read()
+    variants = [('.gz', gzip.compress(content, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append(('.br', brotli.compress(content)))
+    for suffix, compressed in variants:
+        if len(compressed) >= len(content):
+            continue
+        with open(storage.path(name + suffix), 'wb') as file:
+            file.write(compressed)
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    # collectstatic sırasında CSS ve JS küçültülür, ardından içerik özetli isimler
+    # üretilir ve her dosyanın .gz/.br kopyası yazılır. Manifest süreç
+    # başında belleğe yüklenir; {% static %} dosya sistemine dokunmaz.
+
+    def post_process(self, paths, dry_run=False, **options):
+        if not dry_run:
+            paths = dict(paths)
+            for name, (storage, path) in list(paths.items()):
+                minify = minifier_for(name)
+                if minify is not None:
+                    with storage.open(path) as file:
+                        content = file.read().decode('utf-8')
+                    with open(self.path(name), 'w', encoding='utf-8') as file:
+                        file.write(minify(content))
+                    # Özet, küçültülmüş kopyadan hesaplansın.
+                    paths[name] = (self, name)
+        yield from super().post_process(paths, dry_run, **options)
+        if not dry_run:
+            for name in set(self.hashed_files.values()) | {self.manifest_name}:
+                if name.endswith(COMPRESSIBLE_EXTENSIONS) and self.exists(name):
+                    compress_file(self, name)
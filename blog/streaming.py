@@ -0,0 +1,54 @@
+from asgiref.sync import sync_to_async
+from django.http import StreamingHttpResponse
+from django.middleware.csrf import get_token
+from django.template import RequestContext, engines
+
+from .caching import render_cached_fragment
+from .loaders import HOMEPAGE_SECTIONS, aload_homepage
+
+# index.html bu değerle işlendiğinde bölümlerin yerine yalnızca işaret
+# yazılır; sayfa işaretin iki yanından <head>+navbar ve footer olarak ikiye
+# bölünür.
+STREAM_MARKER = '__blog_homepage_sections__'
+
+
+def homepage_chunks(request, context):
+    # İlk parça <head> (preload linkleri dahil) ve navbar'dır; tarayıcı CSS,
+    # JS ve fontları indirmeye başlarken bölümler sırayla işlenip gönderilir.
+    # Bölümler tek bir bağlam üzerinde, cached_section etiketiyle aynı
+    # önbellek üzerinden işlenir.
+    engine = engines['django'].engine
+    page = engine.get_template('index.html')
+    # Bağlam sözlüğü kopyalanmaz; astream_homepage verileri sonradan ekler.
+    context['stream_marker'] = STREAM_MARKER
+    template_context = RequestContext(request, context)
+    with template_context.bind_template(page):
+        head, tail = page.render(template_context).split(STREAM_MARKER)
+        yield head
+        for template_name in HOMEPAGE_SECTIONS:
+            section = engine.get_template(template_name)
+            yield render_cached_fragment(template_name, lambda: section.render(template_context), request)
+        yield tail
+
+
+def stream_homepage(request, context):
+    # {% csrf_token %} akış sırasında, CsrfViewMiddleware yanıtı işledikten
+    # sonra çalışır; çerezin yanıta eklenmesi için token önceden alınır.
+    get_token(request)
+    return StreamingHttpResponse(homepage_chunks(request, context))
+
+
+def astream_homepage(request, context):
+    # Parçalar ORM'in senkron thread'inde tek tek üretilir; <head> gönderildikten
+    # sonra önbellekte olmayan bölümlerin verisi birlikte istenir.
+    get_token(request)
+    chunks = homepage_chunks(request, context)
+    next_chunk = sync_to_async(lambda: next(chunks, None))
+
+    async def generate():
+        yield await next_chunk()
+        await aload_homepage(context)
+        while (chunk := await next_chunk()) is not None:
+            yield chunk
+
+    return StreamingHttpResponse(generate())
@@ -0,0 +1,134 @@
+import hashlib
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .caching import bump_content_generation, bump_model_stamp
+from .images import IMAGE_CACHE_KEY, generate_variants, get_variants, manifest_name, replace_file, variant_base
+from .models import ImageJob
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 3
+
+# Görsel işleri admin isteğini bekletmemek için süreç içi bir thread
+# havuzunda çalışır. İşler veritabanında tutulduğu için worker yeniden
+# başlasa bile `process_image_jobs` komutuyla tamamlanabilir.
+_executor = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=getattr(settings, 'IMAGE_JOB_WORKERS', 2), thread_name_prefix='image-jobs')
+    return _executor
+
+
+def file_hash(name, storage=default_storage):
+    digest = hashlib.sha256()
+    with storage.open(name) as file:
+        for chunk in file.chunks():
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def enqueue_image(name, model_name=''):
+    active = ImageJob.objects.filter(name=name, status__in=[ImageJob.STATUS_PENDING, ImageJob.STATUS_RUNNING])
+    if active.exists():
+        return None
+    job = ImageJob.objects.create(name=name, model_name=model_name)
+    transaction.on_commit(lambda: submit(job.pk))
+    return job
+
+
+def submit(job_id):
+    if getattr(settings, 'IMAGE_JOBS_EAGER', False):
+        return run_job(job_id)
+    _get_executor().submit(_run_in_thread, job_id)
+
+
+def _run_in_thread(job_id):
+    close_old_connections()
+    try:
+        run_job(job_id)
+    finally:
+        close_old_connections()
+
+
+def _reuse_variants(job, digest):
+    # Aynı içeriğe sahip bir dosyanın türevleri varsa yeniden üretmek yerine
+    # bu dosyanın adıyla kopyalanır; diğer yükleme silinse bile türevler kalır.
+    duplicate = (
+        ImageJob.objects.filter(file_hash=digest, status=ImageJob.STATUS_DONE)
+        .exclude(name=job.name).order_by('-updated_at').first()
+    )
+    manifest = duplicate and get_variants(duplicate.name)
+    if not manifest:
+        return None
+    paths = [path for variant in manifest['variants'].values() for _, path in variant['files']]
+    if not all(default_storage.exists(path) for path in paths):
+        return None
+    variants = {}
+    for extension, variant in manifest['variants'].items():
+        entries = []
+        for width, path in variant['files']:
+            target = f"{variant_base(job.name)}-{width}w.{extension}"
+            with default_storage.open(path) as file:
+                replace_file(default_storage, target, file.read())
+            entries.append([width, target])
+        variants[extension] = dict(variant, files=entries)
+    manifest = dict(manifest, source=job.name, variants=variants)
+    replace_file(default_storage, manifest_name(job.name), json.dumps(manifest).encode())
+    cache.set(IMAGE_CACHE_KEY.format(job.name), manifest, None)
+    return manifest
+
+
+def run_job(job_id, force=False):
+    claimable = [ImageJob.STATUS_PENDING] + ([ImageJob.STATUS_FAILED, ImageJob.STATUS_DONE] if force else [])
+    claimed = ImageJob.objects.filter(pk=job_id, status__in=claimable).update(
+        status=ImageJob.STATUS_RUNNING, updated_at=timezone.now()
+    )
+    if not claimed:
+        return False
+    job = ImageJob.objects.get(pk=job_id)
+    while True:
+        job.attempts += 1
+        try:
+            job.file_hash = file_hash(job.name)
+            if force or not _reuse_variants(job, job.file_hash):
+                generate_variants(job.name)
+        except OSError as exc:
+            job.last_error = str(exc)
+            if job.attempts < MAX_ATTEMPTS:
+                logger.warning("Görsel işi tekrar denenecek (%s/%s): %s", job.attempts, MAX_ATTEMPTS, job.name)
+                time.sleep(getattr(settings, 'IMAGE_JOB_RETRY_DELAY', 2) * job.attempts)
+                continue
+            job.status = ImageJob.STATUS_FAILED
+            job.save(update_fields=['attempts', 'file_hash', 'last_error', 'status', 'updated_at'])
+            logger.error("Görsel işi başarısız: %s", job.name)
+            return False
+        except Exception as exc:
+            # Bozuk görsel vb. tekrar denemeyle düzelmez; iş 'işleniyor'
+            # durumunda kalmasın.
+            job.last_error = str(exc)
+            job.status = ImageJob.STATUS_FAILED
+            job.save(update_fields=['attempts', 'file_hash', 'last_error', 'status', 'updated_at'])
+            logger.exception("Görsel işi başarısız: %s", job.name)
+            return False
+        job.status = ImageJob.STATUS_DONE
+        job.last_error = ''
+        job.save(update_fields=['attempts', 'file_hash', 'last_error', 'status', 'updated_at'])
+        break
+
+    # Türevler hazır; önbellekteki sayfalar ve bölümler yeni srcset ile üretilsin.
+    bump_content_generation()
+    if job.model_name:
+        bump_model_stamp(job.model_name)
+    return True
@@ -0,0 +1,10 @@
+from django import template
+
+from ..storage import vendor_asset_url
+
+register = template.Library()
+
+
+@register.simple_tag
+def vendor_asset(key):
+    return vendor_asset_url(key)
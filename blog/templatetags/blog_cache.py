@@ -0,0 +1,13 @@
+from django import template
+from django.utils.safestring import mark_safe
+
+from ..caching import render_cached_fragment
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def cached_section(context, template_name):
+    section = context.template.engine.get_template(template_name)
+    html = render_cached_fragment(template_name, lambda: section.render(context), context.get('request'))
+    return mark_safe(html)
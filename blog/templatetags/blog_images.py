@@ -0,0 +1,38 @@
+from django import template
+from django.core.files.storage import default_storage
+from django.utils.html import format_html, format_html_join
+
+from ..images import get_variants
+
+register = template.Library()
+
+
+def _srcset(entries):
+    return ', '.join(f"{default_storage.url(path)} {width}w" for width, path in entries)
+
+
+@register.simple_tag
+def responsive_image(image, sizes='100vw', **attrs):
+    if not image:
+        return ''
+    attrs.setdefault('loading', 'lazy')
+    attrs.setdefault('decoding', 'async')
+    manifest = get_variants(image.name)
+    if manifest is None:
+        # Türevler henüz hazır değilse orijinal dosya kullanılır.
+        return format_html('<img src="{}"{}>', image.url, format_html_join('', ' {}="{}"', attrs.items()))
+
+    variants = dict(manifest['variants'])
+    fallback = variants.pop('jpg')
+    sources = format_html_join(
+        '', '<source type="{}" srcset="{}" sizes="{}">',
+        ((variant['type'], _srcset(variant['files']), sizes) for variant in variants.values()),
+    )
+    attrs.update({
+        'src': default_storage.url(fallback['files'][-1][1]),
+        'srcset': _srcset(fallback['files']),
+        'sizes': sizes,
+        'width': manifest['width'],
+        'height': manifest['height'],
+    })
+    return format_html('<picture>{}<img{}></picture>', sources, format_html_join('', ' {}="{}"', attrs.items()))
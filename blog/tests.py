@@ -1,3 +1,1439 @@
-from django.test import TestCase
+import hashlib
+import json
+import re
+import tempfile
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from io import BytesIO, StringIO
+from pathlib import Path
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.cache import cache, caches
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.paginator import UnorderedObjectListWarning
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import OperationalError, connection, connections, router, transaction
+from django.template import Context, Template
+from django.test import AsyncClient, Client, RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.urls import resolve, reverse
+from django.utils import timezone
+from PIL import Image
+
+from .benchmark import baseline_entry, compare_results, measure_route, percentile, route_paths, seed_dataset, url_variant
+from .contact import deliver_pending
+from .caching import bump_content_generation, get_content_generation, get_site_chrome, bump_chrome_version, page_cache_key, fragment_stats, strip_csrf_token
+from .images import get_variants, variant_base
+from .slugs import slugify_tr
+from .signals import build_empty_search_index
+from .search import SEARCH_SOURCES, fold, matching_ids, query_terms, rebuild_index, search_documents, stem
+from .metrics import render_metrics, reset_metrics
+from .middleware import PrimaryDatabaseMiddleware, RequestMetricsMiddleware
+from .pagination import keyset_page
+from .routers import use_primary
+from .serving import cache_control_for
+from .storage import VENDOR_ASSETS, VENDOR_SHA256, minify_css, rjsmin
+from .streaming import STREAM_MARKER
+from .tasks import run_job
+from .api import API_RESOURCES
+from .loaders import CERTIFICATE_FRAGMENT_SIZE, CERTIFICATE_PREVIEW_COUNT, HOMEPAGE_QUERY_BUDGET, annotate_tag_usage, fragment_paths, load_homepage, tag_cloud
+from .models import BlogPost, Category, SubCategory, SearchDocument, Education, Experience, Certificate, Project, Tag, CodeExample, SkillCategory, Skill, ProjectCategory, CodeLanguage, CodeCategory, NavbarLink, SiteSettings, ImageJob, ContactMessage
+
+TEST_SETTINGS = {
+    'CACHES': {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'stamps': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'stamps'},
+    },
+    'MEDIA_ROOT': tempfile.mkdtemp(),
+    'STORAGES': {
+        'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    },
+    # Akış modu StreamingHomepageTests'te ayrıca denenir.
+    'HOMEPAGE_STREAMING': False,
+}
+
+
+def create_portfolio(rows):
+    SiteSettings.objects.get_or_create(site_name="Test")
+    NavbarLink.objects.get_or_create(title="Projeler", section="projects")
+    tags = [Tag.objects.get_or_create(name=f"etiket-{i}")[0] for i in range(3)]
+    project_category, _ = ProjectCategory.objects.get_or_create(name="Web")
+    skill_category, _ = SkillCategory.objects.get_or_create(name="Backend")
+    language, _ = CodeLanguage.objects.get_or_create(name="Python")
+    code_category, _ = CodeCategory.objects.get_or_create(name="Temel", language=language)
+    for i in range(rows):
+        suffix = f"{Project.objects.count()}"
+        education = Education.objects.create(title=f"Bölüm {suffix}", school="Okul", start_date=date(2020, 1, 1), description="-")
+        experience = Experience.objects.create(title=f"Pozisyon {suffix}", company="Şirket", start_date=date(2021, 1, 1), description="-")
+        project = Project.objects.create(title=f"Proje {suffix}", description="-", category=project_category, image="projects/1.jpg")
+        for obj in (education, experience, project):
+            obj.tags.set(tags)
+        Certificate.objects.create(title=f"Sertifika {suffix}", issuer="Kurum", date=date(2022, 1, 1))
+        Skill.objects.create(category=skill_category, name=f"Yetenek {suffix}")
+        CodeExample.objects.create(title=f"Örnek {suffix}", language=language, category=code_category, code="print(1)", description="-")
+
+
+@override_settings(**TEST_SETTINGS)
+class HomepageQueryBudgetTests(TestCase):
+    def count_homepage_queries(self):
+        # Bütçe önbelleksiz (soğuk) render için geçerlidir; içerik sürümü ve
+        # site ayarları süreç başına bir kez yüklendiği için ölçüme dahil edilmez.
+        cache.clear()
+        get_content_generation()
+        get_site_chrome()
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse('blog:index'))
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_homepage_stays_within_query_budget(self):
+        create_portfolio(rows=5)
+        self.assertLessEqual(self.count_homepage_queries(), HOMEPAGE_QUERY_BUDGET)
+
+    def test_homepage_query_count_does_not_grow_with_rows(self):
+        create_portfolio(rows=2)
+        small = self.count_homepage_queries()
+        create_portfolio(rows=10)
+        self.assertEqual(self.count_homepage_queries(), small)
+
+    def test_homepage_query_count_does_not_grow_with_code_languages(self):
+        create_portfolio(rows=2)
+        before = self.count_homepage_queries()
+        for name in ("Go", "Rust", "C#"):
+            language = CodeLanguage.objects.create(name=name)
+            category = CodeCategory.objects.create(name=f"{name} Temel", language=language)
+            CodeExample.objects.create(title="Örnek", language=language, category=category, code="-", description="-")
+        self.assertEqual(self.count_homepage_queries(), before)
+
+
+@override_settings(**TEST_SETTINGS)
+class CodeExampleGroupingTests(TestCase):
+    def test_only_non_empty_language_category_pairs_are_grouped(self):
+        python = CodeLanguage.objects.create(name="Python")
+        CodeLanguage.objects.create(name="Boş Dil")
+        basics = CodeCategory.objects.create(name="Temel", language=python)
+        CodeCategory.objects.create(name="Boş Kategori", language=python)
+        CodeExample.objects.create(title="Merhaba", language=python, category=basics, code="-", description="-")
+        CodeExample.objects.create(title="Döngü", language=python, category=basics, code="-", description="-")
+
+        context = load_homepage()
+
+        self.assertEqual([language.example_count for language in context['code_languages']], [2])
+        self.assertEqual(len(context['code_groups']), 1)
+        group = context['code_groups'][0]
+        self.assertEqual((group['language']['slug'], group['category']['slug']), (python.slug, basics.slug))
+        self.assertEqual(group['count'], 2)
+
+
+@override_settings(**TEST_SETTINGS)
+class ContentPageCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_portfolio(rows=2)
+
+    def test_repeat_request_is_served_without_queries(self):
+        self.client.get(reverse('blog:index'))
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('blog:index'))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Proje 0")
+
+    def test_model_changes_bump_generation_and_show_up(self):
+        self.client.get(reverse('blog:index'))
+        generation = get_content_generation()
+        project = Project.objects.get(title="Proje 0")
+        project.title = "Yeni Proje"
+        with self.captureOnCommitCallbacks(execute=True):
+            project.save()
+            # Commit'ten önce sürüm değişmez; araya giren istek eski veriyi
+            # yeni sürümle önbelleğe yazamaz.
+            self.assertEqual(get_content_generation(), generation)
+        self.assertGreater(get_content_generation(), generation)
+        self.assertContains(self.client.get(reverse('blog:index')), "Yeni Proje")
+
+        generation = get_content_generation()
+        with self.captureOnCommitCallbacks(execute=True):
+            project.tags.clear()
+        self.assertGreater(get_content_generation(), generation)
+
+    def test_concurrent_bumps_never_share_a_generation(self):
+        stamps = {'BACKEND': 'blog.cache_backends.StampFileCache', 'LOCATION': tempfile.mkdtemp(), 'TIMEOUT': None}
+        with override_settings(CACHES=dict(TEST_SETTINGS['CACHES'], stamps=stamps)):
+            get_content_generation()
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                generations = list(executor.map(lambda _: bump_content_generation()[0], range(200)))
+        self.assertEqual(len(set(generations)), 200)
+
+    def test_generation_survives_page_cache_eviction_and_never_goes_back(self):
+        generation = get_content_generation()
+        cache.clear()
+        self.assertEqual(get_content_generation(), generation)
+        # Damga önbelleği tamamen silinse bile yeni sayaç eskisinden büyüktür.
+        caches['stamps'].clear()
+        self.assertGreater(get_content_generation(), generation)
+
+    def test_page_key_ignores_query_parameters_the_pages_do_not_read(self):
+        factory = RequestFactory()
+        key = page_cache_key(factory.get('/blog/'), 1)
+        self.assertEqual(page_cache_key(factory.get('/blog/?utm_source=x&fbclid=y'), 1), key)
+        self.assertNotEqual(page_cache_key(factory.get('/blog/?after=abc'), 1), key)
+        self.assertEqual(page_cache_key(factory.get('/blog/?before=b&after=a'), 1), page_cache_key(factory.get('/blog/?after=a&before=b'), 1))
+
+    def test_conditional_request_returns_not_modified(self):
+        response = self.client.get(reverse('blog:index'))
+        self.assertIn('Last-Modified', response)
+        response = self.client.get(reverse('blog:index'), HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_cached_page_carries_the_visitors_csrf_token(self):
+        self.client.get(reverse('blog:index'))
+        response = self.client.get(reverse('blog:index'))
+        self.assertNotContains(response, "__CSRF_TOKEN__")
+        self.assertContains(response, 'name="csrfmiddlewaretoken"')
+
+
+@override_settings(**TEST_SETTINGS)
+class SiteChromeTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        # Damgalar commit'ten sonra değişir (transaction.on_commit).
+        with self.captureOnCommitCallbacks(execute=True):
+            self.settings_row = SiteSettings.objects.create(site_name="Eski Ad")
+            NavbarLink.objects.create(title="Hakkımda", section="about")
+
+    def test_chrome_is_memoized_between_requests(self):
+        get_site_chrome()
+        with self.assertNumQueries(0):
+            chrome = get_site_chrome()
+        self.assertEqual(chrome['site_settings'].site_name, "Eski Ad")
+        self.assertEqual([link.title for link in chrome['navbar_links']], ["Hakkımda"])
+
+    def test_saving_settings_or_links_invalidates_chrome(self):
+        get_site_chrome()
+        self.settings_row.site_name = "Yeni Ad"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.settings_row.save()
+        self.assertEqual(get_site_chrome()['site_settings'].site_name, "Yeni Ad")
+        with self.captureOnCommitCallbacks(execute=True):
+            NavbarLink.objects.create(title="İletişim", section="contact", order=1)
+        self.assertEqual(len(get_site_chrome()['navbar_links']), 2)
+
+    def test_version_stamp_change_from_another_worker_is_picked_up(self):
+        get_site_chrome()
+        SiteSettings.objects.filter(pk=self.settings_row.pk).update(site_name="Diğer Worker")
+        bump_chrome_version()
+        self.assertEqual(get_site_chrome()['site_settings'].site_name, "Diğer Worker")
+
+
+@override_settings(**TEST_SETTINGS)
+class SectionFragmentCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        fragment_stats.clear()
+        create_portfolio(rows=2)
+
+    def render_homepage_without_page_cache(self):
+        cache.delete(page_cache_key(RequestFactory().get(reverse('blog:index')), get_content_generation()))
+        return self.client.get(reverse('blog:index'))
+
+    def test_all_sections_are_served_from_cache_on_rerender(self):
+        self.render_homepage_without_page_cache()
+        get_site_chrome()
+        with self.assertNumQueries(0):
+            response = self.render_homepage_without_page_cache()
+        self.assertContains(response, "Sertifika 0")
+        self.assertContains(response, 'name="csrfmiddlewaretoken"')
+        self.assertEqual(fragment_stats['sections/skills.html'], {'hits': 1, 'misses': 1})
+
+    def test_editing_a_certificate_only_rerenders_certificates(self):
+        self.render_homepage_without_page_cache()
+        certificate = Certificate.objects.first()
+        certificate.title = "Güncel Sertifika"
+        with self.captureOnCommitCallbacks(execute=True):
+            certificate.save()
+        response = self.render_homepage_without_page_cache()
+        self.assertContains(response, "Güncel Sertifika")
+        self.assertEqual(fragment_stats['sections/certificates.html']['misses'], 2)
+        self.assertEqual(fragment_stats['sections/skills.html'], {'hits': 1, 'misses': 1})
+        self.assertEqual(fragment_stats['sections/projects.html'], {'hits': 1, 'misses': 1})
+
+
+@override_settings(**TEST_SETTINGS)
+class ExportStaticTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_portfolio(rows=2)
+        self.output = Path(tempfile.mkdtemp())
+
+    def export(self):
+        out = StringIO()
+        call_command('export_static', output=str(self.output), no_assets=True, stdout=out)
+        return out.getvalue()
+
+    def test_exports_index_and_detail_pages(self):
+        self.export()
+        self.assertTrue((self.output / 'index.html').exists())
+        project = Project.objects.first()
+        self.assertIn(project.title, (self.output / 'projeler' / project.slug / 'index.html').read_text())
+
+    def test_incremental_export_only_rewrites_changed_pages(self):
+        self.export()
+        self.assertIn("0 sayfa yazıldı", self.export())
+        project = Project.objects.first()
+        project.description = "Güncellendi"
+        with self.captureOnCommitCallbacks(execute=True):
+            project.save()
+        # Değişen proje, 5 liste sayfası, 1 kod parçası ve updated_at alanı
+        # olmayan 2 yetenek sayfası.
+        self.assertIn("9 sayfa yazıldı", self.export())
+
+    def test_exports_blog_archive_pages_linked_from_posts(self):
+        category = Category.objects.create(name="Django")
+        subcategory = SubCategory.objects.create(name="ORM", category=category)
+        post = BlogPost.objects.create(
+            title="Sorgular", content="-", category=category, subcategory=subcategory,
+            is_published=True, published_at=timezone.make_aware(datetime(2024, 3, 5)),
+        )
+        post.tags.set([Tag.objects.get(name="etiket-0")])
+        BlogPost.objects.create(title="Taslak", content="-", category=Category.objects.create(name="Boş"))
+        self.export()
+        for path in ('blog', 'blog/kategori/django', f'blog/alt-kategori/{subcategory.slug}', 'blog/etiket/etiket-0', 'blog/arsiv/2024/3'):
+            self.assertIn("Sorgular", (self.output / path / 'index.html').read_text())
+        self.assertFalse((self.output / 'blog' / 'kategori' / 'bos').exists())
+
+
+def make_image(width, height, name='gorsel.png'):
+    buffer = BytesIO()
+    Image.new('RGBA', (width, height), (200, 30, 30, 128)).save(buffer, 'PNG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+
+@override_settings(**TEST_SETTINGS, IMAGE_JOBS_EAGER=True, IMAGE_JOB_RETRY_DELAY=0)
+class ResponsiveImageTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def create_project(self, image, title="Görselli"):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Project.objects.create(title=title, description="-", image=image)
+
+    def test_saving_an_image_field_generates_width_buckets(self):
+        project = self.create_project(make_image(1000, 500))
+        manifest = get_variants(project.image.name)
+        self.assertEqual((manifest['width'], manifest['height']), (1000, 500))
+        self.assertEqual([width for width, _ in manifest['variants']['jpg']['files']], [320, 640, 960, 1000])
+        self.assertIn('webp', manifest['variants'])
+        self.assertEqual(ImageJob.objects.get().status, ImageJob.STATUS_DONE)
+
+    def test_template_tag_emits_srcset_and_intrinsic_size(self):
+        project = self.create_project(make_image(700, 350))
+        html = Template('{% load blog_images %}{% responsive_image project.image sizes="50vw" alt="x" %}').render(Context({'project': project}))
+        self.assertIn('type="image/webp"', html)
+        self.assertIn('640w', html)
+        self.assertIn('width="700" height="350"', html)
+        self.assertIn('loading="lazy"', html)
+
+    def test_template_tag_falls_back_to_original_until_job_runs(self):
+        project = Project.objects.create(title="Bekleyen", description="-", image=make_image(400, 200))
+        self.assertEqual(ImageJob.objects.get().status, ImageJob.STATUS_PENDING)
+        html = Template('{% load blog_images %}{% responsive_image project.image alt="x" %}').render(Context({'project': project}))
+        self.assertIn(f'src="{project.image.url}"', html)
+        self.assertNotIn('srcset', html)
+
+    def test_identical_upload_reuses_existing_variants(self):
+        first = self.create_project(make_image(500, 500, 'ayni.png'))
+        second = self.create_project(make_image(500, 500, 'ayni.png'), title="Kopya")
+        self.assertNotEqual(first.image.name, second.image.name)
+        jobs = ImageJob.objects.order_by('created_at')
+        self.assertEqual(jobs[0].file_hash, jobs[1].file_hash)
+        manifest = get_variants(second.image.name)
+        self.assertEqual(manifest['width'], 500)
+        # Türevler ikinci dosyanın kendi adıyla kopyalanır; ilk dosyanın
+        # türevleri silinse de ikincisininkiler kalır.
+        for variant in get_variants(first.image.name)['variants'].values():
+            for _, path in variant['files']:
+                default_storage.delete(path)
+        paths = [path for variant in manifest['variants'].values() for _, path in variant['files']]
+        self.assertTrue(all(path.startswith(variant_base(second.image.name)) for path in paths))
+        self.assertTrue(all(default_storage.exists(path) for path in paths))
+
+    def test_failing_job_is_retried_then_marked_failed(self):
+        job = ImageJob.objects.create(name="projects/olmayan.png")
+        self.assertFalse(run_job(job.pk))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (ImageJob.STATUS_FAILED, 3))
+
+        out = StringIO()
+        call_command('process_image_jobs', retry_failed=True, stdout=out)
+        self.assertIn("1 iş başarısız", out.getvalue())
+
+    def test_unexpected_error_marks_job_failed_instead_of_leaving_it_running(self):
+        project = Project.objects.create(title="Bozuk", description="-", image=make_image(400, 200))
+        job = ImageJob.objects.get()
+        with mock.patch('blog.tasks.generate_variants', side_effect=ValueError("bozuk görsel")), self.assertLogs('blog.tasks', 'ERROR'):
+            self.assertFalse(run_job(job.pk))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts, job.last_error), (ImageJob.STATUS_FAILED, 1, "bozuk görsel"))
+        self.assertIsNone(get_variants(project.image.name))
+
+
+@override_settings(**TEST_SETTINGS)
+class StaticPipelineTests(TestCase):
+    def test_minify_css_strips_comments_and_whitespace(self):
+        css = "/* yorum */\n.a , .b {\n    color: red;\n    margin: 0 auto;\n}\n"
+        self.assertEqual(minify_css(css), ".a,.b{color: red;margin: 0 auto}")
+
+    def test_minify_css_leaves_strings_and_urls_untouched(self):
+        css = '.a::before {\n  content: "a , b ;  }";\n  background: url( "x  y.png" ) ;\n}\n.b { mask: url(data:image/svg+xml;utf8,<svg a="1" ; />); content: "/* yok */" }'
+        self.assertEqual(
+            minify_css(css),
+            '.a::before{content: "a , b ;  }";background: url( "x  y.png" )}.b{mask: url(data:image/svg+xml;utf8,<svg a="1" ; />);content: "/* yok */"}',
+        )
+
+    def test_vendor_assets_rejects_files_that_do_not_match_the_pinned_hash(self):
+        static_dir = Path(tempfile.mkdtemp())
+        target = static_dir / 'vendor' / 'fontawesome' / 'css' / 'all.min.css'
+        target.parent.mkdir(parents=True)
+        target.write_text("/* değiştirilmiş */")
+        pinned = {'vendor/fontawesome/css/all.min.css': VENDOR_SHA256['vendor/fontawesome/css/all.min.css']}
+        with override_settings(STATICFILES_DIRS=[static_dir]), mock.patch('blog.management.commands.vendor_assets.VENDOR_SHA256', pinned):
+            with self.assertRaises(CommandError):
+                call_command('vendor_assets', stdout=StringIO(), stderr=StringIO())
+
+    def test_vendor_assets_prints_hashes_for_unpinned_files_without_writing(self):
+        static_dir = Path(tempfile.mkdtemp())
+        pinned = {path: VENDOR_SHA256[path] for path in VENDOR_SHA256 if path != 'vendor/aos/aos.js'}
+        stdout = StringIO()
+        with override_settings(STATICFILES_DIRS=[static_dir]), \
+                mock.patch('blog.management.commands.vendor_assets.VENDOR_SHA256', pinned), \
+                mock.patch('blog.management.commands.vendor_assets.urlopen', side_effect=lambda *args, **kwargs: BytesIO(b"aos")) as urlopen:
+            call_command('vendor_assets', '--print-hashes', stdout=stdout)
+        unpinned = [path for path, _ in VENDOR_ASSETS.values() if path not in pinned]
+        self.assertEqual(urlopen.call_count, len(unpinned))
+        self.assertIn(f"'vendor/aos/aos.js': '{hashlib.sha256(b'aos').hexdigest()}'", stdout.getvalue())
+        self.assertEqual(list(static_dir.iterdir()), [])
+
+    def test_collectstatic_writes_hashed_and_compressed_files(self):
+        static_root = Path(tempfile.mkdtemp())
+        storages = dict(TEST_SETTINGS['STORAGES'], staticfiles={'BACKEND': 'blog.storage.CompressedManifestStaticFilesStorage'})
+        with override_settings(STATIC_ROOT=static_root, STORAGES=storages):
+            call_command('collectstatic', interactive=False, verbosity=0)
+        manifest = json.loads((static_root / 'staticfiles.json').read_text())
+        hashed_css = manifest['paths']['css/style.css']
+        self.assertNotEqual(hashed_css, 'css/style.css')
+        self.assertTrue((static_root / f'{hashed_css}.gz').exists())
+        self.assertNotIn('/*', (static_root / hashed_css).read_text())
+
+    @skipUnless(rjsmin, "rjsmin kurulu değil")
+    def test_collectstatic_minifies_site_javascript(self):
+        static_root = Path(tempfile.mkdtemp())
+        storages = dict(TEST_SETTINGS['STORAGES'], staticfiles={'BACKEND': 'blog.storage.CompressedManifestStaticFilesStorage'})
+        with override_settings(STATIC_ROOT=static_root, STORAGES=storages):
+            call_command('collectstatic', interactive=False, verbosity=0)
+        manifest = json.loads((static_root / 'staticfiles.json').read_text())
+        source = (Path(settings.BASE_DIR) / 'static' / 'js' / 'main.js').read_text()
+        minified = (static_root / manifest['paths']['js/main.js']).read_text()
+        self.assertIn('// ', source)
+        self.assertNotIn('// ', minified)
+        self.assertLess(len(minified), len(source))
+
+
+@override_settings(**TEST_SETTINGS)
+class FileServingTests(TestCase):
+    def setUp(self):
+        self.media_root = Path(TEST_SETTINGS['MEDIA_ROOT'])
+        (self.media_root / 'cv').mkdir(exist_ok=True)
+        (self.media_root / 'cv' / 'ozgecmis.pdf').write_bytes(b'0123456789' * 10)
+
+    def test_range_request_returns_partial_content(self):
+        response = self.client.get('/media/cv/ozgecmis.pdf', HTTP_RANGE='bytes=10-19')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], 'bytes 10-19/100')
+        self.assertEqual(b''.join(response.streaming_content), b'0123456789')
+
+    def test_unsatisfiable_range_returns_416(self):
+        response = self.client.get('/media/cv/ozgecmis.pdf', HTTP_RANGE='bytes=500-')
+        self.assertEqual(response.status_code, 416)
+
+    def test_conditional_get_returns_not_modified(self):
+        response = self.client.get('/media/cv/ozgecmis.pdf')
+        self.assertEqual(response['Content-Length'], '100')
+        response = self.client.get('/media/cv/ozgecmis.pdf', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_precompressed_sibling_is_served_when_accepted(self):
+        (self.media_root / 'cv' / 'ozgecmis.pdf.gz').write_bytes(b'gz')
+        response = self.client.get('/media/cv/ozgecmis.pdf', HTTP_ACCEPT_ENCODING='gzip, deflate')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response.content, b'gz')
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_each_encoding_has_its_own_etag(self):
+        for suffix, content in (('.gz', b'gz'), ('.br', b'br')):
+            sibling = self.media_root / 'cv' / f'ozgecmis.pdf{suffix}'
+            sibling.write_bytes(content)
+            self.addCleanup(sibling.unlink)
+        etags = {
+            accept: self.client.get('/media/cv/ozgecmis.pdf', HTTP_ACCEPT_ENCODING=accept)['ETag']
+            for accept in ('identity', 'gzip', 'br, gzip')
+        }
+        self.assertEqual(len(set(etags.values())), 3)
+        response = self.client.get('/media/cv/ozgecmis.pdf', HTTP_ACCEPT_ENCODING='identity', HTTP_IF_NONE_MATCH=etags['gzip'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'0123456789' * 10)
+
+    def test_encodings_refused_with_zero_quality_are_not_served(self):
+        for suffix, content in (('.gz', b'gz'), ('.br', b'br')):
+            sibling = self.media_root / 'cv' / f'ozgecmis.pdf{suffix}'
+            sibling.write_bytes(content)
+            self.addCleanup(sibling.unlink)
+        response = self.client.get('/media/cv/ozgecmis.pdf', HTTP_ACCEPT_ENCODING='br;q=0, gzip;q=0.5')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        response = self.client.get('/media/cv/ozgecmis.pdf', HTTP_ACCEPT_ENCODING='gzip;q=0, *;q=0')
+        self.assertNotIn('Content-Encoding', response)
+        self.assertEqual(response.content, b'0123456789' * 10)
+
+    def test_hashed_static_names_are_immutable(self):
+        self.assertIn('immutable', cache_control_for('css/style.5c9d24cab81b.css', True))
+        self.assertNotIn('immutable', cache_control_for('css/style.css', True))
+
+    def test_accel_redirect_hands_file_to_proxy(self):
+        with override_settings(MEDIA_ACCEL_REDIRECT='/internal-media/'):
+            response = self.client.get('/media/cv/ozgecmis.pdf')
+        self.assertEqual(response['X-Accel-Redirect'], '/internal-media/cv/ozgecmis.pdf')
+        self.assertEqual(response.content, b'')
+
+    def test_path_traversal_is_rejected(self):
+        self.assertEqual(self.client.get('/media/../manage.py').status_code, 404)
+
+
+@override_settings(**TEST_SETTINGS)
+class SearchTests(TestCase):
+    def setUp(self):
+        language = CodeLanguage.objects.create(name="Python")
+        category = CodeCategory.objects.create(name="Veri Yapıları", language=language)
+        self.example = CodeExample.objects.create(
+            title="İkili Arama Ağacı", language=language, category=category,
+            code="class Node:\n    pass", description="Işık hızında sıralı arama örnekleri",
+        )
+        self.project = Project.objects.create(title="Hava Durumu Uygulaması", description="Şehirlerin hava durumunu gösterir", image="projects/1.jpg")
+        self.project.tags.add(Tag.objects.create(name="Django"))
+        self.draft = BlogPost.objects.create(title="Taslak yazı", content="Django notları")
+
+    def titles(self, query, backend='auto'):
+        with self.settings(SEARCH_BACKEND=backend):
+            return [result['document'].title for result in search_documents(query)]
+
+    def test_turkish_folding_and_stemming(self):
+        self.assertEqual(fold("IŞIK İzmir"), "isik izmir")
+        self.assertEqual(stem(fold("şehirlerin")), stem(fold("şehir")))
+        self.assertEqual(query_terms("a Işık"), ["isik"])
+
+    def test_finds_objects_across_models_without_diacritics(self):
+        for backend in ('auto', 'table'):
+            with self.subTest(backend=backend):
+                with self.settings(SEARCH_BACKEND=backend):
+                    rebuild_index()
+                self.assertEqual(self.titles("isik", backend), ["İkili Arama Ağacı"])
+                self.assertEqual(self.titles("sehir", backend), ["Hava Durumu Uygulaması"])
+                self.assertIn("Hava Durumu Uygulaması", self.titles("django", backend))
+                self.assertEqual(self.titles("hava ağaç", backend), [])
+
+    def test_title_matches_rank_first_and_are_highlighted(self):
+        Certificate.objects.create(title="Sertifika", issuer="Kurum", date=date(2022, 1, 1), description="arama motorları")
+        results = search_documents("arama")
+        self.assertEqual(results[0]['document'].title, "İkili Arama Ağacı")
+        self.assertIn("<mark>Arama</mark>", results[0]['title'])
+        self.assertIn("<mark>arama</mark>", results[0]['snippet'])
+
+    def test_index_follows_model_signals(self):
+        self.assertEqual(self.titles("taslak"), [])
+        self.draft.is_published = True
+        self.draft.save()
+        self.assertEqual(self.titles("taslak"), ["Taslak yazı"])
+        Tag.objects.filter(name="Django").get().delete()
+        self.assertEqual(self.titles("django"), ["Taslak yazı"])
+        self.project.delete()
+        self.assertFalse(SearchDocument.objects.filter(kind='project').exists())
+
+    def test_index_is_built_after_migrate_when_empty(self):
+        SearchDocument.objects.all().delete()
+        build_empty_search_index(sender=None)
+        self.assertEqual(self.titles("isik"), ["İkili Arama Ağacı"])
+
+    def test_admin_search_falls_back_to_like_while_index_is_empty(self):
+        Certificate.objects.create(title="Bulut Sertifikası", issuer="Kurum", date=date(2022, 1, 1))
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'parola'))
+        url = reverse('admin:blog_certificate_changelist')
+        self.assertContains(self.client.get(url, {'q': 'bulut'}), "Bulut Sertifikası")
+        SearchDocument.objects.all().delete()
+        self.assertContains(self.client.get(url, {'q': 'Bulut'}), "Bulut Sertifikası")
+
+    def test_admin_search_returns_every_match_without_highlighting(self):
+        Certificate.objects.bulk_create([
+            Certificate(title=f"Bulut {i}", issuer="Kurum", date=date(2022, 1, 1), slug=f"bulut-{i}") for i in range(1200)
+        ])
+        for backend in ('auto', 'table'):
+            with self.subTest(backend=backend), self.settings(SEARCH_BACKEND=backend):
+                rebuild_index()
+                with mock.patch('blog.search.highlight') as highlight:
+                    ids = matching_ids(Certificate, "bulut")
+                highlight.assert_not_called()
+                self.assertEqual(sorted(ids), sorted(Certificate.objects.values_list('pk', flat=True)))
+
+    def test_admin_search_fields_match_indexed_columns(self):
+        for model in (Certificate, Project, CodeExample):
+            spec = SEARCH_SOURCES[model]
+            indexed = [spec['title']]
+            for path in spec['body']:
+                field = model._meta.get_field(path.split('.')[0])
+                indexed.append(f'{field.name}__name' if field.many_to_many else path.replace('.', '__'))
+            with self.subTest(model=model.__name__):
+                self.assertEqual(sorted(admin.site._registry[model].search_fields), sorted(indexed))
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'parola'))
+        url = reverse('admin:blog_project_changelist')
+        for query in ('django', 'Django'):
+            self.assertContains(self.client.get(url, {'q': query}), "Hava Durumu Uygulaması")
+            SearchDocument.objects.all().delete()
+
+    def test_search_page_escapes_content(self):
+        Project.objects.create(title="<script>proje</script>", description="-", image="projects/1.jpg")
+        response = self.client.get(reverse('blog:search'), {'q': 'proje'})
+        self.assertContains(response, "<mark>proje</mark>")
+        self.assertNotContains(response, "<script>proje")
+
+
+@override_settings(**TEST_SETTINGS)
+class BlogListingTests(TestCase):
+    def setUp(self):
+        self.category = Category.objects.create(name="Django")
+        self.tag = Tag.objects.create(name="orm")
+        published_at = timezone.make_aware(datetime(2024, 3, 15, 12, 0))
+        for i in range(25):
+            # Aynı tarihli yazılar id ile ayrışmalı.
+            post = BlogPost.objects.create(
+                title=f"Yazı {i}", content="-", is_published=True, category=self.category if i % 2 else None,
+                published_at=published_at - timedelta(days=i // 3),
+            )
+            if i % 5 == 0:
+                post.tags.add(self.tag)
+        BlogPost.objects.create(title="Taslak", content="-")
+
+    def expected_order(self):
+        return list(BlogPost.objects.filter(is_published=True).order_by('-published_at', '-id').values_list('pk', flat=True))
+
+    def test_keyset_pages_cover_every_post_once_in_both_directions(self):
+        pages, after = [], None
+        while True:
+            page = keyset_page(BlogPost.objects.filter(is_published=True), 'published_at', after=after, per_page=7)
+            pages.append([post.pk for post in page['items']])
+            if not page['next_cursor']:
+                break
+            after = page['next_cursor']
+        self.assertEqual(sum(pages, []), self.expected_order())
+
+        before = page['previous_cursor']
+        previous = keyset_page(BlogPost.objects.filter(is_published=True), 'published_at', before=before, per_page=7)
+        self.assertEqual([post.pk for post in previous['items']], pages[-2])
+
+    def test_deep_pages_cost_the_same_as_the_first(self):
+        def count(path):
+            cache.clear()
+            get_content_generation()
+            get_site_chrome()
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(path)
+            self.assertEqual(response.status_code, 200)
+            return len(ctx.captured_queries), response
+
+        first, response = count(reverse('blog:blog_list'))
+        cursor = response.context['page']['next_cursor']
+        second, response = count(reverse('blog:blog_list') + f'?after={cursor}')
+        cursor = response.context['page']['next_cursor']
+        third, _ = count(reverse('blog:blog_list') + f'?after={cursor}')
+        self.assertEqual(first, second)
+        self.assertEqual(first, third)
+
+    def test_archives_list_only_matching_published_posts(self):
+        response = self.client.get(reverse('blog:blog_category', args=[self.category.slug]))
+        self.assertTrue(all(post.category_id == self.category.pk for post in response.context['posts']))
+        response = self.client.get(reverse('blog:blog_tag', args=[self.tag.slug]))
+        self.assertEqual(len(response.context['posts']), 5)
+        response = self.client.get(reverse('blog:blog_month', args=[2024, 3]))
+        self.assertEqual(len(response.context['posts']), 10)
+        self.assertNotContains(response, "Taslak")
+        self.assertEqual(self.client.get(reverse('blog:blog_month', args=[2024, 13])).status_code, 404)
+        self.assertEqual(self.client.get(reverse('blog:blog_list') + '?after=bozuk').status_code, 404)
+
+    def test_month_links_use_local_time_at_month_boundary(self):
+        # 31 Mart 22:30 UTC, İstanbul'da 1 Nisan 01:30'dur.
+        post = BlogPost.objects.create(
+            title="Gece Yarısı", content="-", is_published=True,
+            published_at=datetime(2024, 3, 31, 22, 30, tzinfo=dt_timezone.utc),
+        )
+        april = reverse('blog:blog_month', args=[2024, 4])
+        self.assertContains(self.client.get(reverse('blog:blog_detail', args=[post.slug])), f'href="{april}"')
+        self.assertContains(self.client.get(reverse('blog:blog_list')), f'href="{april}"')
+        self.assertIn(post, self.client.get(april).context['posts'])
+
+    def test_unpublished_post_detail_is_not_found(self):
+        draft = BlogPost.objects.get(title="Taslak")
+        self.assertEqual(self.client.get(reverse('blog:blog_detail', args=[draft.slug])).status_code, 404)
+        post = BlogPost.objects.filter(is_published=True).first()
+        self.assertContains(self.client.get(reverse('blog:blog_detail', args=[post.slug])), post.title)
+
+
+@override_settings(**TEST_SETTINGS)
+class JsonApiTests(TestCase):
+    def setUp(self):
+        create_portfolio(rows=5)
+        Project.objects.filter(title="Proje 4").update(category=ProjectCategory.objects.create(name="Mobil"))
+
+    def get(self, path, **extra):
+        return self.client.get(path, **extra)
+
+    def test_sparse_fieldsets_use_a_single_values_query(self):
+        url = reverse('blog:api_list', args=['projects'])
+        with self.assertNumQueries(1):
+            response = self.get(url, data={'fields': 'title,category,url'})
+        self.assertEqual(response.json()['results'][0], {'title': "Proje 4", 'category': "Mobil", 'url': reverse('blog:project_detail', args=['proje-4'])})
+        with self.assertNumQueries(2):
+            response = self.get(url, data={'fields': 'title,tags', 'limit': 2})
+        self.assertEqual(response.json()['results'][0]['tags'], ["etiket-0", "etiket-1", "etiket-2"])
+        self.assertEqual(self.get(url, data={'fields': 'title,secret'}).status_code, 400)
+
+    def test_filters_and_cursor_pagination(self):
+        url = reverse('blog:api_list', args=['projects'])
+        self.assertEqual([row['title'] for row in self.get(url, data={'category': 'mobil'}).json()['results']], ["Proje 4"])
+        titles, next_url = [], f'{url}?fields=title&limit=2'
+        while next_url:
+            data = self.get(next_url).json()
+            titles += [row['title'] for row in data['results']]
+            next_url = data['next']
+        self.assertEqual(titles, [f"Proje {i}" for i in range(4, -1, -1)])
+
+    def test_conditional_requests_follow_resource_changes(self):
+        url = reverse('blog:api_list', args=['certificates'])
+        etag = self.get(url)['ETag']
+        self.assertEqual(self.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        with self.captureOnCommitCallbacks(execute=True):
+            Skill.objects.create(category=SkillCategory.objects.first(), name="Başka")
+        self.assertEqual(self.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        with self.captureOnCommitCallbacks(execute=True):
+            Certificate.objects.create(title="Yeni", issuer="Kurum", date=date(2023, 1, 1))
+        response = self.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'][0]['title'], "Yeni")
+
+    def test_detail_and_unpublished_posts(self):
+        BlogPost.objects.create(title="Taslak", content="-")
+        self.assertEqual(self.get(reverse('blog:api_detail', args=['posts', 'taslak'])).status_code, 404)
+        self.assertEqual(self.get(reverse('blog:api_list', args=['posts'])).json()['results'], [])
+        self.assertEqual(self.get(reverse('blog:api_detail', args=['skills', 'yetenek-0'])).json()['name'], "Yetenek 0")
+        self.assertEqual(self.get(reverse('blog:api_list', args=['bilinmeyen'])).status_code, 404)
+
+
+@override_settings(**TEST_SETTINGS)
+class LazySectionTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_portfolio(rows=2)
+
+    def homepage_size(self):
+        cache.clear()
+        return len(self.client.get(reverse('blog:index')).content)
+
+    def add_examples_and_certificates(self, count):
+        example = CodeExample.objects.first()
+        for i in range(CodeExample.objects.count(), CodeExample.objects.count() + count):
+            CodeExample.objects.create(title=f"Ek örnek {i}", language=example.language, category=example.category, code="x = 1\n" * 20, description="-")
+            Certificate.objects.create(title=f"Ek sertifika {i}", issuer="Kurum", date=date(2020, 1, 1), description="-")
+
+    def test_homepage_size_stays_flat_as_examples_and_certificates_grow(self):
+        self.add_examples_and_certificates(CERTIFICATE_PREVIEW_COUNT)
+        before = self.homepage_size()
+        self.add_examples_and_certificates(30)
+        # Yalnızca sayaç, en yeni sertifikaların başlıkları ve imleç değişir.
+        self.assertLess(abs(self.homepage_size() - before), 100)
+
+    def test_code_fragment_renders_pair_examples(self):
+        example = CodeExample.objects.first()
+        url = reverse('blog:code_fragment', args=[example.language.slug, example.category.slug])
+        self.assertContains(self.client.get(reverse('blog:index')), f'data-fragment="{url}"')
+        response = self.client.get(url)
+        self.assertContains(response, example.title)
+        self.assertNotContains(response, '<html')
+        self.assertEqual(self.client.get(reverse('blog:code_fragment', args=['yok', 'yok'])).status_code, 404)
+
+    def test_certificate_fragments_chain_to_the_last_certificate(self):
+        create_portfolio(rows=CERTIFICATE_PREVIEW_COUNT + CERTIFICATE_FRAGMENT_SIZE)
+        titles = [certificate.title for certificate in load_homepage()['certificate_page']['items']]
+        paths = [path for path in fragment_paths() if 'certificates' in path]
+        self.assertEqual(len(paths), 2)
+        for path in paths:
+            content = self.client.get(path).content.decode()
+            titles += re.findall(r'<h3>(Sertifika \d+)</h3>', content)
+        self.assertEqual(sorted(titles), sorted(Certificate.objects.values_list('title', flat=True)))
+
+
+@override_settings(**TEST_SETTINGS)
+class SlugTests(TestCase):
+    def test_turkish_characters_are_transliterated(self):
+        self.assertEqual(slugify_tr("Işık Çağrı Öğün Şüphe"), "isik-cagri-ogun-suphe")
+        self.assertEqual(Tag.objects.create(name="Yapay Zekâ ve Işıklandırma").slug, "yapay-zeka-ve-isiklandirma")
+
+    def test_collisions_are_resolved_without_per_suffix_queries(self):
+        category = SkillCategory.objects.create(name="Backend")
+        for _ in range(3):
+            Skill.objects.create(category=category, name="Python")
+        Skill.objects.create(category=category, name="Python", slug="python-9")
+        skill = Skill(category=category, name="Python")
+        with self.assertNumQueries(2):
+            Skill.assign_slugs([skill])
+        self.assertEqual(skill.slug, "python-10")
+        self.assertEqual(
+            sorted(Skill.objects.values_list('slug', flat=True)), ["python", "python-1", "python-2", "python-9"]
+        )
+
+    def test_numbered_titles_do_not_shift_each_others_suffixes(self):
+        for title in ("Proje", "Proje 10", "Proje 1"):
+            Project.objects.create(title=title, description="-", image="projects/1.jpg")
+        self.assertEqual(Project.objects.create(title="Proje 1", description="-", image="projects/1.jpg").slug, "proje-1-1")
+
+    def test_models_that_used_to_crash_on_duplicates_get_suffixes(self):
+        first = Certificate.objects.create(title="Django", issuer="Kurum", date=date(2022, 1, 1))
+        second = Certificate.objects.create(title="Django", issuer="Kurum", date=date(2023, 1, 1))
+        self.assertEqual((first.slug, second.slug), ("django-kurum", "django-kurum-1"))
+
+    def test_suffix_fits_max_length(self):
+        long_name = "a" * 60
+        first = CodeLanguage.objects.create(name=long_name)
+        second = CodeLanguage.objects.create(name=long_name)
+        self.assertEqual(len(first.slug), 50)
+        self.assertEqual(second.slug, "a" * 48 + "-1")
+
+    def test_bulk_assignment_query_count_is_independent_of_row_count(self):
+        Tag.objects.create(name="etiket")
+        tags = [Tag(name=f"etiket {i % 3}") for i in range(300)] + [Tag(name="etiket") for _ in range(300)]
+        with self.assertNumQueries(2):
+            Tag.assign_slugs(tags)
+        slugs = [tag.slug for tag in tags]
+        self.assertEqual(len(set(slugs)), len(slugs))
+        self.assertNotIn("etiket", slugs)
+
+    def test_bulk_import_of_one_base_stays_linear(self):
+        # Toplu içe aktarma (blog.transfer) aynı tabanlı binlerce satırı
+        # assign_slugs ile tek seferde adlandırır.
+        category = SkillCategory.objects.create(name="Backend")
+        Skill.objects.bulk_create([Skill(category=category, name="Python", slug=slug) for slug in ("python", "python-7")])
+        skills = [Skill(category=category, name="Python") for _ in range(8000)]
+        started = time.perf_counter()
+        with self.assertNumQueries(2):
+            Skill.assign_slugs(skills)
+        self.assertLess(time.perf_counter() - started, 2)
+        slugs = [skill.slug for skill in skills]
+        self.assertEqual(len(set(slugs)), 8000)
+        self.assertEqual((slugs[0], slugs[-1]), ("python-8", "python-8007"))
+
+
+@override_settings(**TEST_SETTINGS)
+class ContentTransferTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_portfolio(rows=3)
+        BlogPost.objects.create(title="Yazı", content="-", category=Category.objects.create(name="Genel"), is_published=True)
+
+    def export(self, *args, **options):
+        out = StringIO()
+        call_command('export_content', *args, stdout=out, stderr=StringIO(), **options)
+        return out.getvalue()
+
+    def import_file(self, path, **options):
+        call_command('import_content', str(path), stdout=StringIO(), **options)
+
+    def snapshot(self):
+        return {
+            'projects': sorted(Project.objects.values_list('slug', 'category__slug', 'image')),
+            'tags': sorted(Project.tags.through.objects.values_list('project__slug', 'tag__name')),
+            'certificates': sorted(Certificate.objects.values_list('slug', 'date')),
+            'examples': sorted(CodeExample.objects.values_list('slug', 'language__slug', 'category__slug')),
+            'posts': sorted(BlogPost.objects.values_list('slug', 'category__slug', 'is_published')),
+        }
+
+    def clear_content(self):
+        for model in (BlogPost, Category, Project, ProjectCategory, Education, Experience, Certificate, CodeExample, CodeCategory, CodeLanguage, Skill, SkillCategory, Tag):
+            model.objects.all().delete()
+
+    def test_jsonl_round_trip_restores_relations_by_natural_key(self):
+        path = Path(tempfile.mkdtemp()) / 'icerik.jsonl'
+        self.export(str(path))
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        project = next(line['fields'] for line in lines if line['model'] == 'project')
+        self.assertEqual((project['category'], project['tags']), ("web", ["etiket-0", "etiket-1", "etiket-2"]))
+        self.assertNotIn('id', project)
+
+        before = self.snapshot()
+        self.clear_content()
+        self.import_file(path)
+        self.assertEqual(self.snapshot(), before)
+        self.assertEqual(search_documents("Proje")[0]['kind'], 'project')
+
+    def test_reimport_updates_existing_rows(self):
+        path = Path(tempfile.mkdtemp()) / 'icerik.jsonl'
+        self.export(str(path))
+        Project.objects.update(description="Eski")
+        count = Project.objects.count()
+        self.import_file(path)
+        self.assertEqual(Project.objects.count(), count)
+        self.assertFalse(Project.objects.filter(description="Eski").exists())
+
+    def test_csv_directory_round_trip(self):
+        directory = Path(tempfile.mkdtemp())
+        self.export(str(directory), format='csv')
+        self.assertTrue((directory / 'project.csv').exists())
+        before = self.snapshot()
+        self.clear_content()
+        self.import_file(directory)
+        self.assertEqual(self.snapshot(), before)
+
+    def test_records_without_a_unique_name_are_matched_by_id(self):
+        # İki ayrı "Diller" kategorisi ada göre eşleştirilince birleşirdi.
+        for icon in ("fas fa-code", "fas fa-language"):
+            Skill.objects.create(category=SkillCategory.objects.create(name="Diller", icon=icon), name=f"Yetenek {icon}")
+        path = Path(tempfile.mkdtemp()) / 'icerik.jsonl'
+        self.export(str(path))
+        before = sorted(Skill.objects.values_list('slug', 'category__name', 'category__icon'))
+        self.clear_content()
+        self.import_file(path)
+        self.assertEqual(SkillCategory.objects.filter(name="Diller").count(), 2)
+        self.assertEqual(sorted(Skill.objects.values_list('slug', 'category__name', 'category__icon')), before)
+        self.import_file(path)
+        self.assertEqual(SkillCategory.objects.filter(name="Diller").count(), 2)
+
+    def test_duplicate_keys_in_import_are_rejected(self):
+        path = Path(tempfile.mkdtemp()) / 'etiketler.jsonl'
+        path.write_text('\n'.join(json.dumps({'model': 'tag', 'fields': {'name': "çift", 'slug': slug}}) for slug in ("cift", "cift-2")))
+        count = Tag.objects.count()
+        with self.assertRaisesMessage(CommandError, "çift"):
+            self.import_file(path)
+        self.assertEqual(Tag.objects.count(), count)
+
+    def test_import_query_count_does_not_grow_with_rows(self):
+        def queries_for(rows):
+            records = '\n'.join(
+                json.dumps({'model': 'codeexample', 'fields': {'title': f"Toplu {rows}-{i}", 'language': "python", 'category': "temel", 'code': "-", 'description': "-"}})
+                for i in range(rows)
+            )
+            path = Path(tempfile.mkdtemp()) / 'toplu.jsonl'
+            path.write_text(records)
+            with CaptureQueriesContext(connection) as queries:
+                self.import_file(path, no_reindex=True, batch_size=1000)
+            return len(queries)
+
+        self.assertEqual(queries_for(10), queries_for(100))
+        self.assertEqual(CodeExample.objects.filter(title__startswith="Toplu").count(), 110)
+
+
+@override_settings(**TEST_SETTINGS)
+class TagUsageTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_portfolio(rows=2)
+        self.tags = list(Tag.objects.order_by('name'))
+        post = BlogPost.objects.create(title="Yazı", content="-", is_published=True)
+        post.tags.set(self.tags[:1])
+        draft = BlogPost.objects.create(title="Taslak", content="-")
+        draft.tags.set(self.tags[:2])
+        Tag.objects.create(name="boş")
+
+    def test_usage_counts_every_tagged_model_in_one_query(self):
+        with self.assertNumQueries(1):
+            usage = dict(annotate_tag_usage(Tag.objects.all()).values_list('name', 'usage'))
+        # 2 eğitim + 2 deneyim + 2 proje, artı yazılar (taslak dahil).
+        self.assertEqual(usage, {"etiket-0": 8, "etiket-1": 7, "etiket-2": 6, "boş": 0})
+
+    def test_admin_changelist_query_count_does_not_grow_with_tags(self):
+        from django.contrib.auth.models import User
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'parola'))
+        url = reverse('admin:blog_tag_changelist')
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(url)
+        Tag.objects.bulk_create([Tag(name=f"yeni-{i}", slug=f"yeni-{i}") for i in range(15)])
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(url, {'o': '-3'})
+        self.assertEqual(len(few), len(many))
+        self.assertEqual(response.context['cl'].result_list[0].name, "etiket-0")
+        response = self.client.get(url, {'kullanim': '0'})
+        self.assertEqual(response.context['cl'].result_count, 16)
+
+    def test_public_tag_cloud_ignores_drafts(self):
+        cloud = {tag.name: (tag.usage, tag.weight) for tag in tag_cloud()}
+        self.assertEqual(cloud, {"etiket-0": (1, 1)})
+        response = self.client.get(reverse('blog:blog_list'))
+        self.assertContains(response, 'class="weight-1"')
+        self.assertNotContains(response, "#etiket-1")
+
+
+@override_settings(**TEST_SETTINGS)
+class AdminQueryTests(TestCase):
+    def setUp(self):
+        from django.contrib.auth.models import User
+        cache.clear()
+        create_portfolio(rows=2)
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'parola'))
+
+    def query_count(self, url, **params):
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(url, params).status_code, 200)
+        return len(queries)
+
+    def test_changelists_do_not_query_per_row(self):
+        urls = [reverse(f'admin:blog_{name}_changelist') for name in ('project', 'codeexample', 'skill', 'codecategory')]
+        for url in urls:
+            self.client.get(url)
+        before = [self.query_count(url) for url in urls]
+        create_portfolio(rows=6)
+        language = CodeLanguage.objects.create(name="Go")
+        for i in range(5):
+            CodeCategory.objects.create(name=f"Kategori {i}", language=language)
+        self.assertEqual([self.query_count(url) for url in urls], before)
+
+    def test_filtered_changelist_skips_full_count(self):
+        url = reverse('admin:blog_project_changelist')
+        self.client.get(url)
+        response = self.client.get(url, {'q': "Proje 1"})
+        self.assertIsNone(response.context['cl'].full_result_count)
+
+    def test_category_autocomplete_does_not_query_per_result(self):
+        url = reverse('admin:autocomplete')
+        params = {'app_label': 'blog', 'model_name': 'codeexample', 'field_name': 'category', 'term': "Kategori"}
+        language = CodeLanguage.objects.create(name="Go")
+        CodeCategory.objects.create(name="Kategori", language=language)
+        before = self.query_count(url, **params)
+        for i in range(5):
+            CodeCategory.objects.create(name=f"Kategori {i}", language=language)
+        self.assertEqual(self.query_count(url, **params), before)
+        self.assertIn("Go - Kategori 4", [item['text'] for item in self.client.get(url, params).json()['results']])
+
+    def test_category_autocomplete_pages_are_ordered(self):
+        url = reverse('admin:autocomplete')
+        params = {'app_label': 'blog', 'model_name': 'codeexample', 'field_name': 'category', 'term': "Kategori"}
+        for name in ("Rust", "Go"):
+            language = CodeLanguage.objects.create(name=name)
+            for i in (2, 1):
+                CodeCategory.objects.create(name=f"Kategori {i}", language=language)
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', UnorderedObjectListWarning)
+            results = self.client.get(url, params).json()['results']
+        self.assertEqual([item['text'] for item in results], ["Go - Kategori 1", "Go - Kategori 2", "Rust - Kategori 1", "Rust - Kategori 2"])
+
+
+@override_settings(**TEST_SETTINGS)
+class QueryPlanTests(TestCase):
+    # Filtreleyen ya da sıralayan bir sorgu tabloyu baştan sona taramamalı.
+    # Koşulsuz ve sıralamasız "tümünü oku" sorguları (ör. SiteSettings) serbesttir.
+    SCAN_RE = re.compile(r'^SCAN (\w+)$')
+
+    def setUp(self):
+        cache.clear()
+        create_portfolio(rows=3)
+        category = Category.objects.create(name="Genel")
+        subcategory = SubCategory.objects.create(name="Alt", category=category)
+        post = BlogPost.objects.create(title="Yazı", content="-", category=category, subcategory=subcategory, is_published=True)
+        post.tags.set(Tag.objects.all()[:1])
+        rebuild_index()
+        example = CodeExample.objects.select_related('language', 'category').first()
+        self.urls = [
+            reverse(name) for name in ('blog:index', 'blog:about', 'blog:skills', 'blog:projects', 'blog:blog_list', 'blog:api_index')
+        ] + [
+            reverse('blog:blog_category', args=[category.slug]),
+            reverse('blog:blog_subcategory', args=[subcategory.slug]),
+            reverse('blog:blog_tag', args=[Tag.objects.first().slug]),
+            reverse('blog:blog_month', args=[post.published_at.year, post.published_at.month]),
+            reverse('blog:blog_detail', args=[post.slug]),
+            reverse('blog:project_detail', args=[Project.objects.first().slug]),
+            reverse('blog:codeexample_detail', args=[example.slug]),
+            reverse('blog:skill_detail', args=[Skill.objects.first().slug]),
+            reverse('blog:certificate_detail', args=[Certificate.objects.first().slug]),
+            reverse('blog:code_fragment', args=[example.language.slug, example.category.slug]),
+            f"{reverse('blog:search')}?q=proje",
+        ]
+        for name, resource in API_RESOURCES.items():
+            url = reverse('blog:api_list', args=[name])
+            self.urls.append(url)
+            self.urls.extend(f'{url}?{param}=x' for param in resource['filters'])
+
+    def full_scans(self, sql):
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            plan = [row[3] for row in cursor.fetchall()]
+        sorts = any('TEMP B-TREE FOR ORDER BY' in step for step in plan)
+        if ' WHERE ' not in sql and not sorts:
+            return []
+        return [match[1] for match in map(self.SCAN_RE.match, plan) if match]
+
+    def test_view_queries_do_not_scan_whole_tables(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest("EXPLAIN QUERY PLAN çıktısı SQLite'a özgüdür.")
+        problems = []
+        for url in self.urls:
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(self.client.get(url).status_code, 200, url)
+            for query in queries:
+                if query['sql'].startswith('SELECT'):
+                    problems.extend(f"{url}: {table}" for table in self.full_scans(query['sql']))
+        self.assertEqual(problems, [])
+
+
+class DatabaseRoutingTests(SimpleTestCase):
+    def routed_alias(self, method, path):
+        seen = []
+        middleware = PrimaryDatabaseMiddleware(lambda request: seen.append(router.db_for_read(BlogPost)))
+        middleware(getattr(RequestFactory(), method)(path))
+        return seen[0]
+
+    def test_reads_go_to_replica_except_admin_writes_and_transactions(self):
+        self.assertEqual(self.routed_alias('get', reverse('blog:blog_list')), 'replica')
+        self.assertEqual(self.routed_alias('get', reverse('admin:blog_project_changelist')), 'default')
+        self.assertEqual(self.routed_alias('post', reverse('blog:contact')), 'default')
+        self.assertEqual(router.db_for_write(BlogPost), 'default')
+        with use_primary():
+            self.assertEqual(router.db_for_read(BlogPost), 'default')
+        self.assertFalse(router.allow_migrate('replica', 'blog'))
+
+    def test_wal_file_lets_writer_commit_while_replica_reads(self):
+        from django.db.backends.sqlite3.base import DatabaseWrapper
+        path = Path(tempfile.mkdtemp()) / 'db.sqlite3'
+        primary = DatabaseWrapper({**connections.settings['default'], 'NAME': str(path)}, 'wal-primary')
+        replica = DatabaseWrapper({**connections.settings['replica'], 'NAME': f'file:{path}?mode=ro'}, 'wal-replica')
+        try:
+            with primary.cursor() as cursor:
+                cursor.execute('PRAGMA journal_mode')
+                self.assertEqual(cursor.fetchone()[0], 'wal')
+                cursor.execute('CREATE TABLE satir (deger INTEGER)')
+                cursor.execute('INSERT INTO satir VALUES (1)')
+            reader = replica.cursor()
+            reader.execute('BEGIN')
+            reader.execute('SELECT COUNT(*) FROM satir')
+            self.assertEqual(reader.fetchone()[0], 1)
+            # Okuma transaction'ı açıkken yazma beklemeden commit edilir;
+            # okuyucu kendi anlık görüntüsünü görmeye devam eder.
+            with primary.cursor() as cursor:
+                cursor.execute('INSERT INTO satir VALUES (2)')
+            reader.execute('SELECT COUNT(*) FROM satir')
+            self.assertEqual(reader.fetchone()[0], 1)
+            reader.execute('COMMIT')
+            reader.execute('SELECT COUNT(*) FROM satir')
+            self.assertEqual(reader.fetchone()[0], 2)
+            with self.assertRaises(OperationalError):
+                reader.execute('INSERT INTO satir VALUES (3)')
+        finally:
+            primary.close()
+            replica.close()
+
+
+class CountingEmailBackend(EmailBackend):
+    opened = 0
+
+    def open(self):
+        CountingEmailBackend.opened += 1
+        return super().open()
+
+
+@override_settings(**TEST_SETTINGS, CONTACT_RECIPIENTS=['site@example.com'], CONTACT_RATE_CAPACITY=2, EMAIL_BACKEND='blog.tests.CountingEmailBackend')
+class ContactPipelineTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        CountingEmailBackend.opened = 0
+
+    def post(self, index=0, ip='10.0.0.1', deliver=False):
+        # Arka plan göndericisi yalnızca eager modda çalıştırılır.
+        data = {'name': 'Ziyaretçi', 'email': f'kisi{index}@example.com', 'subject': 'Merhaba', 'message': f'Mesaj {index}'}
+        with self.captureOnCommitCallbacks(execute=deliver):
+            return self.client.post(reverse('blog:contact'), data, REMOTE_ADDR=ip)
+
+    def test_message_is_stored_and_acknowledged_without_sending(self):
+        response = self.post()
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()['status'], 'success')
+        self.assertEqual(ContactMessage.objects.get().status, ContactMessage.STATUS_PENDING)
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_invalid_form_and_rate_limit(self):
+        response = self.client.post(reverse('blog:contact'), {'name': 'x', 'email': 'gecersiz'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('email', response.json()['errors'])
+        self.assertEqual(self.post(1).status_code, 202)
+        self.assertEqual(self.post(2).status_code, 202)
+        self.assertEqual(self.post(3).status_code, 429)
+        self.assertEqual(self.post(4, ip='10.0.0.2').status_code, 202)
+        self.assertEqual(ContactMessage.objects.count(), 3)
+
+    def test_duplicate_submission_is_stored_once(self):
+        self.post()
+        self.post()
+        self.assertEqual(ContactMessage.objects.count(), 1)
+
+    def test_pending_messages_are_sent_over_one_connection(self):
+        for index in range(2):
+            self.post(index, ip=f'10.0.1.{index}')
+        self.post(2, ip='10.0.1.2')
+        self.assertEqual(deliver_pending(), 3)
+        self.assertEqual(CountingEmailBackend.opened, 1)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(mail.outbox[0].to, ['site@example.com'])
+        self.assertEqual(mail.outbox[0].reply_to, ['kisi0@example.com'])
+        self.assertFalse(ContactMessage.objects.exclude(status=ContactMessage.STATUS_SENT).exists())
+        self.assertEqual(deliver_pending(), 0)
+
+    @override_settings(CONTACT_MAIL_EAGER=True)
+    def test_eager_delivery_sends_after_commit(self):
+        self.post(deliver=True)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIsNotNone(ContactMessage.objects.get().sent_at)
+
+
+@override_settings(**TEST_SETTINGS)
+class AsyncViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_portfolio(rows=3)
+
+    def get(self, path):
+        cache.clear()
+        get_content_generation()
+        get_site_chrome()
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(path)
+        self.assertEqual(response.status_code, 200, path)
+        return response, len(ctx.captured_queries)
+
+    def test_async_views_serve_the_same_content_within_the_same_query_count(self):
+        project = Project.objects.first()
+        paths = [
+            reverse('blog:index'),
+            reverse('blog:project_detail', args=[project.slug]),
+            reverse('blog:skill_detail', args=[Skill.objects.first().slug]),
+            reverse('blog:api_list', args=['projects']) + '?fields=title,tags',
+            reverse('blog:api_detail', args=['projects', project.slug]),
+        ]
+        expected = {path: self.get(path) for path in paths}
+        with url_variant(async_views=True):
+            self.assertTrue(iscoroutinefunction(resolve(reverse('blog:index')).func))
+            for path in paths:
+                response, queries = self.get(path)
+                self.assertLessEqual(queries, expected[path][1], path)
+                if response['Content-Type'] == 'application/json':
+                    self.assertEqual(response.json(), expected[path][0].json())
+                else:
+                    self.assertEqual(strip_csrf_token(response.content), strip_csrf_token(expected[path][0].content), path)
+            self.assertEqual(self.client.get(reverse('blog:project_detail', args=['yok'])).status_code, 404)
+        self.assertFalse(iscoroutinefunction(resolve(reverse('blog:index')).func))
+
+    def test_subcategories_endpoint(self):
+        category = Category.objects.create(name="Yazılım")
+        SubCategory.objects.create(category=category, name="Django")
+        with url_variant(async_views=True):
+            response = self.client.get(reverse('blog:subcategories'), {'category': "Yazılım"})
+            self.assertEqual(response.json(), [{'name': "Django"}])
+            self.assertEqual(self.client.get(reverse('blog:subcategories')).json(), [])
+
+    def test_percentile(self):
+        values = [index / 100 for index in range(1, 101)]
+        self.assertEqual(percentile(values, 0.99), 0.99)
+        self.assertEqual(percentile(values, 0.5), 0.5)
+        self.assertEqual(percentile([], 0.99), 0.0)
+
+
+@override_settings(**TEST_SETTINGS)
+class StreamingHomepageTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_portfolio(rows=3)
+
+    def buffered_homepage(self):
+        cache.clear()
+        with override_settings(HOMEPAGE_STREAMING=False):
+            response = self.client.get(reverse('blog:index'))
+        cache.clear()
+        return strip_csrf_token(response.content)
+
+    def test_head_is_sent_before_sections_and_page_matches_buffered_render(self):
+        expected = self.buffered_homepage()
+        with override_settings(HOMEPAGE_STREAMING=True):
+            get_content_generation()
+            get_site_chrome()
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(reverse('blog:index'))
+                self.assertTrue(response.streaming)
+                chunks = list(response.streaming_content)
+        head = chunks[0].decode()
+        self.assertIn('rel="preload"', head)
+        self.assertIn('</head>', head)
+        self.assertNotIn('<section', head)
+        self.assertEqual(len(chunks), 2 + len(load_homepage()['homepage_sections']))
+        self.assertNotIn(STREAM_MARKER.encode(), b''.join(chunks))
+        self.assertEqual(strip_csrf_token(b''.join(chunks)), expected)
+        self.assertLessEqual(len(ctx.captured_queries), HOMEPAGE_QUERY_BUDGET)
+
+    def test_completed_stream_fills_the_page_cache(self):
+        with override_settings(HOMEPAGE_STREAMING=True):
+            b''.join(self.client.get(reverse('blog:index')).streaming_content)
+            with self.assertNumQueries(0):
+                response = self.client.get(reverse('blog:index'))
+        self.assertFalse(response.streaming)
+        self.assertNotContains(response, "__CSRF_TOKEN__")
+        self.assertContains(response, 'name="csrfmiddlewaretoken"')
+
+    async def test_async_view_streams_the_same_page(self):
+        expected = await sync_to_async(self.buffered_homepage)()
+        with override_settings(HOMEPAGE_STREAMING=True), url_variant(async_views=True):
+            response = await self.async_client.get(reverse('blog:index'))
+            self.assertTrue(response.is_async)
+            chunks = [chunk async for chunk in response.streaming_content]
+        self.assertIn(b'</head>', chunks[0])
+        self.assertEqual(strip_csrf_token(b''.join(chunks)), expected)
+
+    def test_contact_form_posts_after_a_cold_streamed_homepage(self):
+        client = Client(enforce_csrf_checks=True)
+        with override_settings(HOMEPAGE_STREAMING=True):
+            page = b''.join(client.get(reverse('blog:index')).streaming_content).decode()
+        token = re.search(r'name="csrfmiddlewaretoken" value="([^"]+)"', page).group(1)
+        data = {'name': 'Ziyaretçi', 'email': 'kisi@example.com', 'subject': 'Merhaba', 'message': 'Mesaj', 'csrfmiddlewaretoken': token}
+        self.assertEqual(client.post(reverse('blog:contact'), data).status_code, 202)
+
+    async def test_async_streamed_homepage_sets_the_csrf_cookie(self):
+        with override_settings(HOMEPAGE_STREAMING=True), url_variant(async_views=True):
+            response = await AsyncClient(enforce_csrf_checks=True).get(reverse('blog:index'))
+            page = b''.join([chunk async for chunk in response.streaming_content])
+        self.assertIn(settings.CSRF_COOKIE_NAME, response.cookies)
+        self.assertIn(b'name="csrfmiddlewaretoken"', page)
+
+
+@override_settings(**TEST_SETTINGS, REQUEST_METRICS_SERVER_TIMING=True)
+class RequestMetricsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        reset_metrics()
+        create_portfolio(rows=3)
+
+    def timing(self, response):
+        return dict(re.match(r'([^;]+)(.*)', entry).groups() for entry in response['Server-Timing'].split(', '))
+
+    def test_server_timing_reports_queries_partials_and_cache_status(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse('blog:index'))
+        timing = self.timing(response)
+        self.assertIn(f'desc="{len(ctx.captured_queries)} sorgu"', timing['db'])
+        self.assertIn('tpl-sections-projects.html', timing)
+        self.assertIn('tpl-partials-certificate_card.html', timing)
+        self.assertEqual(timing['cache'], ';desc=miss')
+
+        timing = self.timing(self.client.get(reverse('blog:index')))
+        self.assertEqual(timing['db'].split(';desc=')[1], '"0 sorgu"')
+        self.assertEqual(timing['cache'], ';desc=hit')
+
+    def test_streamed_homepage_is_recorded_when_the_stream_ends(self):
+        with override_settings(HOMEPAGE_STREAMING=True):
+            response = self.client.get(reverse('blog:index'))
+            self.assertNotIn('blog:index', render_metrics())
+            with CaptureQueriesContext(connection) as ctx:
+                size = len(b''.join(response.streaming_content))
+        output = render_metrics()
+        self.assertIn(f'blog_response_size_bytes_sum{{view="blog:index"}} {size}', output)
+        self.assertIn('blog_template_render_seconds_count{view="blog:index",template="sections/skills.html"} 1', output)
+        queries = re.search(r'blog_request_db_queries_sum\{view="blog:index"\} (\d+)', output)
+        self.assertGreaterEqual(int(queries.group(1)), len(ctx.captured_queries))
+
+    async def test_async_views_are_measured_without_leaving_the_event_loop(self):
+        async def view(request):
+            return HttpResponse()
+        for middleware_class in (RequestMetricsMiddleware, PrimaryDatabaseMiddleware):
+            self.assertTrue(iscoroutinefunction(middleware_class(view)), middleware_class)
+
+        project = await Project.objects.afirst()
+        with url_variant(async_views=True):
+            response = await self.async_client.get(reverse('blog:project_detail', args=[project.slug]))
+        self.assertEqual(response.status_code, 200)
+        timing = self.timing(response)
+        self.assertNotEqual(timing['db'].split(';desc=')[1], '"0 sorgu"')
+        self.assertEqual(timing['cache'], ';desc=miss')
+
+    def test_server_timing_is_only_shown_to_staff_unless_enabled(self):
+        url = reverse('blog:api_list', args=['projects'])
+        with override_settings(REQUEST_METRICS_SERVER_TIMING=False):
+            self.assertNotIn('Server-Timing', self.client.get(url))
+            self.client.force_login(User.objects.create_user('editor', is_staff=True))
+            self.assertIn('db', self.timing(self.client.get(url)))
+        self.assertIn('blog_requests_total{view="blog:api_list",cache="miss",status="200"} 1', render_metrics())
+
+    async def test_async_server_timing_checks_staff_without_blocking(self):
+        with override_settings(REQUEST_METRICS_SERVER_TIMING=False), url_variant(async_views=True):
+            url = reverse('blog:project_detail', args=[(await Project.objects.afirst()).slug])
+            self.assertNotIn('Server-Timing', await self.async_client.get(url))
+            await self.async_client.aforce_login(await User.objects.acreate(username='editor', is_staff=True))
+            self.assertIn('Server-Timing', await self.async_client.get(url))
+
+    def test_metrics_endpoint_is_admin_only_prometheus_text(self):
+        self.client.get(reverse('blog:index'))
+        for _ in range(3):
+            self.client.get(reverse('blog:api_list', args=['projects']))
+        self.assertEqual(self.client.get(reverse('blog:metrics')).status_code, 302)
+
+        self.client.force_login(User.objects.create_user('admin', is_staff=True))
+        response = self.client.get(reverse('blog:metrics'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        output = response.content.decode()
+        self.assertIn('# TYPE blog_request_duration_seconds summary', output)
+        self.assertIn('blog_requests_total{view="blog:api_list",cache="miss",status="200"} 1', output)
+        self.assertIn('blog_requests_total{view="blog:api_list",cache="hit",status="200"} 2', output)
+        for quantile in ('0.5', '0.95', '0.99'):
+            self.assertIn(f'blog_request_db_queries{{view="blog:api_list",quantile="{quantile}"}}', output)
+        self.assertIn('blog_fragment_cache_total{template=', output)
+
+
+@override_settings(**TEST_SETTINGS)
+class RouteBenchmarkTests(TestCase):
+    def measure_routes(self, rows):
+        seed_dataset(rows)
+        paths, missing = route_paths()
+        self.assertEqual(missing, [])
+        return {name: measure_route(self.client, path, iterations=1) for name, path in paths.items() if path}
+
+    def test_query_counts_do_not_grow_with_rows(self):
+        with transaction.atomic():
+            small = self.measure_routes(rows=7)
+            transaction.set_rollback(True)
+        large = self.measure_routes(rows=21)
+        self.assertEqual(set(small), set(large))
+        for name, route in large.items():
+            self.assertLess(route['status'], 400, name)
+            self.assertEqual(route['cold_queries'], small[name]['cold_queries'], name)
+            self.assertEqual(route['warm_queries'], small[name]['warm_queries'], name)
+
+    def test_baseline_comparison(self):
+        route = {'path': '/', 'status': 200, 'cold_queries': 10, 'warm_queries': 0, 'cold_min_ms': 20.0, 'warm_min_ms': 1.0, 'peak_kib': 200.0}
+        baseline = baseline_entry({'rows': 10, 'iterations': 1, 'python': '3', 'django': '5', 'routes': {'index': route}})
+        self.assertEqual(baseline['routes']['index']['informational'], {'cold_min_ms': 20.0, 'warm_min_ms': 1.0, 'peak_kib': 200.0})
+        self.assertEqual(compare_results({'routes': {'index': dict(route, warm_min_ms=1.8, peak_kib=250.0)}}, baseline, 0.5), ([], []))
+        self.assertEqual(compare_results({'routes': {'new': route}}, baseline, 0.5), ([], []))
+        # Süre yalnızca uyarıdır; yalnızca sorgu artışı gerilemedir.
+        self.assertEqual(
+            compare_results({'routes': {'index': dict(route, cold_min_ms=40.0)}}, baseline, 0.5),
+            ([], ['index: cold_min_ms 20.0 -> 40.0']),
+        )
+        regressions, _ = compare_results({'routes': {'index': dict(route, cold_queries=11)}}, baseline, 0.5)
+        self.assertEqual(regressions, ['index: cold_queries 10 -> 11'])
@@ -0,0 +1,298 @@
+import csv
+import json
+
+from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from .caching import bump_content_generation, bump_model_stamp
+from .search import rebuild_index
+from .signals import INTERNAL_MODELS
+
+DEFAULT_BATCH_SIZE = 500
+
+
+class TransferError(Exception):
+    pass
+
+
+def content_models():
+    # İlişkilerin hedefi (FK ve m2m) her zaman kendisine bağlı modelden önce
+    # gelir; içe aktarma sırasında anahtar eşlemesi hazır olur.
+    models = [model for model in apps.get_app_config('blog').get_models() if model not in INTERNAL_MODELS]
+    ordered = []
+
+    def visit(model):
+        if model in ordered:
+            return
+        for field in model._meta.get_fields():
+            if field.concrete and field.is_relation and field.related_model in models and field.related_model is not model:
+                visit(field.related_model)
+        ordered.append(model)
+
+    for model in models:
+        visit(model)
+    return ordered
+
+
+def get_model(name):
+    for model in content_models():
+        if model._meta.model_name == name.lower():
+            return model
+    raise TransferError(f"Bilinmeyen model: {name}")
+
+
+def natural_key(model):
+    # Kayıtlar veritabanları arasında id yerine benzersiz ad ya da slug ile
+    # eşleştirilir (Tag -> name, kategoriler -> slug). Benzersiz olmayan bir
+    # ad farklı kayıtları birleştireceğinden (ör. SkillCategory) id kullanılır.
+    fields = {field.name: field for field in model._meta.concrete_fields}
+    for name in ('name', 'slug'):
+        if name in fields and fields[name].unique:
+            return name
+    return 'id'
+
+
+def _columns(model):
+    key = natural_key(model)
+    columns = {}
+    for field in model._meta.concrete_fields:
+        if field.primary_key and key != 'id':
+            continue
+        if field.is_relation:
+            columns[field.name] = f'{field.name}__{natural_key(field.related_model)}'
+        else:
+            columns[field.name] = field.attname
+    return columns
+
+
+def _m2m_rows(field, ids):
+    through = field.remote_field.through
+    source = field.m2m_field_name()
+    target = field.m2m_reverse_field_name()
+    target_key = natural_key(field.related_model)
+    values = {}
+    rows = through.objects.filter(**{f'{source}__in': ids}).values_list(f'{source}_id', f'{target}__{target_key}').order_by(f'{target}__{target_key}')
+    for object_id, value in rows:
+        values.setdefault(object_id, []).append(value)
+    return values
+
+
+def export_records(model, batch_size=DEFAULT_BATCH_SIZE):
+    # id üzerinden parça parça okunur; m2m değerleri her parça için tek
+    # sorguyla eklenir. Bellekte en fazla bir parça tutulur.
+    columns = _columns(model)
+    names, paths = list(columns), list(columns.values())
+    m2m_fields = list(model._meta.many_to_many)
+    last = 0
+    while True:
+        rows = list(model._default_manager.filter(pk__gt=last).order_by('pk').values_list('pk', *paths)[:batch_size])
+        if not rows:
+            return
+        ids = [row[0] for row in rows]
+        related = {field.name: _m2m_rows(field, ids) for field in m2m_fields}
+        for row in rows:
+            record = dict(zip(names, row[1:]))
+            for field in m2m_fields:
+                record[field.name] = related[field.name].get(row[0], [])
+            yield record
+        last = ids[-1]
+
+
+def export_jsonl(stream, models=None, batch_size=DEFAULT_BATCH_SIZE):
+    count = 0
+    for model in models or content_models():
+        for record in export_records(model, batch_size):
+            stream.write(json.dumps({'model': model._meta.model_name, 'fields': record}, cls=DjangoJSONEncoder, ensure_ascii=False))
+            stream.write('\n')
+            count += 1
+    return count
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, list):
+        return json.dumps(value, ensure_ascii=False)
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+def export_csv(stream, model, batch_size=DEFAULT_BATCH_SIZE):
+    fieldnames = list(_columns(model)) + [field.name for field in model._meta.many_to_many]
+    writer = csv.DictWriter(stream, fieldnames=fieldnames)
+    writer.writeheader()
+    count = 0
+    for record in export_records(model, batch_size):
+        writer.writerow({name: _csv_value(value) for name, value in record.items()})
+        count += 1
+    return count
+
+
+def read_jsonl(stream):
+    models = {model._meta.model_name: model for model in content_models()}
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+            model = models.get(data['model'])
+            if model is None:
+                raise TransferError(f"Bilinmeyen model: {data['model']}")
+            yield model, data['fields']
+        except (ValueError, KeyError, TypeError) as exc:
+            raise TransferError(f"{number}. satır okunamadı: {exc}")
+
+
+def read_csv(stream, model):
+    # CSV'de her değer metindir: boş hücre null kabul edilir, m2m hücreleri
+    # JSON listesidir.
+    m2m_names = {field.name for field in model._meta.many_to_many}
+    for row in csv.DictReader(stream):
+        record = {}
+        for name, value in row.items():
+            if name in m2m_names:
+                record[name] = json.loads(value) if value else []
+            else:
+                record[name] = None if value == '' else value
+        yield model, record
+
+
+class Importer:
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.keys = {}
+        self.seen = {}
+        self.counts = {}
+
+    def key_map(self, model):
+        # Ad/slug -> id eşlemesi model başına tek sorguyla kurulur ve
+        # oluşturulan kayıtlarla güncel tutulur.
+        if model not in self.keys:
+            key = natural_key(model)
+            self.keys[model] = {str(value): pk for value, pk in model._default_manager.values_list(key, 'pk')}
+        return self.keys[model]
+
+    def resolve(self, model, value):
+        if value is None or value == '':
+            return None
+        try:
+            return self.key_map(model)[str(value)]
+        except KeyError:
+            raise TransferError(f"{model._meta.verbose_name} bulunamadı: {value}")
+
+    def convert(self, model, record):
+        values, m2m = {}, {}
+        for name, value in record.items():
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                raise TransferError(f"{model._meta.model_name}: bilinmeyen alan {name}")
+            if field.many_to_many:
+                m2m[field] = [self.resolve(field.related_model, item) for item in value or []]
+            elif field.is_relation:
+                values[field.attname] = self.resolve(field.related_model, value)
+            elif value is None and not field.null:
+                continue
+            else:
+                try:
+                    values[field.attname] = field.to_python(value)
+                except ValidationError as exc:
+                    raise TransferError(f"{model._meta.model_name}.{name}: {' '.join(exc.messages)}")
+        return values, m2m
+
+    def load(self, model, records):
+        key = natural_key(model)
+        key_map = self.key_map(model)
+        seen = self.seen.setdefault(model, set())
+        auto_now = [field.attname for field in model._meta.concrete_fields if getattr(field, 'auto_now', False)]
+        now = timezone.now()
+        created, updated, relations = [], {}, []
+        for record in records:
+            values, m2m = self.convert(model, record)
+            if key != 'id':
+                values.pop('id', None)
+            existing = None
+            if values.get(key) is not None:
+                # Aynı anahtar iki kez gelirse ikinci kayıt ilkinin üzerine
+                # yazılır ya da benzersizlik hatası oluşur; içe aktarma durdurulur.
+                if str(values[key]) in seen:
+                    raise TransferError(f"{model._meta.model_name}: {key} değeri birden fazla kayıtta kullanılmış: {values[key]}")
+                seen.add(str(values[key]))
+                existing = key_map.get(str(values[key]))
+            obj = model(**values)
+            if existing:
+                obj.pk = existing
+                for name in auto_now:
+                    setattr(obj, name, now)
+                # Yalnızca kayıtta bulunan alanlar güncellenir.
+                fields = tuple(sorted({model._meta.get_field(name).name for name in values if name != 'id'} | set(auto_now)))
+                updated.setdefault(fields, []).append(obj)
+            else:
+                created.append(obj)
+            relations.append((obj, m2m))
+
+        if hasattr(model, 'assign_slugs'):
+            model.assign_slugs(created)
+        model._default_manager.bulk_create(created, batch_size=self.batch_size)
+        if created and created[0].pk is None:
+            # Eklenen id'leri döndürmeyen veritabanları için.
+            pks = dict(model._default_manager.filter(**{f'{key}__in': [getattr(obj, key) for obj in created]}).values_list(key, 'pk'))
+            for obj in created:
+                obj.pk = pks[getattr(obj, key)]
+        for obj in created:
+            key_map[str(getattr(obj, key))] = obj.pk
+        for fields, objects in updated.items():
+            model._default_manager.bulk_update(objects, fields, batch_size=self.batch_size)
+        self.set_relations(relations)
+        self.counts[model] = self.counts.get(model, 0) + len(records)
+
+    def set_relations(self, relations):
+        # Ara tablo satırları tek seferde silinip yeniden yazılır; kayıt başına
+        # add()/set() sorgusu yapılmaz.
+        by_field = {}
+        for obj, m2m in relations:
+            for field, targets in m2m.items():
+                by_field.setdefault(field, []).append((obj.pk, targets))
+        for field, items in by_field.items():
+            through = field.remote_field.through
+            source = f'{field.m2m_field_name()}_id'
+            target = f'{field.m2m_reverse_field_name()}_id'
+            through.objects.filter(**{f'{source}__in': [pk for pk, _ in items]}).delete()
+            through.objects.bulk_create(
+                [through(**{source: pk, target: target_pk}) for pk, targets in items for target_pk in dict.fromkeys(targets)],
+                batch_size=self.batch_size, ignore_conflicts=True,
+            )
+
+    def run(self, records):
+        # Aynı modele ait ardışık kayıtlar batch_size'lık gruplar halinde yazılır.
+        batch, current = [], None
+        for model, record in records:
+            if batch and (model is not current or len(batch) >= self.batch_size):
+                self.load(current, batch)
+                batch = []
+            current = model
+            batch.append(record)
+        if batch:
+            self.load(current, batch)
+        return self.counts
+
+
+def import_records(records, batch_size=DEFAULT_BATCH_SIZE, reindex=True):
+    # Toplu yazma sinyal tetiklemediği için önbellek damgaları ve arama
+    # indeksi sonunda bir kez güncellenir.
+    importer = Importer(batch_size)
+    with transaction.atomic():
+        counts = importer.run(records)
+    if counts:
+        bump_content_generation()
+        names = {model.__name__ for model in counts}
+        for model in counts:
+            names.update(field.related_model.__name__ for field in model._meta.many_to_many)
+        bump_model_stamp(*names)
+        if reindex:
+            rebuild_index()
+    return counts
@@ -1,18 +1,37 @@
+from django.conf import settings
 from django.urls import path
-from . import views
-from .views import project_detail, codeexample_detail, skill_detail
+from . import api, async_views, views
 
 app_name = 'blog'
 
+# ASGI sunucusunda okuma ağırlıklı sayfalar async sürümleriyle sunulur.
+# WSGI'de async bir view her istekte ayrı bir olay döngüsüne sarılacağı
+# için senkron sürümler kalır.
+pages = async_views if settings.ASYNC_VIEWS else views
+api_views = async_views if settings.ASYNC_VIEWS else api
+
 urlpatterns = [
-    path('', views.index, name='index'),
+    path('', pages.index, name='index'),
     path('hakkimda/', views.about, name='about'),
     path('yetenekler/', views.skills, name='skills'),
     path('projeler/', views.projects, name='projects'),
-    path('blog/<slug:slug>/', views.blog_detail, name='blog_detail'),
-    path('projeler/<slug:slug>/', project_detail, name='project_detail'),
-    path('kod/<slug:slug>/', codeexample_detail, name='codeexample_detail'),
+    path('blog/', views.blog_list, name='blog_list'),
+    path('blog/alt-kategoriler/', pages.get_subcategories, name='subcategories'),
+    path('blog/kategori/<slug:slug>/', views.blog_category, name='blog_category'),
+    path('blog/alt-kategori/<slug:slug>/', views.blog_subcategory, name='blog_subcategory'),
+    path('blog/etiket/<slug:slug>/', views.blog_tag, name='blog_tag'),
+    path('blog/arsiv/<int:year>/<int:month>/', views.blog_month, name='blog_month'),
+    path('blog/<slug:slug>/', pages.blog_detail, name='blog_detail'),
+    path('projeler/<slug:slug>/', pages.project_detail, name='project_detail'),
+    path('kod/<slug:slug>/', pages.codeexample_detail, name='codeexample_detail'),
     path('iletisim/', views.contact, name='contact'),
-    path('yetenek/<slug:slug>/', skill_detail, name='skill_detail'),
-    path('sertifika/<slug:slug>/', views.certificate_detail, name='certificate_detail'),
+    path('yetenek/<slug:slug>/', pages.skill_detail, name='skill_detail'),
+    path('sertifika/<slug:slug>/', pages.certificate_detail, name='certificate_detail'),
+    path('ara/', views.search, name='search'),
+    path('_fragments/code/<slug:language>/<slug:category>/', views.code_fragment, name='code_fragment'),
+    path('_fragments/certificates/<slug:cursor>/', views.certificates_fragment, name='certificates_fragment'),
+    path('_metrics/', views.metrics, name='metrics'),
+    path('api/v1/', api_views.api_index, name='api_index'),
+    path('api/v1/<slug:resource_name>/', api_views.api_list, name='api_list'),
+    path('api/v1/<slug:resource_name>/<slug:slug>/', api_views.api_detail, name='api_detail'),
 ]
@@ -1,29 +1,20 @@
+from datetime import datetime
+
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
 from django.shortcuts import render, get_object_or_404
-from django.http import JsonResponse
-from .models import BlogPost, Category, SubCategory, Education, Experience, Certificate, Project, Tag, CodeExample, About, SiteSettings, ContactInfo, SkillCategory, Skill, ProjectCategory, CodeLanguage, CodeCategory, NavbarLink
-
-def home(request):
-    categories = Category.objects.all()
-    selected_category = request.GET.get('category')
-    selected_subcategory = request.GET.get('subcategory')
-    
-    blog_yazilari = BlogPost.objects.all()
-    
-    if selected_category:
-        blog_yazilari = blog_yazilari.filter(category__name=selected_category)
-        if selected_subcategory:
-            blog_yazilari = blog_yazilari.filter(subcategory__name=selected_subcategory)
-    
-    context = {
-        'blog_yazilari': blog_yazilari.order_by('-tarih'),
-        'categories': categories,
-        'selected_category': selected_category,
-        'selected_subcategory': selected_subcategory,
-        'navbar_links': NavbarLink.objects.filter(is_active=True).order_by('order'),
-        'site_settings': SiteSettings.objects.first(),
-    }
-    
-    return render(request, 'index.html', context)
+from django.http import Http404, HttpResponse, JsonResponse
+from django.utils import timezone
+from django.utils.formats import date_format
+from .caching import cache_content_page, get_site_chrome
+from .contact import client_ip, store_message, take_token
+from .forms import ContactForm
+from .loaders import certificate_page, homepage_querysets, load_homepage, tag_cloud
+from .metrics import render_metrics
+from .pagination import keyset_page
+from .search import search_documents
+from .streaming import stream_homepage
+from .models import BlogPost, Category, SubCategory, Certificate, Project, Tag, CodeExample, About, Skill
 
 def get_subcategories(request):
     category_name = request.GET.get('category')
@@ -40,23 +31,11 @@ def detail(request, slug):
     yazi = BlogPost.objects.get(slug=slug)
     return render(request, 'detail.html', {'yazi': yazi})
 
+@cache_content_page
 def index(request):
-    context = {
-        'about': About.objects.first(),
-        'educations': Education.objects.all(),
-        'experiences': Experience.objects.all(),
-        'certificates': Certificate.objects.all(),
-        'projects': Project.objects.all(),
-        'project_categories': ProjectCategory.objects.all(),
-        'code_examples': CodeExample.objects.all(),
-        'code_languages': CodeLanguage.objects.all(),
-        'code_categories': CodeCategory.objects.all(),
-        'tags': Tag.objects.all(),
-        'site_settings': SiteSettings.objects.first(),
-        'contact_infos': ContactInfo.objects.all(),
-        'skill_categories': SkillCategory.objects.prefetch_related('skills').all(),
-        'navbar_links': NavbarLink.objects.filter(is_active=True).order_by('order'),
-    }
+    context = load_homepage()
+    if settings.HOMEPAGE_STREAMING:
+        return stream_homepage(request, context)
     return render(request, 'index.html', context)
 
 def about(request):
@@ -69,72 +48,140 @@ def about(request):
 def skills(request):
     return render(request, 'sections/skills.html')
 
+@cache_content_page
 def projects(request):
-    projects = Project.objects.all()
+    # Ana sayfadaki projeler bölümüyle aynı sorgu: kategori ve etiketler
+    # proje başına ayrı sorgu yapılmadan gelir.
+    projects = homepage_querysets()['projects']
     context = {
         'projects': projects
     }
     return render(request, 'sections/projects.html', context)
 
 def contact(request):
-    if request.method == 'POST':
-        name = request.POST.get('name')
-        email = request.POST.get('email')
-        subject = request.POST.get('subject')
-        message = request.POST.get('message')
-        
-        # Burada e-posta gönderme işlemi yapılabilir
-        # Örnek: send_mail(subject, message, email, ['your@email.com'])
-        
-        return JsonResponse({
-            'status': 'success',
-            'message': 'Mesajınız başarıyla gönderildi.'
-        })
-    
+    if request.method != 'POST':
+        return JsonResponse({'status': 'error', 'message': 'Geçersiz istek.'}, status=400)
+
+    form = ContactForm(request.POST)
+    if not form.is_valid():
+        return JsonResponse({'status': 'error', 'message': 'Lütfen formu kontrol edin.', 'errors': form.errors}, status=400)
+    ip = client_ip(request)
+    if not take_token(ip):
+        return JsonResponse({'status': 'error', 'message': 'Çok fazla mesaj gönderdiniz, lütfen biraz sonra tekrar deneyin.'}, status=429)
+
+    # E-posta arka planda gönderilir; yanıt kayıttan hemen sonra döner.
+    store_message(form, ip)
     return JsonResponse({
-        'status': 'error',
-        'message': 'Geçersiz istek.'
-    }, status=400)
+        'status': 'success',
+        'message': 'Mesajınız başarıyla gönderildi.'
+    }, status=202)
+
+def published_posts():
+    return (
+        BlogPost.objects.filter(is_published=True, published_at__isnull=False)
+        .select_related('category', 'subcategory').prefetch_related('tags')
+    )
+
+def render_post_list(request, posts, heading, archive=None):
+    page = keyset_page(posts, 'published_at', after=request.GET.get('after'), before=request.GET.get('before'))
+    context = {
+        'posts': page['items'],
+        'page': page,
+        'heading': heading,
+        'archive': archive,
+        'categories': Category.objects.filter(posts__is_published=True).distinct(),
+        'tag_cloud': tag_cloud(),
+    }
+    return render(request, 'blog/list.html', context)
+
+@cache_content_page
+def blog_list(request):
+    return render_post_list(request, published_posts(), "Blog")
+
+@cache_content_page
+def blog_category(request, slug):
+    category = get_object_or_404(Category, slug=slug)
+    return render_post_list(request, published_posts().filter(category=category), category.name, category)
+
+@cache_content_page
+def blog_subcategory(request, slug):
+    subcategory = get_object_or_404(SubCategory.objects.select_related('category'), slug=slug)
+    return render_post_list(request, published_posts().filter(subcategory=subcategory), str(subcategory), subcategory)
+
+@cache_content_page
+def blog_tag(request, slug):
+    tag = get_object_or_404(Tag, slug=slug)
+    return render_post_list(request, published_posts().filter(tags=tag), f"#{tag.name}", tag)
+
+@cache_content_page
+def blog_month(request, year, month):
+    try:
+        start = timezone.make_aware(datetime(year, month, 1))
+        end = timezone.make_aware(datetime(year + month // 12, month % 12 + 1, 1))
+    except ValueError:
+        raise Http404
+    posts = published_posts().filter(published_at__gte=start, published_at__lt=end)
+    return render_post_list(request, posts, date_format(start, 'F Y'))
 
+@cache_content_page
 def blog_detail(request, slug):
-    post = get_object_or_404(BlogPost, slug=slug)
+    post = get_object_or_404(BlogPost.objects.select_related('category', 'subcategory'), slug=slug, is_published=True)
     context = {
         'post': post
     }
     return render(request, 'blog/detail.html', context)
 
+@cache_content_page
 def project_detail(request, slug):
     project = get_object_or_404(Project, slug=slug)
     return render(request, 'project_detail.html', {'project': project})
 
+@cache_content_page
 def codeexample_detail(request, slug):
     codeexample = get_object_or_404(CodeExample, slug=slug)
     return render(request, 'codeexample_detail.html', {'codeexample': codeexample})
 
 def site_settings(request):
-    settings = SiteSettings.objects.first()
-    navbar_links = NavbarLink.objects.filter(is_active=True).order_by('order')
-    return {
-        'site_settings': settings,
-        'navbar_links': navbar_links
-    }
+    return get_site_chrome()
 
+@cache_content_page
 def skill_detail(request, slug):
     skill = get_object_or_404(Skill, slug=slug)
-    return render(request, 'skills/skill_detail.html', {'skill': skill, 'site_settings': SiteSettings.objects.first()})
+    return render(request, 'skills/skill_detail.html', {'skill': skill})
 
+@cache_content_page
 def certificate_detail(request, slug):
     certificate = get_object_or_404(Certificate, slug=slug)
     return render(request, 'certificates/certificate_detail.html', {
         'certificate': certificate,
-        'site_settings': SiteSettings.objects.first()
     })
 
+@cache_content_page
 def certificates(request):
-    certificates = Certificate.objects.all().order_by('-date')
     context = {
-        'certificates': certificates,
-        'site_settings': SiteSettings.objects.first(),
-        'navbar_links': NavbarLink.objects.filter(is_active=True).order_by('order'),
+        'certificate_page': certificate_page(),
     }
     return render(request, 'sections/certificates.html', context)
+
+@cache_content_page
+def certificates_fragment(request, cursor):
+    return render(request, 'fragments/certificates.html', {'page': certificate_page(after=cursor)})
+
+@cache_content_page
+def code_fragment(request, language, category):
+    examples = list(
+        CodeExample.objects.filter(language__slug=language, category__slug=category)
+        .only('id', 'title', 'slug', 'code').order_by('-created_at')
+    )
+    if not examples:
+        raise Http404
+    return render(request, 'fragments/code_examples.html', {'examples': examples, 'language': language})
+
+def search(request):
+    query = request.GET.get('q', '').strip()[:100]
+    results = search_documents(query) if query else []
+    return render(request, 'search/results.html', {'query': query, 'results': results})
+
+@staff_member_required
+def metrics(request):
+    return HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
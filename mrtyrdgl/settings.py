@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -41,6 +42,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'blog.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -48,13 +50,34 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'blog.middleware.PrimaryDatabaseMiddleware',
 ]
 
 ROOT_URLCONF = 'mrtyrdgl.urls'
 
+# asgi.py bu değişkeni açar; ana sayfa, detay sayfaları ve JSON API async
+# view'larla sunulur (bkz. blog.async_views). WSGI'de senkron view'lar kalır.
+ASYNC_VIEWS = os.environ.get('DJANGO_ASYNC_VIEWS') == '1'
+
+# Ana sayfa önbellekte yoksa parça parça gönderilir: önce <head> ve navbar,
+# ardından bölümler işlendikçe (bkz. blog.streaming).
+HOMEPAGE_STREAMING = True
+
+# İstek ölçümü: Server-Timing başlıkları ve /_metrics/ (yalnızca admin)
+# adresindeki Prometheus metrikleri. Yüzdelikler view başına son
+# REQUEST_METRICS_WINDOW istekten hesaplanır.
+REQUEST_METRICS = True
+REQUEST_METRICS_WINDOW = 1000
+# Server-Timing başlığı sorgu sayısını ve şablon adlarını gösterir; kapalıyken
+# yalnızca DEBUG'da ve personel kullanıcılara eklenir. Metrikler her durumda
+# kaydedilir.
+REQUEST_METRICS_SERVER_TIMING = False
+
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates ile aynı; şablon parçalarının süresi de ölçülür.
+        'BACKEND': 'blog.metrics.InstrumentedTemplates',
+        'NAME': 'django',
         'DIRS': [BASE_DIR / 'templates'],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -75,11 +98,64 @@ WSGI_APPLICATION = 'mrtyrdgl.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# WAL kipinde okuyucular yazarı, yazar okuyucuları beklemez. synchronous=NORMAL
+# WAL'da güvenlidir (en kötü durumda son commit kaybolur, dosya bozulmaz).
+# Yazma transaction'ları IMMEDIATE başlar: okumadan yazmaya geçerken
+# "database is locked" yerine busy_timeout kadar beklenir.
+SQLITE_FILE = BASE_DIR / 'db.sqlite3'
+SQLITE_PRAGMAS = (
+    'PRAGMA busy_timeout=5000;'
+    'PRAGMA cache_size=-20000;'
+    'PRAGMA mmap_size=134217728;'
+    'PRAGMA temp_store=MEMORY;'
+)
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+        'NAME': SQLITE_FILE,
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'init_command': 'PRAGMA journal_mode=WAL;PRAGMA synchronous=NORMAL;' + SQLITE_PRAGMAS,
+            'transaction_mode': 'IMMEDIATE',
+        },
+    },
+    # Ziyaretçi okumaları (bkz. blog.routers). Varsayılan olarak aynı dosya
+    # salt-okunur açılır; Litestream/LiteFS ile çoğaltılmış bir kopya varsa
+    # NAME o dosyayı göstermelidir.
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': f'file:{SQLITE_FILE}?mode=ro',
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'uri': True,
+            'init_command': 'PRAGMA query_only=ON;' + SQLITE_PRAGMAS,
+        },
+        'TEST': {'MIRROR': 'default'},
+    },
+}
+DATABASE_ROUTERS = ['blog.routers.PrimaryReplicaRouter']
+
+# Cache
+# Dosya tabanlı önbellek tüm worker süreçleri arasında paylaşılır. Sayfa,
+# bölüm ve API yanıtları 'default'ta; içerik sürümü ve model damgaları
+# (blog.caching) sayısı sınırlı olduğundan hiç temizlenmeyen 'stamps'te
+# tutulur.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.cache',
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
+    'stamps': {
+        # incr() dosya kilidiyle atomiktir; içerik sürümü sayacı için.
+        'BACKEND': 'blog.cache_backends.StampFileCache',
+        'LOCATION': BASE_DIR / '.cache' / 'stamps',
+        'TIMEOUT': None,
+    },
 }
 
 
@@ -128,11 +204,42 @@ STATICFILES_DIRS = [
 ]
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+# collectstatic: CSS küçültme, içerik özetli dosya adları ve .gz/.br kopyaları
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "blog.storage.CompressedManifestStaticFilesStorage",
+    },
+}
+
 # Media files
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Static/media dosyalarının uygulama tarafından sunulması (bkz. blog.serving).
+# nginx gibi X-Accel-Redirect destekli bir proxy varsa ilgili internal
+# location önekleri verilir; dosya gövdesi Python'dan geçmez.
+SERVE_FILES = True
+MEDIA_ACCEL_REDIRECT = None
+STATIC_ACCEL_REDIRECT = None
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# İletişim formu (bkz. blog.contact)
+# Mesajlar veritabanına yazılır ve arka planda tek SMTP bağlantısı üzerinden
+# toplu gönderilir. Geliştirmede yerel bir hata ayıklama sunucusu yeterlidir:
+#   python -m aiosmtpd -n -l localhost:1025
+EMAIL_HOST = 'localhost'
+EMAIL_PORT = 1025
+EMAIL_TIMEOUT = 10
+DEFAULT_FROM_EMAIL = 'webmaster@localhost'
+# Boşsa İletişim Bilgisi kayıtlarındaki e-posta adresleri kullanılır.
+CONTACT_RECIPIENTS = []
+CONTACT_RATE_CAPACITY = 3
+CONTACT_RATE_REFILL = 120
+CONTACT_MAIL_DELAY = 5
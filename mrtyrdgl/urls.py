@@ -1,9 +1,18 @@
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
-from django.conf.urls.static import static
+from blog.serving import serve_media, serve_static
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', include('blog.urls')),  # myapp'deki urls.py dahil edilir
-] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+]
+
+# Önde bir proxy yoksa static ve media dosyaları uygulama tarafından sunulur
+# (Range, koşullu istek, .br/.gz kopyaları). Proxy varsa SERVE_FILES=False
+# yapılabilir veya *_ACCEL_REDIRECT ayarlarıyla dosya nginx'e devredilir.
+if settings.SERVE_FILES:
+    urlpatterns += [
+        re_path(r'^%s(?P<path>.*)$' % settings.MEDIA_URL.lstrip('/'), serve_media),
+        re_path(r'^%s(?P<path>.*)$' % settings.STATIC_URL.lstrip('/'), serve_static),
+    ]
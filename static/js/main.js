@@ -81,7 +81,7 @@ document.addEventListener('DOMContentLoaded', function() {
     }
 
     // Form Gönderimi
-    const contactForm = document.querySelector('.contact-form');
+    const contactForm = document.getElementById('contactForm');
     if (contactForm) {
         contactForm.addEventListener('submit', async (e) => {
             e.preventDefault();
@@ -91,16 +91,18 @@ document.addEventListener('DOMContentLoaded', function() {
             submitBtn.disabled = true;
             try {
                 const formData = new FormData(contactForm);
-                const response = await fetch('contact.php', {
+                const response = await fetch(contactForm.action, {
                     method: 'POST',
-                    body: formData
+                    body: formData,
+                    headers: { 'X-Requested-With': 'XMLHttpRequest' }
                 });
                 const data = await response.json();
-                if (data.success) {
-                    showNotification('Mesajınız başarıyla gönderildi!', 'success');
+                if (data.status === 'success') {
+                    showNotification(data.message, 'success');
                     contactForm.reset();
                 } else {
-                    showNotification('Bir hata oluştu. Lütfen tekrar deneyin.', 'error');
+                    // 429: hız sınırı, 400: form hatası; sunucunun mesajı gösterilir.
+                    showNotification(data.message || 'Bir hata oluştu. Lütfen tekrar deneyin.', 'error');
                 }
             } catch (error) {
                 console.error('Error:', error);
@@ -196,27 +198,106 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     });
 
-    // Accordion işlevselliği
-    document.querySelectorAll('.accordion-header').forEach(header => {
-        header.addEventListener('click', () => {
-            const accordion = header.parentElement;
-            const isActive = accordion.classList.contains('active');
-            
-            // Diğer tüm açık accordion'ları kapat
-            document.querySelectorAll('.code-accordion').forEach(acc => {
-                acc.classList.remove('active');
-                const toggle = acc.querySelector('.accordion-toggle i');
-                toggle.className = 'fas fa-plus';
+    // Accordion işlevselliği (sonradan yüklenen kod örnekleri için olay delegasyonu)
+    document.addEventListener('click', (e) => {
+        const header = e.target.closest('.accordion-header');
+        if (!header) return;
+        const accordion = header.parentElement;
+        const isActive = accordion.classList.contains('active');
+
+        // Diğer tüm açık accordion'ları kapat
+        document.querySelectorAll('.code-accordion').forEach(acc => {
+            acc.classList.remove('active');
+            const toggle = acc.querySelector('.accordion-toggle i');
+            toggle.className = 'fas fa-plus';
+        });
+
+        // Tıklanan accordion'u aç/kapat
+        if (!isActive) {
+            accordion.classList.add('active');
+            const toggle = accordion.querySelector('.accordion-toggle i');
+            toggle.className = 'fas fa-plus';
+        }
+    });
+
+    // Ağır bölümlerin parça (fragment) olarak yüklenmesi. data-fragment
+    // adresi, öğe görünür olduğunda (gizli sekmeler açıldığında dahil) çekilir;
+    // data-fragment-mode="replace" ise öğe gelen içerikle değiştirilir.
+    const FRAGMENT_MAX_ATTEMPTS = 4;
+    const FRAGMENT_RETRY_DELAY = 1000;
+
+    function loadFragment(el) {
+        if (el.dataset.fragmentState) return;
+        el.dataset.fragmentState = 'loading';
+        fetch(el.dataset.fragment, { headers: { 'X-Requested-With': 'XMLHttpRequest' } })
+            .then(response => {
+                if (!response.ok) throw new Error(response.status);
+                return response.text();
+            })
+            .then(html => {
+                if (el.dataset.fragmentMode === 'replace') {
+                    const template = document.createElement('template');
+                    template.innerHTML = html.trim();
+                    const nodes = Array.from(template.content.children);
+                    el.replaceWith(template.content);
+                    nodes.forEach(observeFragments);
+                } else {
+                    el.innerHTML = html;
+                    el.dataset.fragmentState = 'loaded';
+                    observeFragments(el);
+                }
+            })
+            .catch(error => {
+                console.error('Fragment yüklenemedi:', error);
+                const attempts = Number(el.dataset.fragmentAttempts || 0) + 1;
+                el.dataset.fragmentAttempts = attempts;
+                // 4xx (408/429 dışında) tekrar denemekle düzelmez; diğer
+                // hatalarda artan aralıklarla en fazla FRAGMENT_MAX_ATTEMPTS kez denenir.
+                const status = Number(error.message);
+                const retryable = !(status >= 400 && status < 500) || status === 408 || status === 429;
+                if (retryable && attempts < FRAGMENT_MAX_ATTEMPTS) {
+                    el.dataset.fragmentState = 'waiting';
+                    setTimeout(() => {
+                        delete el.dataset.fragmentState;
+                        loadFragment(el);
+                    }, FRAGMENT_RETRY_DELAY * 2 ** (attempts - 1));
+                    return;
+                }
+                el.dataset.fragmentState = 'failed';
+                showFragmentRetry(el);
             });
+    }
+
+    // Denemeler bitince öğe yeniden gözlenmez; ziyaretçi isterse tekrar dener.
+    function showFragmentRetry(el) {
+        const button = document.createElement('button');
+        button.type = 'button';
+        button.className = 'fragment-retry';
+        button.textContent = 'İçerik yüklenemedi, tekrar dene';
+        button.addEventListener('click', () => {
+            button.remove();
+            delete el.dataset.fragmentState;
+            delete el.dataset.fragmentAttempts;
+            loadFragment(el);
+        });
+        el.after(button);
+    }
 
-            // Tıklanan accordion'u aç/kapat
-            if (!isActive) {
-                accordion.classList.add('active');
-                const toggle = accordion.querySelector('.accordion-toggle i');
-                toggle.className = 'fas fa-plus';
+    const fragmentObserver = 'IntersectionObserver' in window ? new IntersectionObserver(entries => {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) {
+                fragmentObserver.unobserve(entry.target);
+                loadFragment(entry.target);
             }
         });
-    });
+    }, { rootMargin: '300px 0px' }) : null;
+
+    function observeFragments(root) {
+        const elements = root.matches && root.matches('[data-fragment-load="visible"]') ? [root] : [];
+        elements.push(...root.querySelectorAll('[data-fragment-load="visible"]'));
+        elements.forEach(el => fragmentObserver ? fragmentObserver.observe(el) : loadFragment(el));
+    }
+    observeFragments(document);
 
     // Detayları Gör butonlarının yeni sekmede açılmasını engelle
     document.querySelectorAll('.btn-outline-primary').forEach(function(link) {